@@ -0,0 +1,251 @@
+-- This file is automatically @generated by terrain-tiles/analyze_brushes.py.
+-- It is not intended for manual editing.
+local BrushOctantTables = {
+	resolution = 16,
+	shapes = {
+		CornerWedge = {
+			cells = {
+				[3] = "b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o29b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o44b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o59b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o74b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o89b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o104b47ob14o2b13o3b12o4b11o5b10o6b9o119b47ob14o2b13o3b12o4b11o5b10o134b47ob14o2b13o3b12o4b11o149b47ob14o2b13o3b12o164b47ob14o2b13o179b47ob14o194b47o209b32o224",
+				[12] = "b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o29b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o44b47ob14o2b4i3b6o3b4i2b6o4b4ib6o5b10o6b9o7b8o8b7o9b6o10b5o59b47ob14o2b4i3b6o3b4i2b6o4b11o5b10o6b9o7b8o8b7o9b6o74b47ob14o2b4i3b6o3b12o4b11o5b10o6b9o7b8o8b7o89b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o104b47ob14o2b13o3b12o4b11o5b10o6b9o119b47ob14o2b13o3b12o4b11o5b10o134b47ob14o2b13o3b12o4b11o149b47ob14o2b13o3b12o164b47ob14o2b13o179b47ob14o194b47o209b32o224",
+				[16] = "b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o29b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o44b47ob14o2b4i4b5o3b4i3b5o4b4i2b5o5b4ib5o6b9o7b8o8b7o9b6o10b5o59b47ob14o2b4i4b5o3b4i3b5o4b4i2b5o5b10o6b9o7b8o8b7o9b6o74b47ob14o2b4i4b5o3b4i3b5o4b11o5b10o6b9o7b8o8b7o89b47ob14o2b4i4b5o3b12o4b11o5b10o6b9o7b8o104b47ob14o2b13o3b12o4b11o5b10o6b9o119b47ob14o2b13o3b12o4b11o5b10o134b47ob14o2b13o3b12o4b11o149b47ob14o2b13o3b12o164b47ob14o2b13o179b47ob14o194b47o209b32o224",
+				[24] = "b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o29b47ob3i6b5o2b3i5b5o3b3i4b5o4b3i3b5o5b3i2b5o6b3ib5o7b8o8b7o9b6o10b5o11b4o44b47ob3i6b5o2b3i5b5o3b3i4b5o4b3i3b5o5b3i2b5o6b9o7b8o8b7o9b6o10b5o59b47ob3i6b5o2b3i5b5o3b3i4b5o4b3i3b5o5b10o6b9o7b8o8b7o9b6o74b47ob3i6b5o2b3i5b5o3b3i4b5o4b11o5b10o6b9o7b8o8b7o89b47ob3i6b5o2b3i5b5o3b12o4b11o5b10o6b9o7b8o104b47ob3i6b5o2b13o3b12o4b11o5b10o6b9o119b47ob14o2b13o3b12o4b11o5b10o134b47ob14o2b13o3b12o4b11o149b47ob14o2b13o3b12o164b47ob14o2b13o179b47ob14o194b47o209b32o224",
+				[32] = "b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o29b47ob3i7b4o2b3i6b4o3b3i5b4o4b3i4b4o5b3i3b4o6b3i2b4o7b3ib4o8b7o9b6o10b5o11b4o44b47ob3i7b4o2b3i6b4o3b3i5b4o4b3i4b4o5b3i3b4o6b3i2b4o7b8o8b7o9b6o10b5o59b47ob3i7b4o2b3i6b4o3b3i5b4o4b3i4b4o5b3i3b4o6b9o7b8o8b7o9b6o74b47ob3i7b4o2b3i6b4o3b3i5b4o4b3i4b4o5b10o6b9o7b8o8b7o89b47ob3i7b4o2b3i6b4o3b3i5b4o4b11o5b10o6b9o7b8o104b47ob3i7b4o2b3i6b4o3b12o4b11o5b10o6b9o119b47ob3i7b4o2b13o3b12o4b11o5b10o134b47ob14o2b13o3b12o4b11o149b47ob14o2b13o3b12o164b47ob14o2b13o179b47ob14o194b47o209b32o224",
+				[48] = "b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b34i9b4ob2i8b4o2b2i7b4o3b2i6b4o4b2i5b4o5b2i4b4o6b2i3b4o7b2i2b4o8b2ib4o9b6o10b5o11b4o12b3o29b34i9b4ob2i8b4o2b2i7b4o3b2i6b4o4b2i5b4o5b2i4b4o6b2i3b4o7b2i2b4o8b7o9b6o10b5o11b4o44b34i9b4ob2i8b4o2b2i7b4o3b2i6b4o4b2i5b4o5b2i4b4o6b2i3b4o7b8o8b7o9b6o10b5o59b34i9b4ob2i8b4o2b2i7b4o3b2i6b4o4b2i5b4o5b2i4b4o6b9o7b8o8b7o9b6o74b34i9b4ob2i8b4o2b2i7b4o3b2i6b4o4b2i5b4o5b10o6b9o7b8o8b7o89b34i9b4ob2i8b4o2b2i7b4o3b2i6b4o4b11o5b10o6b9o7b8o104b34i9b4ob2i8b4o2b2i7b4o3b12o4b11o5b10o6b9o119b34i9b4ob2i8b4o2b13o3b12o4b11o5b10o134b34i9b4ob14o2b13o3b12o4b11o149b47ob14o2b13o3b12o164b47ob14o2b13o179b47ob14o194b47o209b32o224",
+			},
+			extent = 1.0,
+			sizes = {
+				3,
+				12,
+				16,
+				24,
+				32,
+				48,
+			},
+		},
+		Cube = {
+			cells = {
+				[3] = "b1638i4b12i4b12i4b12i4b204i4b12i4b12i4b12i4b204i4b12i4b12i4b12i4b204i4b12i4b12i4b12i4b1638",
+				[4] = "b1365i6b10i6b10i6b10i6b10i6b10i6b170i6b10i6b10i6b10i6b10i6b10i6b170i6b10i6b10i6b10i6b10i6b10i6b170i6b10i6b10i6b10i6b10i6b10i6b170i6b10i6b10i6b10i6b10i6b10i6b170i6b10i6b10i6b10i6b10i6b10i6b1365",
+				[6] = "b1092i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b136i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b136i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b136i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b136i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b136i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b136i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b136i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b1092",
+				[8] = "b819i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b102i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b102i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b102i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b102i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b102i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b102i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b102i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b102i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b102i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b819",
+				[12] = "b546i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b68i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b68i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b68i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b68i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b68i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b68i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b68i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b68i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b68i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b68i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b68i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b546",
+				[32] = "b273i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b273",
+			},
+			extent = 1.0,
+			sizes = {
+				3,
+				4,
+				6,
+				8,
+				12,
+				32,
+			},
+		},
+		Cylinder = {
+			cells = {
+				[3] = "o3b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o5b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o3b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14ob791i2b14i2b14i2b14i2b14i2b14i2b14i2b14i2b14i2b14i2b14i2b14i2b14i2b14i2b45i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b44i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b45i2b14i2b14i2b14i2b14i2b14i2b14i2b14i2b14i2b14i2b14i2b14i2b14i2b14i2b791ob14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o3b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o5b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o3",
+				[4] = "o3b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o5b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o3b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14ob534i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b43i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b42i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b42i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b42i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b43i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b534ob14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o3b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o5b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o3",
+				[6] = "o3b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o5b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o3b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14ob277i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b41i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b40i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b40i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b40i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b40i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b40i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b41i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b10i6b277ob14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o3b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o5b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o3",
+				[8] = "o3b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o5b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o3b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14ob22i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b42i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b40i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b39i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b38i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b38i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b38i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b39i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b40i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b42i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b12i4b22ob14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o2b14o3b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o5b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o3",
+				[12] = "o3b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o5b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o3b14o2b5i4b5o2b5i4b5o2b5i4b5o2b5i4b5o2b5i4b5o2b5i4b5o2b5i4b5o2b5i4b5o2b5i4b5o2b5i4b5o2b5i4b5o2b5i4b5o2b5i4b5o2b5i4b5o2b14ob20i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b39i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b38i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b37i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b36i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b36i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b36i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b37i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b38i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b39i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b20ob14o2b5i4b5o2b5i4b5o2b5i4b5o2b5i4b5o2b5i4b5o2b5i4b5o2b5i4b5o2b5i4b5o2b5i4b5o2b5i4b5o2b5i4b5o2b5i4b5o2b5i4b5o2b5i4b5o2b14o3b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o5b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o3",
+				[16] = "o3b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o5b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o3b14o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b14ob20i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b39i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b37i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b36i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b36i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b36i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b36i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b36i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b37i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b39i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b20ob14o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b14o3b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o5b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o3",
+				[24] = "o3b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o5b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o3b14o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b14ob19i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b38i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b37i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b36i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b36i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b36i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b36i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b36i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b37i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b38i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b19ob14o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o2b14o3b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o4b12o5b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o3",
+				[32] = "o3b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o5b12o4b5i2b5o4b5i2b5o4b5i2b5o4b5i2b5o4b5i2b5o4b5i2b5o4b5i2b5o4b5i2b5o4b5i2b5o4b5i2b5o4b5i2b5o4b5i2b5o4b5i2b5o4b5i2b5o4b12o3b14o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b14ob19i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b37i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b36i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b36i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b35i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b35i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b36i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b36i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b37i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b19ob14o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b14o3b12o4b5i2b5o4b5i2b5o4b5i2b5o4b5i2b5o4b5i2b5o4b5i2b5o4b5i2b5o4b5i2b5o4b5i2b5o4b5i2b5o4b5i2b5o4b5i2b5o4b5i2b5o4b5i2b5o4b12o5b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o3",
+				[48] = "o3b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o5b12o4b4i4b4o4b4i4b4o4b4i4b4o4b4i4b4o4b4i4b4o4b4i4b4o4b4i4b4o4b4i4b4o4b4i4b4o4b4i4b4o4b4i4b4o4b4i4b4o4b4i4b4o4b4i4b4o4b12o3b14o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b14ob19i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b37i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b36i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b35i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b35i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b36i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b37i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b19ob14o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o2b14o3b12o4b4i4b4o4b4i4b4o4b4i4b4o4b4i4b4o4b4i4b4o4b4i4b4o4b4i4b4o4b4i4b4o4b4i4b4o4b4i4b4o4b4i4b4o4b4i4b4o4b4i4b4o4b4i4b4o4b12o5b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o6b10o3",
+			},
+			extent = 1.0,
+			sizes = {
+				3,
+				4,
+				6,
+				8,
+				12,
+				16,
+				24,
+				32,
+				48,
+			},
+		},
+		Dome = {
+			cells = {
+				[3] = "o115b10o6b10o7b8o8b8o9b6o12b2o169b12o4b12o4b12o5b10o6b10o7b8o10b4o151b14o2b14o2b14o3b12o4b12o5b10o7b8o10b4o134b32ob14o2b14o2b14o3b12o5b10o7b8o11b2o119b64ob14o2b14o3b12o5b10o8b6o117b80ob14o3b12o5b10o7b8o116b80ob14o2b14o3b12o6b8o116b39i2b55ob14o3b12o5b10o115b39i2b55ob14o3b12o5b10o115b80ob14o2b14o3b12o6b8o116b80ob14o3b12o5b10o7b8o116b64ob14o2b14o3b12o5b10o8b6o117b32ob14o2b14o2b14o3b12o5b10o7b8o11b2o120b14o2b14o2b14o3b12o4b12o5b10o7b8o10b4o136b12o4b12o4b12o5b10o6b10o7b8o10b4o153b10o6b10o7b8o8b8o9b6o12b2o55",
+				[4] = "o115b10o6b10o7b8o8b8o9b6o12b2o169b12o4b12o4b12o5b10o6b10o7b8o10b4o151b14o2b14o2b14o3b12o4b12o5b10o7b8o10b4o134b32ob14o2b14o2b14o3b12o5b10o7b8o11b2o119b64ob14o2b14o3b12o5b10o8b6o117b39i2b39ob14o3b12o5b10o7b8o116b38i4b13i2b23ob14o2b14o3b12o6b8o116b37i6b11i4b38ob14o3b12o5b10o115b37i6b11i4b38ob14o3b12o5b10o115b38i4b13i2b23ob14o2b14o3b12o6b8o116b39i2b39ob14o3b12o5b10o7b8o116b64ob14o2b14o3b12o5b10o8b6o117b32ob14o2b14o2b14o3b12o5b10o7b8o11b2o120b14o2b14o2b14o3b12o4b12o5b10o7b8o10b4o136b12o4b12o4b12o5b10o6b10o7b8o10b4o153b10o6b10o7b8o8b8o9b6o12b2o55",
+				[6] = "o115b10o6b10o7b8o8b8o9b6o12b2o169b12o4b12o4b12o5b10o6b10o7b8o10b4o151b14o2b14o2b14o3b12o4b12o5b10o7b8o10b4o134b32ob14o2b14o2b14o3b12o5b10o7b8o11b2o119b38i4b13i2b7ob14o2b14o3b12o5b10o8b6o117b37i6b10i6b12i2b7ob14o3b12o5b10o7b8o116b36i8b9i6b11i4b6ob14o2b14o3b12o6b8o116b36i8b8i8b9i6b21ob14o3b12o5b10o115b36i8b8i8b9i6b21ob14o3b12o5b10o115b36i8b9i6b11i4b6ob14o2b14o3b12o6b8o116b37i6b10i6b12i2b7ob14o3b12o5b10o7b8o116b38i4b13i2b7ob14o2b14o3b12o5b10o8b6o117b32ob14o2b14o2b14o3b12o5b10o7b8o11b2o120b14o2b14o2b14o3b12o4b12o5b10o7b8o10b4o136b12o4b12o4b12o5b10o6b10o7b8o10b4o153b10o6b10o7b8o8b8o9b6o12b2o55",
+				[8] = "o115b10o6b10o7b8o8b8o9b6o12b2o169b12o4b12o4b12o5b10o6b10o7b8o10b4o151b14o2b14o2b14o3b12o4b12o5b10o7b8o10b4o134b32ob5i4b5o2b14o2b14o3b12o5b10o7b8o11b2o119b37i6b10i6b5ob6i2b6o2b14o3b12o5b10o8b6o117b36i8b8i8b9i6b5ob14o3b12o5b10o7b8o116b35i10b7i8b9i6b5ob5i4b5o2b14o3b12o6b8o116b35i10b7i8b8i8b10i4b6ob14o3b12o5b10o115b35i10b7i8b8i8b10i4b6ob14o3b12o5b10o115b35i10b7i8b9i6b5ob5i4b5o2b14o3b12o6b8o116b36i8b8i8b9i6b5ob14o3b12o5b10o7b8o116b37i6b10i6b5ob6i2b6o2b14o3b12o5b10o8b6o117b32ob5i4b5o2b14o2b14o3b12o5b10o7b8o11b2o120b14o2b14o2b14o3b12o4b12o5b10o7b8o10b4o136b12o4b12o4b12o5b10o6b10o7b8o10b4o153b10o6b10o7b8o8b8o9b6o12b2o55",
+				[12] = "o115b10o6b10o7b8o8b8o9b6o12b2o169b12o4b12o4b12o5b10o6b10o7b8o10b4o151b14o2b14o2b6i2b6o3b12o4b12o5b10o7b8o10b4o134b32ob4i6b4o2b4i6b4o2b6i2b6o3b12o5b10o7b8o11b2o119b36i8b8i8b4ob4i6b4o2b6i2b6o3b12o5b10o8b6o117b35i10b6i10b7i8b4ob4i6b4o3b12o5b10o7b8o116b35i10b6i10b7i8b4ob4i6b4o2b6i2b6o3b12o6b8o116b34i12b5i10b6i10b7i8b4ob5i4b5o3b12o5b10o115b34i12b5i10b6i10b7i8b4ob5i4b5o3b12o5b10o115b35i10b6i10b7i8b4ob4i6b4o2b6i2b6o3b12o6b8o116b35i10b6i10b7i8b4ob4i6b4o3b12o5b10o7b8o116b36i8b8i8b4ob4i6b4o2b6i2b6o3b12o5b10o8b6o117b32ob4i6b4o2b4i6b4o2b6i2b6o3b12o5b10o7b8o11b2o120b14o2b14o2b6i2b6o3b12o4b12o5b10o7b8o10b4o136b12o4b12o4b12o5b10o6b10o7b8o10b4o153b10o6b10o7b8o8b8o9b6o12b2o55",
+				[16] = "o115b10o6b10o7b8o8b8o9b6o12b2o169b12o4b12o4b12o5b10o6b10o7b8o10b4o151b14o2b14o2b5i4b5o3b5i2b5o4b12o5b10o7b8o10b4o134b32ob3i8b3o2b4i6b4o2b5i4b5o3b12o5b10o7b8o11b2o119b35i10b7i8b4ob3i8b3o2b5i4b5o3b12o5b10o8b6o117b35i10b6i10b7i8b4ob4i6b4o3b5i2b5o5b10o7b8o116b34i12b5i10b6i10b3ob3i8b3o2b5i4b5o3b12o6b8o116b34i12b4i12b5i10b7i8b4ob4i6b4o3b12o5b10o115b34i12b4i12b5i10b7i8b4ob4i6b4o3b12o5b10o115b34i12b5i10b6i10b3ob3i8b3o2b5i4b5o3b12o6b8o116b35i10b6i10b7i8b4ob4i6b4o3b5i2b5o5b10o7b8o116b35i10b7i8b4ob3i8b3o2b5i4b5o3b12o5b10o8b6o117b32ob3i8b3o2b4i6b4o2b5i4b5o3b12o5b10o7b8o11b2o120b14o2b14o2b5i4b5o3b5i2b5o4b12o5b10o7b8o10b4o136b12o4b12o4b12o5b10o6b10o7b8o10b4o153b10o6b10o7b8o8b8o9b6o12b2o55",
+				[24] = "o115b10o6b10o7b8o8b8o9b6o12b2o169b12o4b12o4b12o5b10o6b10o7b8o10b4o151b14o2b14o2b4i6b4o3b4i4b4o4b12o5b10o7b8o10b4o134b32ob3i8b3o2b3i8b3o2b4i6b4o3b5i2b5o5b10o7b8o11b2o119b35i10b6i10b3ob3i8b3o2b4i6b4o3b12o5b10o8b6o117b34i12b5i10b6i10b3ob3i8b3o3b4i4b4o5b10o7b8o116b34i12b4i12b5i10b3ob3i8b3o2b4i6b4o3b12o6b8o116b34i12b4i12b5i10b6i10b3ob4i6b4o3b12o5b10o115b34i12b4i12b5i10b6i10b3ob4i6b4o3b12o5b10o115b34i12b4i12b5i10b3ob3i8b3o2b4i6b4o3b12o6b8o116b34i12b5i10b6i10b3ob3i8b3o3b4i4b4o5b10o7b8o116b35i10b6i10b3ob3i8b3o2b4i6b4o3b12o5b10o8b6o117b32ob3i8b3o2b3i8b3o2b4i6b4o3b5i2b5o5b10o7b8o11b2o120b14o2b14o2b4i6b4o3b4i4b4o4b12o5b10o7b8o10b4o136b12o4b12o4b12o5b10o6b10o7b8o10b4o153b10o6b10o7b8o8b8o9b6o12b2o55",
+				[32] = "o115b10o6b10o7b8o8b8o9b6o12b2o169b12o4b12o4b12o5b10o6b10o7b8o10b4o151b14o2b14o2b4i6b4o3b3i6b3o4b5i2b5o5b10o7b8o10b4o134b32ob2i10b2o2b3i8b3o2b4i6b4o3b4i4b4o5b10o7b8o11b2o119b35i10b6i10b3ob3i8b3o2b4i6b4o3b5i2b5o5b10o8b6o117b34i12b4i12b5i10b3ob3i8b3o3b3i6b3o5b10o7b8o116b34i12b4i12b5i10b3ob2i10b2o2b4i6b4o3b12o6b8o116b34i12b4i12b4i12b5i10b3ob3i8b3o3b5i2b5o5b10o115b34i12b4i12b4i12b5i10b3ob3i8b3o3b5i2b5o5b10o115b34i12b4i12b5i10b3ob2i10b2o2b4i6b4o3b12o6b8o116b34i12b4i12b5i10b3ob3i8b3o3b3i6b3o5b10o7b8o116b35i10b6i10b3ob3i8b3o2b4i6b4o3b5i2b5o5b10o8b6o117b32ob2i10b2o2b3i8b3o2b4i6b4o3b4i4b4o5b10o7b8o11b2o120b14o2b14o2b4i6b4o3b3i6b3o4b5i2b5o5b10o7b8o10b4o136b12o4b12o4b12o5b10o6b10o7b8o10b4o153b10o6b10o7b8o8b8o9b6o12b2o55",
+				[48] = "o115b10o6b10o7b8o8b8o9b6o12b2o169b12o4b12o4b5i2b5o5b10o6b10o7b8o10b4o151b14o2b14o2b3i8b3o3b3i6b3o4b4i4b4o5b10o7b8o10b4o134b32ob2i10b2o2b3i8b3o2b3i8b3o3b4i4b4o5b10o7b8o11b2o119b34i12b5i10b3ob2i10b2o2b3i8b3o3b4i4b4o5b10o8b6o117b34i12b4i12b5i10b3ob3i8b3o3b3i6b3o5b10o7b8o116b34i12b4i12b4i12b2ob2i10b2o2b3i8b3o3b5i2b5o6b8o116b33i14b3i12b4i12b5i10b3ob3i8b3o3b4i4b4o5b10o115b33i14b3i12b4i12b5i10b3ob3i8b3o3b4i4b4o5b10o115b34i12b4i12b4i12b2ob2i10b2o2b3i8b3o3b5i2b5o6b8o116b34i12b4i12b5i10b3ob3i8b3o3b3i6b3o5b10o7b8o116b34i12b5i10b3ob2i10b2o2b3i8b3o3b4i4b4o5b10o8b6o117b32ob2i10b2o2b3i8b3o2b3i8b3o3b4i4b4o5b10o7b8o11b2o120b14o2b14o2b3i8b3o3b3i6b3o4b4i4b4o5b10o7b8o10b4o136b12o4b12o4b5i2b5o5b10o6b10o7b8o10b4o153b10o6b10o7b8o8b8o9b6o12b2o55",
+				[64] = "o115b10o6b10o7b8o8b8o9b6o12b2o169b12o4b12o4b4i4b4o5b10o6b10o7b8o10b4o151b14o2b14o2b3i8b3o3b3i6b3o4b4i4b4o5b10o7b8o10b4o134b32ob2i10b2o2b2i10b2o2b3i8b3o3b3i6b3o5b10o7b8o11b2o119b34i12b5i10b3ob2i10b2o2b3i8b3o3b4i4b4o5b10o8b6o117b34i12b4i12b5i10b3ob2i10b2o3b3i6b3o5b10o7b8o116b33i14b3i12b4i12b2ob2i10b2o2b3i8b3o3b4i4b4o6b8o116b33i14b3i12b4i12b5i10b3ob3i8b3o3b4i4b4o5b10o115b33i14b3i12b4i12b5i10b3ob3i8b3o3b4i4b4o5b10o115b33i14b3i12b4i12b2ob2i10b2o2b3i8b3o3b4i4b4o6b8o116b34i12b4i12b5i10b3ob2i10b2o3b3i6b3o5b10o7b8o116b34i12b5i10b3ob2i10b2o2b3i8b3o3b4i4b4o5b10o8b6o117b32ob2i10b2o2b2i10b2o2b3i8b3o3b3i6b3o5b10o7b8o11b2o120b14o2b14o2b3i8b3o3b3i6b3o4b4i4b4o5b10o7b8o10b4o136b12o4b12o4b4i4b4o5b10o6b10o7b8o10b4o153b10o6b10o7b8o8b8o9b6o12b2o55",
+			},
+			extent = 1.0,
+			sizes = {
+				3,
+				4,
+				6,
+				8,
+				12,
+				16,
+				24,
+				32,
+				48,
+				64,
+			},
+		},
+		Grid = {
+			cells = {
+				[3] = "b4096",
+			},
+			extent = 1.0,
+			sizes = {
+				3,
+			},
+		},
+		Ring = {
+			cells = {
+				[3] = "o83b10o6b10o6b10o6b10o6b10o6b10o165b12o4b12o4b12o4b12o4b12o4b12o163b14o2b14o2b14o2b14o2b14o2b14o161b96o160b7o2b14o2b14o2b14o2b14o2b14o2b7o160b5o6b10o6b10o6b10o6b10o6b10o6b5o160b5o6b10o6b10o6b10o6b10o6b10o6b5o160b4o8b8o8b8o8b8o8b8o8b8o8b4o160b4o8b8o8b8o8b8o8b8o8b8o8b4o160b5o6b10o6b10o6b10o6b10o6b10o6b5o160b5o6b10o6b10o6b10o6b10o6b10o6b5o160b7o2b14o2b14o2b14o2b14o2b14o2b7o160b96o161b14o2b14o2b14o2b14o2b14o2b14o163b12o4b12o4b12o4b12o4b12o4b12o165b10o6b10o6b10o6b10o6b10o6b10o83",
+				[16] = "o83b10o6b10o6b10o6b10o6b10o6b10o165b12o4b12o4b12o4b12o4b12o4b12o163b14o2b14o2b14o2b14o2b14o2b14o161b35ib8ib6ib8ib35o160b7o2b14o2b14o2b14o2b14o2b14o2b7o160b5o6b10o6b10o6b10o6b10o6b10o6b5o160b5o6b10o6b10o6b10o6b10o6b10o6b5o160b4o8b8o8b8o8b8o8b8o8b8o8b4o160b4o8b8o8b8o8b8o8b8o8b8o8b4o160b5o6b10o6b10o6b10o6b10o6b10o6b5o160b5o6b10o6b10o6b10o6b10o6b10o6b5o160b7o2b14o2b14o2b14o2b14o2b14o2b7o160b35ib8ib6ib8ib35o161b14o2b14o2b14o2b14o2b14o2b14o163b12o4b12o4b12o4b12o4b12o4b12o165b10o6b10o6b10o6b10o6b10o6b10o83",
+				[24] = "o83b10o6b10o6b10o6b10o6b10o6b10o165b12o4b12o4b5i2b5o4b5i2b5o4b12o4b12o163b14o2b14o2b3ib6ib3o2b3ib6ib3o2b14o2b14o161b35ib8ib6ib8ib35o160b7o2b14o2b9ib4o2b4ib4ib4o2b4ib9o2b14o2b7o160b5o6b10o6b10o6b10o6b10o6b10o6b5o160b5o6b10o6b10o6b10o6b10o6b10o6b5o160b4o8b8o8b5ib2o8b2ib2ib2o8b2ib5o8b8o8b4o160b4o8b8o8b5ib2o8b2ib2ib2o8b2ib5o8b8o8b4o160b5o6b10o6b10o6b10o6b10o6b10o6b5o160b5o6b10o6b10o6b10o6b10o6b10o6b5o160b7o2b14o2b9ib4o2b4ib4ib4o2b4ib9o2b14o2b7o160b35ib8ib6ib8ib35o161b14o2b14o2b3ib6ib3o2b3ib6ib3o2b14o2b14o163b12o4b12o4b5i2b5o4b5i2b5o4b12o4b12o165b10o6b10o6b10o6b10o6b10o6b10o83",
+				[48] = "o83b10o6b10o6b10o6b10o6b10o6b10o165b12o4b12o4b4i4b4o4b4i4b4o4b12o4b12o163b14o2b14o2b3ib6ib3o2b3ib6ib3o2b14o2b14o161b35ib8ib6ib8ib35o160b7o2b14o2b9ib4o2b4ib4ib4o2b4ib9o2b14o2b7o160b5o6b10o6b10o6b10o6b10o6b10o6b5o160b5o6b10o6b6ib3o6b3ib2ib3o6b3ib6o6b10o6b5o160b4o8b8o8b5ib2o8b2ib2ib2o8b2ib5o8b8o8b4o160b4o8b8o8b5ib2o8b2ib2ib2o8b2ib5o8b8o8b4o160b5o6b10o6b6ib3o6b3ib2ib3o6b3ib6o6b10o6b5o160b5o6b10o6b10o6b10o6b10o6b10o6b5o160b7o2b14o2b9ib4o2b4ib4ib4o2b4ib9o2b14o2b7o160b35ib8ib6ib8ib35o161b14o2b14o2b3ib6ib3o2b3ib6ib3o2b14o2b14o163b12o4b12o4b4i4b4o4b4i4b4o4b12o4b12o165b10o6b10o6b10o6b10o6b10o6b10o83",
+			},
+			extent = 1.0,
+			sizes = {
+				3,
+				16,
+				24,
+				48,
+			},
+		},
+		Sheet = {
+			cells = {
+				[3] = "o21b6o10b6o10b6o10b6o10b6o10b6o10b6o10b6o10b6o10b6o10b6o10b6o10b6o10b6o42b8o8b8o8b8o8b8o8b8o8b8o8b8o8b8o8b8o8b8o8b8o8b8o8b8o8b8o40b9o7b9o7b9o7b9o7b9o7b9o7b9o7b9o7b9o7b9o7b9o7b9o7b9o7b9o40bo2b6o7bo2b6o7bo2b6o7bo2b6o7bo2b6o7bo2b6o7bo2b6o7bo2b6o7bo2b6o7bo2b6o7bo2b6o7bo2b6o7bo2b6o7bo2b6o44b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o45b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o44b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o45b3o13b3o13b3o13b3o13b3o13b3o13b3o13b3o13b3o13b3o13b3o13b3o13b3o13b3o45b3o13b3o13b3o13b3o13b3o13b3o13b3o13b3o13b3o13b3o13b3o13b3o13b3o13b3o44b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o44b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o43b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o39bo2b6o7bo2b6o7bo2b6o7bo2b6o7bo2b6o7bo2b6o7bo2b6o7bo2b6o7bo2b6o7bo2b6o7bo2b6o7bo2b6o7bo2b6o7bo2b6o38b9o7b9o7b9o7b9o7b9o7b9o7b9o7b9o7b9o7b9o7b9o7b9o7b9o7b9o39b8o8b8o8b8o8b8o8b8o8b8o8b8o8b8o8b8o8b8o8b8o8b8o8b8o8b8o40b6o10b6o10b6o10b6o10b6o10b6o10b6o10b6o10b6o10b6o10b6o10b6o10b6o10b6o21",
+			},
+			extent = 1.25,
+			sizes = {
+				3,
+			},
+		},
+		Sphere = {
+			cells = {
+				[3] = "o55b2o12b6o9b8o8b8o7b10o6b10o7b8o8b8o9b6o12b2o93b4o10b8o7b10o6b10o5b12o4b12o4b12o4b12o5b10o6b10o7b8o10b4o60b4o10b8o7b10o5b12o4b12o3b14o2b14o2b14o2b14o3b12o4b12o5b10o7b8o10b4o29b2o11b8o7b10o5b12o3b14o2b14o2b14ob32ob14o2b14o2b14o3b12o5b10o7b8o11b2o12b6o8b10o5b12o3b14o2b14ob96ob14o2b14o3b12o5b10o8b6o9b8o7b10o5b12o3b14ob128ob14o3b12o5b10o7b8o8b8o6b12o3b14o2b14ob55i2b14i2b55ob14o2b14o3b12o6b8o7b10o5b12o3b14ob55i2b13i4b12i4b13i2b55ob14o3b12o5b10o6b10o5b12o3b14ob55i2b13i4b12i4b13i2b55ob14o3b12o5b10o7b8o6b12o3b14o2b14ob55i2b14i2b55ob14o2b14o3b12o6b8o8b8o7b10o5b12o3b14ob128ob14o3b12o5b10o7b8o9b6o8b10o5b12o3b14o2b14ob96ob14o2b14o3b12o5b10o8b6o12b2o11b8o7b10o5b12o3b14o2b14o2b14ob32ob14o2b14o2b14o3b12o5b10o7b8o11b2o29b4o10b8o7b10o5b12o4b12o3b14o2b14o2b14o2b14o3b12o4b12o5b10o7b8o10b4o60b4o10b8o7b10o6b10o5b12o4b12o4b12o4b12o5b10o6b10o7b8o10b4o93b2o12b6o9b8o8b8o7b10o6b10o7b8o8b8o9b6o12b2o55",
+				[4] = "o55b2o12b6o9b8o8b8o7b10o6b10o7b8o8b8o9b6o12b2o93b4o10b8o7b10o6b10o5b12o4b12o4b12o4b12o5b10o6b10o7b8o10b4o60b4o10b8o7b10o5b12o4b12o3b14o2b14o2b14o2b14o3b12o4b12o5b10o7b8o10b4o29b2o11b8o7b10o5b12o3b14o2b14o2b14ob32ob14o2b14o2b14o3b12o5b10o7b8o11b2o12b6o8b10o5b12o3b14o2b14ob96ob14o2b14o3b12o5b10o8b6o9b8o7b10o5b12o3b14ob39i2b13i4b12i4b13i2b39ob14o3b12o5b10o7b8o8b8o6b12o3b14o2b14ob23i2b13i4b11i6b10i6b11i4b13i2b23ob14o2b14o3b12o6b8o7b10o5b12o3b14ob38i4b11i6b10i6b10i6b10i6b11i4b38ob14o3b12o5b10o6b10o5b12o3b14ob38i4b11i6b10i6b10i6b10i6b11i4b38ob14o3b12o5b10o7b8o6b12o3b14o2b14ob23i2b13i4b11i6b10i6b11i4b13i2b23ob14o2b14o3b12o6b8o8b8o7b10o5b12o3b14ob39i2b13i4b12i4b13i2b39ob14o3b12o5b10o7b8o9b6o8b10o5b12o3b14o2b14ob96ob14o2b14o3b12o5b10o8b6o12b2o11b8o7b10o5b12o3b14o2b14o2b14ob32ob14o2b14o2b14o3b12o5b10o7b8o11b2o29b4o10b8o7b10o5b12o4b12o3b14o2b14o2b14o2b14o3b12o4b12o5b10o7b8o10b4o60b4o10b8o7b10o6b10o5b12o4b12o4b12o4b12o5b10o6b10o7b8o10b4o93b2o12b6o9b8o8b8o7b10o6b10o7b8o8b8o9b6o12b2o55",
+				[6] = "o55b2o12b6o9b8o8b8o7b10o6b10o7b8o8b8o9b6o12b2o93b4o10b8o7b10o6b10o5b12o4b12o4b12o4b12o5b10o6b10o7b8o10b4o60b4o10b8o7b10o5b12o4b12o3b14o2b14o2b14o2b14o3b12o4b12o5b10o7b8o10b4o29b2o11b8o7b10o5b12o3b14o2b14o2b14ob32ob14o2b14o2b14o3b12o5b10o7b8o11b2o12b6o8b10o5b12o3b14o2b14ob7i2b13i4b11i6b10i6b11i4b13i2b7ob14o2b14o3b12o5b10o8b6o9b8o7b10o5b12o3b14ob7i2b12i6b10i6b9i8b8i8b9i6b10i6b12i2b7ob14o3b12o5b10o7b8o8b8o6b12o3b14o2b14ob6i4b11i6b9i8b8i8b8i8b8i8b9i6b11i4b6ob14o2b14o3b12o6b8o7b10o5b12o3b14ob21i6b9i8b8i8b8i8b8i8b8i8b8i8b9i6b21ob14o3b12o5b10o6b10o5b12o3b14ob21i6b9i8b8i8b8i8b8i8b8i8b8i8b9i6b21ob14o3b12o5b10o7b8o6b12o3b14o2b14ob6i4b11i6b9i8b8i8b8i8b8i8b9i6b11i4b6ob14o2b14o3b12o6b8o8b8o7b10o5b12o3b14ob7i2b12i6b10i6b9i8b8i8b9i6b10i6b12i2b7ob14o3b12o5b10o7b8o9b6o8b10o5b12o3b14o2b14ob7i2b13i4b11i6b10i6b11i4b13i2b7ob14o2b14o3b12o5b10o8b6o12b2o11b8o7b10o5b12o3b14o2b14o2b14ob32ob14o2b14o2b14o3b12o5b10o7b8o11b2o29b4o10b8o7b10o5b12o4b12o3b14o2b14o2b14o2b14o3b12o4b12o5b10o7b8o10b4o60b4o10b8o7b10o6b10o5b12o4b12o4b12o4b12o5b10o6b10o7b8o10b4o93b2o12b6o9b8o8b8o7b10o6b10o7b8o8b8o9b6o12b2o55",
+				[8] = "o55b2o12b6o9b8o8b8o7b10o6b10o7b8o8b8o9b6o12b2o93b4o10b8o7b10o6b10o5b12o4b12o4b12o4b12o5b10o6b10o7b8o10b4o60b4o10b8o7b10o5b12o4b12o3b14o2b14o2b14o2b14o3b12o4b12o5b10o7b8o10b4o29b2o11b8o7b10o5b12o3b14o2b14o2b5i4b5ob6i4b12i4b6ob5i4b5o2b14o2b14o3b12o5b10o7b8o11b2o12b6o8b10o5b12o3b14o2b6i2b6ob5i6b10i6b9i8b8i8b9i6b10i6b5ob6i2b6o2b14o3b12o5b10o8b6o9b8o7b10o5b12o3b14ob5i6b9i8b8i8b8i8b8i8b8i8b8i8b9i6b5ob14o3b12o5b10o7b8o8b8o6b12o3b14o2b5i4b5ob5i6b9i8b7i10b6i10b6i10b6i10b7i8b9i6b5ob5i4b5o2b14o3b12o6b8o7b10o5b12o3b14ob6i4b10i8b8i8b7i10b6i10b6i10b6i10b7i8b8i8b10i4b6ob14o3b12o5b10o6b10o5b12o3b14ob6i4b10i8b8i8b7i10b6i10b6i10b6i10b7i8b8i8b10i4b6ob14o3b12o5b10o7b8o6b12o3b14o2b5i4b5ob5i6b9i8b7i10b6i10b6i10b6i10b7i8b9i6b5ob5i4b5o2b14o3b12o6b8o8b8o7b10o5b12o3b14ob5i6b9i8b8i8b8i8b8i8b8i8b8i8b9i6b5ob14o3b12o5b10o7b8o9b6o8b10o5b12o3b14o2b6i2b6ob5i6b10i6b9i8b8i8b9i6b10i6b5ob6i2b6o2b14o3b12o5b10o8b6o12b2o11b8o7b10o5b12o3b14o2b14o2b5i4b5ob6i4b12i4b6ob5i4b5o2b14o2b14o3b12o5b10o7b8o11b2o29b4o10b8o7b10o5b12o4b12o3b14o2b14o2b14o2b14o3b12o4b12o5b10o7b8o10b4o60b4o10b8o7b10o6b10o5b12o4b12o4b12o4b12o5b10o6b10o7b8o10b4o93b2o12b6o9b8o8b8o7b10o6b10o7b8o8b8o9b6o12b2o55",
+				[12] = "o55b2o12b6o9b8o8b8o7b10o6b10o7b8o8b8o9b6o12b2o93b4o10b8o7b10o6b10o5b12o4b12o4b12o4b12o5b10o6b10o7b8o10b4o60b4o10b8o7b10o5b12o4b12o3b6i2b6o2b5i4b5o2b5i4b5o2b6i2b6o3b12o4b12o5b10o7b8o10b4o29b2o11b8o7b10o5b12o3b6i2b6o2b4i6b4o2b4i6b4ob4i8b8i8b4ob4i6b4o2b4i6b4o2b6i2b6o3b12o5b10o7b8o11b2o12b6o8b10o5b12o3b6i2b6o2b4i6b4ob4i8b8i8b7i10b6i10b7i8b8i8b4ob4i6b4o2b6i2b6o3b12o5b10o8b6o9b8o7b10o5b12o3b4i6b4ob4i8b7i10b6i10b6i10b6i10b6i10b6i10b7i8b4ob4i6b4o3b12o5b10o7b8o8b8o6b12o3b6i2b6o2b4i6b4ob4i8b7i10b6i10b5i12b4i12b5i10b6i10b7i8b4ob4i6b4o2b6i2b6o3b12o6b8o7b10o5b12o3b5i4b5ob4i8b7i10b6i10b5i12b4i12b4i12b4i12b5i10b6i10b7i8b4ob5i4b5o3b12o5b10o6b10o5b12o3b5i4b5ob4i8b7i10b6i10b5i12b4i12b4i12b4i12b5i10b6i10b7i8b4ob5i4b5o3b12o5b10o7b8o6b12o3b6i2b6o2b4i6b4ob4i8b7i10b6i10b5i12b4i12b5i10b6i10b7i8b4ob4i6b4o2b6i2b6o3b12o6b8o8b8o7b10o5b12o3b4i6b4ob4i8b7i10b6i10b6i10b6i10b6i10b6i10b7i8b4ob4i6b4o3b12o5b10o7b8o9b6o8b10o5b12o3b6i2b6o2b4i6b4ob4i8b8i8b7i10b6i10b7i8b8i8b4ob4i6b4o2b6i2b6o3b12o5b10o8b6o12b2o11b8o7b10o5b12o3b6i2b6o2b4i6b4o2b4i6b4ob4i8b8i8b4ob4i6b4o2b4i6b4o2b6i2b6o3b12o5b10o7b8o11b2o29b4o10b8o7b10o5b12o4b12o3b6i2b6o2b5i4b5o2b5i4b5o2b6i2b6o3b12o4b12o5b10o7b8o10b4o60b4o10b8o7b10o6b10o5b12o4b12o4b12o4b12o5b10o6b10o7b8o10b4o93b2o12b6o9b8o8b8o7b10o6b10o7b8o8b8o9b6o12b2o55",
+				[16] = "o55b2o12b6o9b8o8b8o7b10o6b10o7b8o8b8o9b6o12b2o93b4o10b8o7b10o6b10o5b12o4b12o4b12o4b12o5b10o6b10o7b8o10b4o60b4o10b8o7b10o5b12o4b5i2b5o3b5i4b5o2b4i6b4o2b4i6b4o2b5i4b5o3b5i2b5o4b12o5b10o7b8o10b4o29b2o11b8o7b10o5b12o3b5i4b5o2b4i6b4o2b3i8b3ob4i8b8i8b4ob3i8b3o2b4i6b4o2b5i4b5o3b12o5b10o7b8o11b2o12b6o8b10o5b12o3b5i4b5o2b3i8b3ob4i8b7i10b6i10b6i10b6i10b7i8b4ob3i8b3o2b5i4b5o3b12o5b10o8b6o9b8o7b10o5b5i2b5o3b4i6b4ob4i8b7i10b6i10b5i12b4i12b5i10b6i10b7i8b4ob4i6b4o3b5i2b5o5b10o7b8o8b8o6b12o3b5i4b5o2b3i8b3ob3i10b6i10b5i12b4i12b4i12b4i12b5i10b6i10b3ob3i8b3o2b5i4b5o3b12o6b8o7b10o5b12o3b4i6b4ob4i8b7i10b5i12b4i12b4i12b4i12b4i12b4i12b5i10b7i8b4ob4i6b4o3b12o5b10o6b10o5b12o3b4i6b4ob4i8b7i10b5i12b4i12b4i12b4i12b4i12b4i12b5i10b7i8b4ob4i6b4o3b12o5b10o7b8o6b12o3b5i4b5o2b3i8b3ob3i10b6i10b5i12b4i12b4i12b4i12b5i10b6i10b3ob3i8b3o2b5i4b5o3b12o6b8o8b8o7b10o5b5i2b5o3b4i6b4ob4i8b7i10b6i10b5i12b4i12b5i10b6i10b7i8b4ob4i6b4o3b5i2b5o5b10o7b8o9b6o8b10o5b12o3b5i4b5o2b3i8b3ob4i8b7i10b6i10b6i10b6i10b7i8b4ob3i8b3o2b5i4b5o3b12o5b10o8b6o12b2o11b8o7b10o5b12o3b5i4b5o2b4i6b4o2b3i8b3ob4i8b8i8b4ob3i8b3o2b4i6b4o2b5i4b5o3b12o5b10o7b8o11b2o29b4o10b8o7b10o5b12o4b5i2b5o3b5i4b5o2b4i6b4o2b4i6b4o2b5i4b5o3b5i2b5o4b12o5b10o7b8o10b4o60b4o10b8o7b10o6b10o5b12o4b12o4b12o4b12o5b10o6b10o7b8o10b4o93b2o12b6o9b8o8b8o7b10o6b10o7b8o8b8o9b6o12b2o55",
+				[24] = "o55b2o12b6o9b8o8b8o7b10o6b10o7b8o8b8o9b6o12b2o93b4o10b8o7b10o6b10o5b12o4b12o4b12o4b12o5b10o6b10o7b8o10b4o60b4o10b8o7b10o5b12o4b4i4b4o3b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o3b4i4b4o4b12o5b10o7b8o10b4o29b2o11b8o7b10o5b5i2b5o3b4i6b4o2b3i8b3o2b3i8b3ob3i10b6i10b3ob3i8b3o2b3i8b3o2b4i6b4o3b5i2b5o5b10o7b8o11b2o12b6o8b10o5b12o3b4i6b4o2b3i8b3ob3i10b6i10b6i10b6i10b6i10b6i10b3ob3i8b3o2b4i6b4o3b12o5b10o8b6o9b8o7b10o5b4i4b4o3b3i8b3ob3i10b6i10b5i12b4i12b4i12b4i12b5i10b6i10b3ob3i8b3o3b4i4b4o5b10o7b8o8b8o6b12o3b4i6b4o2b3i8b3ob3i10b5i12b4i12b4i12b4i12b4i12b4i12b5i10b3ob3i8b3o2b4i6b4o3b12o6b8o7b10o5b12o3b4i6b4ob3i10b6i10b5i12b4i12b4i12b4i12b4i12b4i12b5i10b6i10b3ob4i6b4o3b12o5b10o6b10o5b12o3b4i6b4ob3i10b6i10b5i12b4i12b4i12b4i12b4i12b4i12b5i10b6i10b3ob4i6b4o3b12o5b10o7b8o6b12o3b4i6b4o2b3i8b3ob3i10b5i12b4i12b4i12b4i12b4i12b4i12b5i10b3ob3i8b3o2b4i6b4o3b12o6b8o8b8o7b10o5b4i4b4o3b3i8b3ob3i10b6i10b5i12b4i12b4i12b4i12b5i10b6i10b3ob3i8b3o3b4i4b4o5b10o7b8o9b6o8b10o5b12o3b4i6b4o2b3i8b3ob3i10b6i10b6i10b6i10b6i10b6i10b3ob3i8b3o2b4i6b4o3b12o5b10o8b6o12b2o11b8o7b10o5b5i2b5o3b4i6b4o2b3i8b3o2b3i8b3ob3i10b6i10b3ob3i8b3o2b3i8b3o2b4i6b4o3b5i2b5o5b10o7b8o11b2o29b4o10b8o7b10o5b12o4b4i4b4o3b4i6b4o2b4i6b4o2b4i6b4o2b4i6b4o3b4i4b4o4b12o5b10o7b8o10b4o60b4o10b8o7b10o6b10o5b12o4b12o4b12o4b12o5b10o6b10o7b8o10b4o93b2o12b6o9b8o8b8o7b10o6b10o7b8o8b8o9b6o12b2o55",
+				[32] = "o55b2o12b6o9b8o8b8o7b10o6b10o7b8o8b8o9b6o12b2o93b4o10b8o7b10o6b10o5b12o4b5i2b5o4b5i2b5o4b12o5b10o6b10o7b8o10b4o60b4o10b8o7b10o5b5i2b5o4b3i6b3o3b4i6b4o2b3i8b3o2b3i8b3o2b4i6b4o3b3i6b3o4b5i2b5o5b10o7b8o10b4o29b2o11b8o7b10o5b4i4b4o3b4i6b4o2b3i8b3o2b2i10b2ob3i10b6i10b3ob2i10b2o2b3i8b3o2b4i6b4o3b4i4b4o5b10o7b8o11b2o12b6o8b10o5b5i2b5o3b4i6b4o2b3i8b3ob3i10b6i10b5i12b4i12b5i10b6i10b3ob3i8b3o2b4i6b4o3b5i2b5o5b10o8b6o9b8o7b10o5b3i6b3o3b3i8b3ob3i10b5i12b4i12b4i12b4i12b4i12b4i12b5i10b3ob3i8b3o3b3i6b3o5b10o7b8o8b8o6b12o3b4i6b4o2b2i10b2ob3i10b5i12b4i12b4i12b4i12b4i12b4i12b5i10b3ob2i10b2o2b4i6b4o3b12o6b8o7b10o5b5i2b5o3b3i8b3ob3i10b5i12b4i12b4i12b3i14b2i14b3i12b4i12b4i12b5i10b3ob3i8b3o3b5i2b5o5b10o6b10o5b5i2b5o3b3i8b3ob3i10b5i12b4i12b4i12b3i14b2i14b3i12b4i12b4i12b5i10b3ob3i8b3o3b5i2b5o5b10o7b8o6b12o3b4i6b4o2b2i10b2ob3i10b5i12b4i12b4i12b4i12b4i12b4i12b5i10b3ob2i10b2o2b4i6b4o3b12o6b8o8b8o7b10o5b3i6b3o3b3i8b3ob3i10b5i12b4i12b4i12b4i12b4i12b4i12b5i10b3ob3i8b3o3b3i6b3o5b10o7b8o9b6o8b10o5b5i2b5o3b4i6b4o2b3i8b3ob3i10b6i10b5i12b4i12b5i10b6i10b3ob3i8b3o2b4i6b4o3b5i2b5o5b10o8b6o12b2o11b8o7b10o5b4i4b4o3b4i6b4o2b3i8b3o2b2i10b2ob3i10b6i10b3ob2i10b2o2b3i8b3o2b4i6b4o3b4i4b4o5b10o7b8o11b2o29b4o10b8o7b10o5b5i2b5o4b3i6b3o3b4i6b4o2b3i8b3o2b3i8b3o2b4i6b4o3b3i6b3o4b5i2b5o5b10o7b8o10b4o60b4o10b8o7b10o6b10o5b12o4b5i2b5o4b5i2b5o4b12o5b10o6b10o7b8o10b4o93b2o12b6o9b8o8b8o7b10o6b10o7b8o8b8o9b6o12b2o55",
+				[48] = "o55b2o12b6o9b8o8b8o7b10o6b10o7b8o8b8o9b6o12b2o93b4o10b8o7b10o6b10o5b5i2b5o4b4i4b4o4b4i4b4o4b5i2b5o5b10o6b10o7b8o10b4o60b4o10b8o7b10o5b4i4b4o4b3i6b3o3b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o3b3i6b3o4b4i4b4o5b10o7b8o10b4o29b2o11b8o7b10o5b4i4b4o3b3i8b3o2b3i8b3o2b2i10b2ob3i10b6i10b3ob2i10b2o2b3i8b3o2b3i8b3o3b4i4b4o5b10o7b8o11b2o12b6o8b10o5b4i4b4o3b3i8b3o2b2i10b2ob3i10b5i12b4i12b4i12b4i12b5i10b3ob2i10b2o2b3i8b3o3b4i4b4o5b10o8b6o9b8o7b10o5b3i6b3o3b3i8b3ob3i10b5i12b4i12b4i12b4i12b4i12b4i12b5i10b3ob3i8b3o3b3i6b3o5b10o7b8o8b8o6b5i2b5o3b3i8b3o2b2i10b2ob2i12b4i12b4i12b3i14b2i14b3i12b4i12b4i12b2ob2i10b2o2b3i8b3o3b5i2b5o6b8o7b10o5b4i4b4o3b3i8b3ob3i10b5i12b4i12b3i14b2i14b2i14b2i14b3i12b4i12b5i10b3ob3i8b3o3b4i4b4o5b10o6b10o5b4i4b4o3b3i8b3ob3i10b5i12b4i12b3i14b2i14b2i14b2i14b3i12b4i12b5i10b3ob3i8b3o3b4i4b4o5b10o7b8o6b5i2b5o3b3i8b3o2b2i10b2ob2i12b4i12b4i12b3i14b2i14b3i12b4i12b4i12b2ob2i10b2o2b3i8b3o3b5i2b5o6b8o8b8o7b10o5b3i6b3o3b3i8b3ob3i10b5i12b4i12b4i12b4i12b4i12b4i12b5i10b3ob3i8b3o3b3i6b3o5b10o7b8o9b6o8b10o5b4i4b4o3b3i8b3o2b2i10b2ob3i10b5i12b4i12b4i12b4i12b5i10b3ob2i10b2o2b3i8b3o3b4i4b4o5b10o8b6o12b2o11b8o7b10o5b4i4b4o3b3i8b3o2b3i8b3o2b2i10b2ob3i10b6i10b3ob2i10b2o2b3i8b3o2b3i8b3o3b4i4b4o5b10o7b8o11b2o29b4o10b8o7b10o5b4i4b4o4b3i6b3o3b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o3b3i6b3o4b4i4b4o5b10o7b8o10b4o60b4o10b8o7b10o6b10o5b5i2b5o4b4i4b4o4b4i4b4o4b5i2b5o5b10o6b10o7b8o10b4o93b2o12b6o9b8o8b8o7b10o6b10o7b8o8b8o9b6o12b2o55",
+				[64] = "o55b2o12b6o9b8o8b8o7b10o6b10o7b8o8b8o9b6o12b2o93b4o10b8o7b10o6b10o5b4i4b4o4b4i4b4o4b4i4b4o4b4i4b4o5b10o6b10o7b8o10b4o60b4o10b8o7b10o5b4i4b4o4b3i6b3o3b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o3b3i6b3o4b4i4b4o5b10o7b8o10b4o29b2o11b8o7b10o5b3i6b3o3b3i8b3o2b2i10b2o2b2i10b2ob3i10b6i10b3ob2i10b2o2b2i10b2o2b3i8b3o3b3i6b3o5b10o7b8o11b2o12b6o8b10o5b4i4b4o3b3i8b3o2b2i10b2ob3i10b5i12b4i12b4i12b4i12b5i10b3ob2i10b2o2b3i8b3o3b4i4b4o5b10o8b6o9b8o7b10o5b3i6b3o3b2i10b2ob3i10b5i12b4i12b4i12b4i12b4i12b4i12b5i10b3ob2i10b2o3b3i6b3o5b10o7b8o8b8o6b4i4b4o3b3i8b3o2b2i10b2ob2i12b4i12b3i14b2i14b2i14b2i14b3i12b4i12b2ob2i10b2o2b3i8b3o3b4i4b4o6b8o7b10o5b4i4b4o3b3i8b3ob3i10b5i12b4i12b3i14b2i14b2i14b2i14b3i12b4i12b5i10b3ob3i8b3o3b4i4b4o5b10o6b10o5b4i4b4o3b3i8b3ob3i10b5i12b4i12b3i14b2i14b2i14b2i14b3i12b4i12b5i10b3ob3i8b3o3b4i4b4o5b10o7b8o6b4i4b4o3b3i8b3o2b2i10b2ob2i12b4i12b3i14b2i14b2i14b2i14b3i12b4i12b2ob2i10b2o2b3i8b3o3b4i4b4o6b8o8b8o7b10o5b3i6b3o3b2i10b2ob3i10b5i12b4i12b4i12b4i12b4i12b4i12b5i10b3ob2i10b2o3b3i6b3o5b10o7b8o9b6o8b10o5b4i4b4o3b3i8b3o2b2i10b2ob3i10b5i12b4i12b4i12b4i12b5i10b3ob2i10b2o2b3i8b3o3b4i4b4o5b10o8b6o12b2o11b8o7b10o5b3i6b3o3b3i8b3o2b2i10b2o2b2i10b2ob3i10b6i10b3ob2i10b2o2b2i10b2o2b3i8b3o3b3i6b3o5b10o7b8o11b2o29b4o10b8o7b10o5b4i4b4o4b3i6b3o3b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o3b3i6b3o4b4i4b4o5b10o7b8o10b4o60b4o10b8o7b10o6b10o5b4i4b4o4b4i4b4o4b4i4b4o4b4i4b4o5b10o6b10o7b8o10b4o93b2o12b6o9b8o8b8o7b10o6b10o7b8o8b8o9b6o12b2o55",
+			},
+			extent = 1.0,
+			sizes = {
+				3,
+				4,
+				6,
+				8,
+				12,
+				16,
+				24,
+				32,
+				48,
+				64,
+			},
+		},
+		Spikepad = {
+			cells = {
+				[3] = "b132ob6ob8ob6ob4ob3ob2o2b2ob3o2b3o2bo2bo2b3o2bobo2bo2bo2bobo2bo4bo2bo4bo33b196ob6ob8ob6ob4ob3ob2o2b2ob3o2b3ob2o2b2ob3ob164ob6ob8ob6ob4ob3ob2o2b2ob3o2b3o2bo2bo2b3o2b3o2bo2bo2b3o2bobo2bo2bo2bobob196ob6ob4ob3ob2o2b2ob3o2b3ob2o2b2ob3o2b3o2bo2bo2b3ob116ob6ob4ob3ob2o2b2ob3o2b3o2bo2bo2b3o2bobo2bo2bo2bobo2bobo2bo2bo2bobo65b148ob6ob8ob6ob4ob3ob2o2b2ob3o2b3o2bo2bo2b3o2bobo2bo2bo2bobo2bobo2bo2bo2bobo2bo4bo2bo4bob196ob6ob8ob6ob4ob3ob2o2b2ob3o2b3ob2o2b2ob3ob132ob6ob8ob6ob4ob3ob2o2b2ob3o2b3o2bo2bo2b3o2bobo2bo2bo2bobo2bo4bo2bo4bo33b132ob6ob8ob6ob4ob3ob2o2b2ob3o2b3o2bo2bo2b3o2bobo2bo2bo2bobo2bo4bo2bo4bo33b196ob6ob8ob6ob4ob3ob2o2b2ob3o2b3ob2o2b2ob3ob148ob6ob8ob6ob4ob3ob2o2b2ob3o2b3o2bo2bo2b3o2bobo2bo2bo2bobo2bobo2bo2bo2bobo2bo4bo2bo4bob116ob6ob4ob3ob2o2b2ob3o2b3o2bo2bo2b3o2bobo2bo2bo2bobo2bobo2bo2bo2bobo65b196ob6ob4ob3ob2o2b2ob3o2b3ob2o2b2ob3o2b3o2bo2bo2b3ob164ob6ob8ob6ob4ob3ob2o2b2ob3o2b3o2bo2bo2b3o2b3o2bo2bo2b3o2bobo2bo2bo2bobob196ob6ob8ob6ob4ob3ob2o2b2ob3o2b3ob2o2b2ob3ob132ob6ob8ob6ob4ob3ob2o2b2ob3o2b3o2bo2bo2b3o2bobo2bo2bo2bobo2bo4bo2bo4bo33",
+			},
+			extent = 1.0,
+			sizes = {
+				3,
+			},
+		},
+		Spinner = {
+			cells = {
+				[3] = "b1638i4b12i4b12i4b12i4b204i4b12i4b12i4b12i4b204i4b12i4b12i4b12i4b204i4b12i4b12i4b12i4b1638",
+				[4] = "b1365i6b10i6b10i6b10i6b10i6b10i6b170i6b10i6b10i6b10i6b10i6b10i6b170i6b10i6b10i6b10i6b10i6b10i6b170i6b10i6b10i6b10i6b10i6b10i6b170i6b10i6b10i6b10i6b10i6b10i6b170i6b10i6b10i6b10i6b10i6b10i6b1365",
+				[6] = "b1092i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b136i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b136i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b136i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b136i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b136i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b136i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b136i8b8i8b8i8b8i8b8i8b8i8b8i8b8i8b1092",
+				[8] = "b819i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b102i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b102i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b102i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b102i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b102i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b102i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b102i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b102i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b102i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b6i10b819",
+				[12] = "b546i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b68i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b68i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b68i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b68i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b68i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b68i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b68i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b68i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b68i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b68i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b68i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b4i12b546",
+				[32] = "b273i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b34i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b2i14b273",
+			},
+			extent = 1.0,
+			sizes = {
+				3,
+				4,
+				6,
+				8,
+				12,
+				32,
+			},
+		},
+		Stick = {
+			cells = {
+				[3] = "o1543b2o14b2o14b2o14b2o14b2o14b2o14b2o14b2o14b2o14b2o14b2o14b2o14b2o14b2o14b2o14b2o13b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o12b4o13b2o14b2o14b2o14b2o14b2o14b2o14b2o14b2o14b2o14b2o14b2o14b2o14b2o14b2o14b2o14b2o1543",
+			},
+			extent = 1.0,
+			sizes = {
+				3,
+			},
+		},
+		Torus = {
+			cells = {
+				[3] = "o85b6o9b8o7b10o6b10o7b8o9b6o154b6o8b10o5b12o4b12o4b12o4b12o5b10o8b6o123b4o9b10o5b12o3b14o2b14o2b14o2b14o3b12o5b10o9b4o106b8o6b12o3b14o2b14ob32ob14o2b14o3b12o6b8o103b10o5b12o3b14ob64ob14o3b12o5b10o102b10o4b14ob96ob14o4b10o101b4o4b4o3b14ob96ob14o3b4o4b4o100b4o4b4o3b14ob96ob14o3b4o4b4o100b4o4b4o3b14ob96ob14o3b4o4b4o100b4o4b4o3b14ob96ob14o3b4o4b4o101b10o4b14ob96ob14o4b10o102b10o5b12o3b14ob64ob14o3b12o5b10o103b8o6b12o3b14o2b14ob32ob14o2b14o3b12o6b8o106b4o9b10o5b12o3b14o2b14o2b14o2b14o3b12o5b10o9b4o123b6o8b10o5b12o4b12o4b12o4b12o5b10o8b6o154b6o9b8o7b10o6b10o7b8o9b6o85",
+				[4] = "o85b6o9b8o7b10o6b10o7b8o9b6o154b6o8b10o5b12o4b12o4b12o4b12o5b10o8b6o123b4o9b10o5b12o3b14o2b14o2b14o2b14o3b12o5b10o9b4o106b8o6b12o3b14o2b14ob6i4b12i4b6ob14o2b14o3b12o6b8o103b10o5b12o3b14ob20i8b8i8b20ob14o3b12o5b10o102b10o4b14ob36i2b4i2b8i2b4i2b36ob14o4b10o101b4o4b4o3b14ob35i2b6i2b6i2b6i2b35ob14o3b4o4b4o100b4o4b4o3b14ob35i2b6i2b6i2b6i2b35ob14o3b4o4b4o100b4o4b4o3b14ob35i2b6i2b6i2b6i2b35ob14o3b4o4b4o100b4o4b4o3b14ob35i2b6i2b6i2b6i2b35ob14o3b4o4b4o101b10o4b14ob36i2b4i2b8i2b4i2b36ob14o4b10o102b10o5b12o3b14ob20i8b8i8b20ob14o3b12o5b10o103b8o6b12o3b14o2b14ob6i4b12i4b6ob14o2b14o3b12o6b8o106b4o9b10o5b12o3b14o2b14o2b14o2b14o3b12o5b10o9b4o123b6o8b10o5b12o4b12o4b12o4b12o5b10o8b6o154b6o9b8o7b10o6b10o7b8o9b6o85",
+				[6] = "o85b6o9b8o7b10o6b10o7b8o9b6o154b6o8b10o5b12o4b12o4b12o4b12o5b10o8b6o123b4o9b10o5b12o3b14o2b5i4b5o2b5i4b5o2b14o3b12o5b10o9b4o106b8o6b12o3b14o2b5i4b5ob4i8b8i8b4ob5i4b5o2b14o3b12o6b8o103b10o5b12o3b14ob4i8b7i10b6i10b7i8b4ob14o3b12o5b10o102b10o4b14ob20i2b4i2b7i10b6i10b7i2b4i2b20ob14o4b10o101b4o4b4o3b14ob19i2b6i2b5i4b4i4b4i4b4i4b5i2b6i2b19ob14o3b4o4b4o100b4o4b4o3b14ob19i2b6i2b5i4b4i4b4i4b4i4b5i2b6i2b19ob14o3b4o4b4o100b4o4b4o3b14ob19i2b6i2b5i4b4i4b4i4b4i4b5i2b6i2b19ob14o3b4o4b4o100b4o4b4o3b14ob19i2b6i2b5i4b4i4b4i4b4i4b5i2b6i2b19ob14o3b4o4b4o101b10o4b14ob20i2b4i2b7i10b6i10b7i2b4i2b20ob14o4b10o102b10o5b12o3b14ob4i8b7i10b6i10b7i8b4ob14o3b12o5b10o103b8o6b12o3b14o2b5i4b5ob4i8b8i8b4ob5i4b5o2b14o3b12o6b8o106b4o9b10o5b12o3b14o2b5i4b5o2b5i4b5o2b14o3b12o5b10o9b4o123b6o8b10o5b12o4b12o4b12o4b12o5b10o8b6o154b6o9b8o7b10o6b10o7b8o9b6o85",
+				[8] = "o85b6o9b8o7b10o6b10o7b8o9b6o154b6o8b10o5b12o4b12o4b12o4b12o5b10o8b6o123b4o9b10o5b12o3b6s2b6o2b4i6b4o2b4i6b4o2b6s2b6o3b12o5b10o9b4o106b8o6b12o3b14o2b4i6b4ob4i8b8i8b4ob4i6b4o2b14o3b12o6b8o103b10o5b12o3b14ob4i8b7i10b6i10b7i8b4ob14o3b12o5b10o102b10o4b14ob19i10b5i12b4i12b5i10b19ob14o4b10o101b4o4b4o3b14ob19i3b4i3b5i5b2i5b4i5b2i5b5i3b4i3b19ob14o3b4o4b4o100b4o4b4o3b14ob18si3b4i3sb4i4b4i4b4i4b4i4b4si3b4i3sb18ob14o3b4o4b4o100b4o4b4o3b14ob18si3b4i3sb4i4b4i4b4i4b4i4b4si3b4i3sb18ob14o3b4o4b4o100b4o4b4o3b14ob19i3b4i3b5i5b2i5b4i5b2i5b5i3b4i3b19ob14o3b4o4b4o101b10o4b14ob19i10b5i12b4i12b5i10b19ob14o4b10o102b10o5b12o3b14ob4i8b7i10b6i10b7i8b4ob14o3b12o5b10o103b8o6b12o3b14o2b4i6b4ob4i8b8i8b4ob4i6b4o2b14o3b12o6b8o106b4o9b10o5b12o3b6s2b6o2b4i6b4o2b4i6b4o2b6s2b6o3b12o5b10o9b4o123b6o8b10o5b12o4b12o4b12o4b12o5b10o8b6o154b6o9b8o7b10o6b10o7b8o9b6o85",
+				[12] = "o85b6o9b8o7b10o6b10o7b8o9b6o154b6o8b10o5b12o4b12o4b12o4b12o5b10o8b6o123b4o9b10o5b12o3b5i4b5o2b4i6b4o2b4i6b4o2b5i4b5o3b12o5b10o9b4o106b8o6b12o3b14o2b3i8b3ob3i10b6i10b3ob3i8b3o2b14o3b12o6b8o103b10o5b12o3b14ob3i10b6i10b6i10b6i10b3ob14o3b12o5b10o102b10o4b14ob19i10b5i12b4i12b5i10b19ob14o4b10o101b4o4b4o3b14ob18i5b2i5b4i5b2i5b4i5b2i5b4i5b2i5b18ob14o3b4o4b4o100b4o4b4o3b14ob18i4b4i4b4i4b4i4b4i4b4i4b4i4b4i4b18ob14o3b4o4b4o100b4o4b4o3b14ob18i4b4i4b4i4b4i4b4i4b4i4b4i4b4i4b18ob14o3b4o4b4o100b4o4b4o3b14ob18i5b2i5b4i5b2i5b4i5b2i5b4i5b2i5b18ob14o3b4o4b4o101b10o4b14ob19i10b5i12b4i12b5i10b19ob14o4b10o102b10o5b12o3b14ob3i10b6i10b6i10b6i10b3ob14o3b12o5b10o103b8o6b12o3b14o2b3i8b3ob3i10b6i10b3ob3i8b3o2b14o3b12o6b8o106b4o9b10o5b12o3b5i4b5o2b4i6b4o2b4i6b4o2b5i4b5o3b12o5b10o9b4o123b6o8b10o5b12o4b12o4b12o4b12o5b10o8b6o154b6o9b8o7b10o6b10o7b8o9b6o85",
+				[16] = "o85b6o9b8o7b10o6b10o7b8o9b6o154b6o8b10o5b12o4b5i2b5o4b5i2b5o4b12o5b10o8b6o123b4o9b10o5b12o3b4i6b4o2b3i8b3o2b3i8b3o2b4i6b4o3b12o5b10o9b4o106b8o6b12o3b5i4b5o2b3i8b3ob3i10b6i10b3ob3i8b3o2b5i4b5o3b12o6b8o103b10o5b12o3b4i6b4ob3i10b5i12b4i12b5i10b3ob4i6b4o3b12o5b10o102b10o4b14ob4i2b4i2b6i12b4i12b4i12b4i12b6i2b4i2b4ob14o4b10o101b4o4b4o3b14ob3i2b6i2b5i5b2i5b4i12b4i12b4i5b2i5b5i2b6i2b3ob14o3b4o4b4o100b4o4b4o3b14ob3i2b6i2b5i4b4i4b3i6b2i6b2i6b2i6b3i4b4i4b5i2b6i2b3ob14o3b4o4b4o100b4o4b4o3b14ob3i2b6i2b5i4b4i4b3i6b2i6b2i6b2i6b3i4b4i4b5i2b6i2b3ob14o3b4o4b4o100b4o4b4o3b14ob3i2b6i2b5i5b2i5b4i12b4i12b4i5b2i5b5i2b6i2b3ob14o3b4o4b4o101b10o4b14ob4i2b4i2b6i12b4i12b4i12b4i12b6i2b4i2b4ob14o4b10o102b10o5b12o3b4i6b4ob3i10b5i12b4i12b5i10b3ob4i6b4o3b12o5b10o103b8o6b12o3b5i4b5o2b3i8b3ob3i10b6i10b3ob3i8b3o2b5i4b5o3b12o6b8o106b4o9b10o5b12o3b4i6b4o2b3i8b3o2b3i8b3o2b4i6b4o3b12o5b10o9b4o123b6o8b10o5b12o4b5i2b5o4b5i2b5o4b12o5b10o8b6o154b6o9b8o7b10o6b10o7b8o9b6o85",
+				[24] = "o85b6o9b8o7b10o6b10o7b8o9b6o154b6o8b10o5b12o4b4i4b4o4b4i4b4o4b12o5b10o8b6o123b4o9b10o5b12o3b4i6b4o2b3i8b3o2b3i8b3o2b4i6b4o3b12o5b10o9b4o106b8o6b12o3b4i6b4o2b2i10b2ob3i10b6i10b3ob2i10b2o2b4i6b4o3b12o6b8o103b10o5b12o3b3i8b3ob3i10b5i12b4i12b5i10b3ob3i8b3o3b12o5b10o102b10o4b14ob3i4b2i4b5i12b4i12b4i12b4i12b5i4b2i4b3ob14o4b10o101b4o4b4o3b14ob3i3b4i3b5i5b2i5b3i14b2i14b3i5b2i5b5i3b4i3b3ob14o3b4o4b4o100b4o4b4o3b14ob3i2b6i2b5i4b4i4b3i6b2i6b2i6b2i6b3i4b4i4b5i2b6i2b3ob14o3b4o4b4o100b4o4b4o3b14ob3i2b6i2b5i4b4i4b3i6b2i6b2i6b2i6b3i4b4i4b5i2b6i2b3ob14o3b4o4b4o100b4o4b4o3b14ob3i3b4i3b5i5b2i5b3i14b2i14b3i5b2i5b5i3b4i3b3ob14o3b4o4b4o101b10o4b14ob3i4b2i4b5i12b4i12b4i12b4i12b5i4b2i4b3ob14o4b10o102b10o5b12o3b3i8b3ob3i10b5i12b4i12b5i10b3ob3i8b3o3b12o5b10o103b8o6b12o3b4i6b4o2b2i10b2ob3i10b6i10b3ob2i10b2o2b4i6b4o3b12o6b8o106b4o9b10o5b12o3b4i6b4o2b3i8b3o2b3i8b3o2b4i6b4o3b12o5b10o9b4o123b6o8b10o5b12o4b4i4b4o4b4i4b4o4b12o5b10o8b6o154b6o9b8o7b10o6b10o7b8o9b6o85",
+				[32] = "o85b6o9b8o7b10o6b10o7b8o9b6o154b6o8b10o5b12o4b4i4b4o4b4i4b4o4b12o5b10o8b6o123b4o9b10o5b12o3b4i6b4o2b3i8b3o2b3i8b3o2b4i6b4o3b12o5b10o9b4o106b8o6b12o3b4i6b4o2b2i10b2ob3i10b6i10b3ob2i10b2o2b4i6b4o3b12o6b8o103b10o5b12o3b3i8b3ob3i10b5i12b4i12b5i10b3ob3i8b3o3b12o5b10o102b10o4b14ob3i4b2i4b5i12b4i12b4i12b4i12b5i4b2i4b3ob14o4b10o101b4o4b4o3b14ob3i3b4i3b5i12b3i14b2i14b3i12b5i3b4i3b3ob14o3b4o4b4o100b4o4b4o3b14ob3i2b6i2b5i5b2i5b3i6b2i6b2i6b2i6b3i5b2i5b5i2b6i2b3ob14o3b4o4b4o100b4o4b4o3b14ob3i2b6i2b5i5b2i5b3i6b2i6b2i6b2i6b3i5b2i5b5i2b6i2b3ob14o3b4o4b4o100b4o4b4o3b14ob3i3b4i3b5i12b3i14b2i14b3i12b5i3b4i3b3ob14o3b4o4b4o101b10o4b14ob3i4b2i4b5i12b4i12b4i12b4i12b5i4b2i4b3ob14o4b10o102b10o5b12o3b3i8b3ob3i10b5i12b4i12b5i10b3ob3i8b3o3b12o5b10o103b8o6b12o3b4i6b4o2b2i10b2ob3i10b6i10b3ob2i10b2o2b4i6b4o3b12o6b8o106b4o9b10o5b12o3b4i6b4o2b3i8b3o2b3i8b3o2b4i6b4o3b12o5b10o9b4o123b6o8b10o5b12o4b4i4b4o4b4i4b4o4b12o5b10o8b6o154b6o9b8o7b10o6b10o7b8o9b6o85",
+				[48] = "o85b6o9b8o7b10o6b10o7b8o9b6o154b6o8b10o5b5i2b5o4b4i4b4o4b4i4b4o4b5i2b5o5b10o8b6o123b4o9b10o5b5i2b5o3b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o3b5i2b5o5b10o9b4o106b8o6b12o3b4i6b4o2b2i10b2ob3i10b6i10b3ob2i10b2o2b4i6b4o3b12o6b8o103b10o5b12o3b3i8b3ob2i12b4i12b4i12b4i12b2ob3i8b3o3b12o5b10o102b10o4b14ob3i10b5i12b4i12b4i12b4i12b5i10b3ob14o4b10o101b4o4b4o3b14ob3i3b4i3b5i12b3i14b2i14b3i12b5i3b4i3b3ob14o3b4o4b4o100b4o4b4o3b14ob2i4b4i4b3i6b2i6b2i6b2i6b2i6b2i6b2i6b2i6b3i4b4i4b2ob14o3b4o4b4o100b4o4b4o3b14ob2i4b4i4b3i6b2i6b2i6b2i6b2i6b2i6b2i6b2i6b3i4b4i4b2ob14o3b4o4b4o100b4o4b4o3b14ob3i3b4i3b5i12b3i14b2i14b3i12b5i3b4i3b3ob14o3b4o4b4o101b10o4b14ob3i10b5i12b4i12b4i12b4i12b5i10b3ob14o4b10o102b10o5b12o3b3i8b3ob2i12b4i12b4i12b4i12b2ob3i8b3o3b12o5b10o103b8o6b12o3b4i6b4o2b2i10b2ob3i10b6i10b3ob2i10b2o2b4i6b4o3b12o6b8o106b4o9b10o5b5i2b5o3b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o3b5i2b5o5b10o9b4o123b6o8b10o5b5i2b5o4b4i4b4o4b4i4b4o4b5i2b5o5b10o8b6o154b6o9b8o7b10o6b10o7b8o9b6o85",
+				[64] = "o85b6o9b8o7b10o6b10o7b8o9b6o154b6o8b10o5b5i2b5o4b3i6b3o4b3i6b3o4b5i2b5o5b10o8b6o123b4o9b10o5b5i2b5o3b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o3b5i2b5o5b10o9b4o106b8o6b12o3b4i6b4o2b2i10b2ob3i10b6i10b3ob2i10b2o2b4i6b4o3b12o6b8o103b10o5b12o3b3i8b3ob2i12b4i12b4i12b4i12b2ob3i8b3o3b12o5b10o102b10o4b14ob3i10b5i12b3i14b2i14b3i12b5i10b3ob14o4b10o101b4o4b4o3b14ob3i3b4i3b5i12b3i14b2i14b3i12b5i3b4i3b3ob14o3b4o4b4o100b4o4b4o3b14ob2i4b4i4b3i6b2i6b2i6b2i6b2i6b2i6b2i6b2i6b3i4b4i4b2ob14o3b4o4b4o100b4o4b4o3b14ob2i4b4i4b3i6b2i6b2i6b2i6b2i6b2i6b2i6b2i6b3i4b4i4b2ob14o3b4o4b4o100b4o4b4o3b14ob3i3b4i3b5i12b3i14b2i14b3i12b5i3b4i3b3ob14o3b4o4b4o101b10o4b14ob3i10b5i12b3i14b2i14b3i12b5i10b3ob14o4b10o102b10o5b12o3b3i8b3ob2i12b4i12b4i12b4i12b2ob3i8b3o3b12o5b10o103b8o6b12o3b4i6b4o2b2i10b2ob3i10b6i10b3ob2i10b2o2b4i6b4o3b12o6b8o106b4o9b10o5b5i2b5o3b3i8b3o2b3i8b3o2b3i8b3o2b3i8b3o3b5i2b5o5b10o9b4o123b6o8b10o5b5i2b5o4b3i6b3o4b3i6b3o4b5i2b5o5b10o8b6o154b6o9b8o7b10o6b10o7b8o9b6o85",
+			},
+			extent = 2.0,
+			sizes = {
+				3,
+				4,
+				6,
+				8,
+				12,
+				16,
+				24,
+				32,
+				48,
+				64,
+			},
+		},
+		Wedge = {
+			cells = {
+				[3] = "b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14",
+				[12] = "b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b4i3b6o3b4i2b6o4b4ib6o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b4i3b6o3b4i2b6o4b4ib6o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b4i3b6o3b4i2b6o4b4ib6o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b4i3b6o3b4i2b6o4b4ib6o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b4i3b6o3b4i2b6o4b4ib6o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b4i3b6o3b4i2b6o4b4ib6o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b4i3b6o3b4i2b6o4b4ib6o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b4i3b6o3b4i2b6o4b4ib6o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b4i3b6o3b4i2b6o4b4ib6o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b4i3b6o3b4i2b6o4b4ib6o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b4i3b6o3b4i2b6o4b4ib6o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b4i3b6o3b4i2b6o4b4ib6o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14",
+				[16] = "b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b4i4b5o3b4i3b5o4b4i2b5o5b4ib5o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b4i4b5o3b4i3b5o4b4i2b5o5b4ib5o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b4i4b5o3b4i3b5o4b4i2b5o5b4ib5o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b4i4b5o3b4i3b5o4b4i2b5o5b4ib5o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b4i4b5o3b4i3b5o4b4i2b5o5b4ib5o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b4i4b5o3b4i3b5o4b4i2b5o5b4ib5o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b4i4b5o3b4i3b5o4b4i2b5o5b4ib5o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b4i4b5o3b4i3b5o4b4i2b5o5b4ib5o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b4i4b5o3b4i3b5o4b4i2b5o5b4ib5o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b4i4b5o3b4i3b5o4b4i2b5o5b4ib5o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b4i4b5o3b4i3b5o4b4i2b5o5b4ib5o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b4i4b5o3b4i3b5o4b4i2b5o5b4ib5o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14",
+				[24] = "b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob3i6b5o2b3i5b5o3b3i4b5o4b3i3b5o5b3i2b5o6b3ib5o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob3i6b5o2b3i5b5o3b3i4b5o4b3i3b5o5b3i2b5o6b3ib5o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob3i6b5o2b3i5b5o3b3i4b5o4b3i3b5o5b3i2b5o6b3ib5o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob3i6b5o2b3i5b5o3b3i4b5o4b3i3b5o5b3i2b5o6b3ib5o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob3i6b5o2b3i5b5o3b3i4b5o4b3i3b5o5b3i2b5o6b3ib5o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob3i6b5o2b3i5b5o3b3i4b5o4b3i3b5o5b3i2b5o6b3ib5o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob3i6b5o2b3i5b5o3b3i4b5o4b3i3b5o5b3i2b5o6b3ib5o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob3i6b5o2b3i5b5o3b3i4b5o4b3i3b5o5b3i2b5o6b3ib5o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob3i6b5o2b3i5b5o3b3i4b5o4b3i3b5o5b3i2b5o6b3ib5o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob3i6b5o2b3i5b5o3b3i4b5o4b3i3b5o5b3i2b5o6b3ib5o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob3i6b5o2b3i5b5o3b3i4b5o4b3i3b5o5b3i2b5o6b3ib5o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob3i6b5o2b3i5b5o3b3i4b5o4b3i3b5o5b3i2b5o6b3ib5o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14",
+				[32] = "b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob3i7b4o2b3i6b4o3b3i5b4o4b3i4b4o5b3i3b4o6b3i2b4o7b3ib4o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob3i7b4o2b3i6b4o3b3i5b4o4b3i4b4o5b3i3b4o6b3i2b4o7b3ib4o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob3i7b4o2b3i6b4o3b3i5b4o4b3i4b4o5b3i3b4o6b3i2b4o7b3ib4o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob3i7b4o2b3i6b4o3b3i5b4o4b3i4b4o5b3i3b4o6b3i2b4o7b3ib4o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob3i7b4o2b3i6b4o3b3i5b4o4b3i4b4o5b3i3b4o6b3i2b4o7b3ib4o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob3i7b4o2b3i6b4o3b3i5b4o4b3i4b4o5b3i3b4o6b3i2b4o7b3ib4o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob3i7b4o2b3i6b4o3b3i5b4o4b3i4b4o5b3i3b4o6b3i2b4o7b3ib4o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob3i7b4o2b3i6b4o3b3i5b4o4b3i4b4o5b3i3b4o6b3i2b4o7b3ib4o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob3i7b4o2b3i6b4o3b3i5b4o4b3i4b4o5b3i3b4o6b3i2b4o7b3ib4o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob3i7b4o2b3i6b4o3b3i5b4o4b3i4b4o5b3i3b4o6b3i2b4o7b3ib4o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob3i7b4o2b3i6b4o3b3i5b4o4b3i4b4o5b3i3b4o6b3i2b4o7b3ib4o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob3i7b4o2b3i6b4o3b3i5b4o4b3i4b4o5b3i3b4o6b3i2b4o7b3ib4o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob3i7b4o2b3i6b4o3b3i5b4o4b3i4b4o5b3i3b4o6b3i2b4o7b3ib4o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob3i7b4o2b3i6b4o3b3i5b4o4b3i4b4o5b3i3b4o6b3i2b4o7b3ib4o8b7o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14",
+				[48] = "b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14b34i9b4ob2i8b4o2b2i7b4o3b2i6b4o4b2i5b4o5b2i4b4o6b2i3b4o7b2i2b4o8b2ib4o9b6o10b5o11b4o12b3o13b2o14b34i9b4ob2i8b4o2b2i7b4o3b2i6b4o4b2i5b4o5b2i4b4o6b2i3b4o7b2i2b4o8b2ib4o9b6o10b5o11b4o12b3o13b2o14b34i9b4ob2i8b4o2b2i7b4o3b2i6b4o4b2i5b4o5b2i4b4o6b2i3b4o7b2i2b4o8b2ib4o9b6o10b5o11b4o12b3o13b2o14b34i9b4ob2i8b4o2b2i7b4o3b2i6b4o4b2i5b4o5b2i4b4o6b2i3b4o7b2i2b4o8b2ib4o9b6o10b5o11b4o12b3o13b2o14b34i9b4ob2i8b4o2b2i7b4o3b2i6b4o4b2i5b4o5b2i4b4o6b2i3b4o7b2i2b4o8b2ib4o9b6o10b5o11b4o12b3o13b2o14b34i9b4ob2i8b4o2b2i7b4o3b2i6b4o4b2i5b4o5b2i4b4o6b2i3b4o7b2i2b4o8b2ib4o9b6o10b5o11b4o12b3o13b2o14b34i9b4ob2i8b4o2b2i7b4o3b2i6b4o4b2i5b4o5b2i4b4o6b2i3b4o7b2i2b4o8b2ib4o9b6o10b5o11b4o12b3o13b2o14b34i9b4ob2i8b4o2b2i7b4o3b2i6b4o4b2i5b4o5b2i4b4o6b2i3b4o7b2i2b4o8b2ib4o9b6o10b5o11b4o12b3o13b2o14b34i9b4ob2i8b4o2b2i7b4o3b2i6b4o4b2i5b4o5b2i4b4o6b2i3b4o7b2i2b4o8b2ib4o9b6o10b5o11b4o12b3o13b2o14b34i9b4ob2i8b4o2b2i7b4o3b2i6b4o4b2i5b4o5b2i4b4o6b2i3b4o7b2i2b4o8b2ib4o9b6o10b5o11b4o12b3o13b2o14b34i9b4ob2i8b4o2b2i7b4o3b2i6b4o4b2i5b4o5b2i4b4o6b2i3b4o7b2i2b4o8b2ib4o9b6o10b5o11b4o12b3o13b2o14b34i9b4ob2i8b4o2b2i7b4o3b2i6b4o4b2i5b4o5b2i4b4o6b2i3b4o7b2i2b4o8b2ib4o9b6o10b5o11b4o12b3o13b2o14b34i9b4ob2i8b4o2b2i7b4o3b2i6b4o4b2i5b4o5b2i4b4o6b2i3b4o7b2i2b4o8b2ib4o9b6o10b5o11b4o12b3o13b2o14b34i9b4ob2i8b4o2b2i7b4o3b2i6b4o4b2i5b4o5b2i4b4o6b2i3b4o7b2i2b4o8b2ib4o9b6o10b5o11b4o12b3o13b2o14b47ob14o2b13o3b12o4b11o5b10o6b9o7b8o8b7o9b6o10b5o11b4o12b3o13b2o14",
+			},
+			extent = 1.0,
+			sizes = {
+				3,
+				12,
+				16,
+				24,
+				32,
+				48,
+			},
+		},
+		ZigZag = {
+			cells = {
+				[3] = "o6b10o6b10o6b10o6b10o6b10o5b11o4b11o4b11o4b11o4b11o4b11o5b10o6b10o6b10o6b10o6b10o12b10o6b10o6b10o6b10o6b10o5b11o4b11o4b11o4b11o4b11o4b11o5b10o6b10o6b10o6b10o6b10o12b10o6b10o6b10o6b10o6b10o5b11o4b11o4b11o4b11o4b11o4b11o5b10o6b10o6b10o6b10o6b10o12b10o6b10o6b10o6b10o6b10o5b11o4b11o4b11o4b11o4b11o4b11o5b10o6b10o6b10o6b10o6b10o12b10o6b10o6b10o6b10o6b10o5b11o4b11o4b11o4b11o4b11o4b11o5b10o6b10o6b10o6b10o6b10o12b10o6b10o6b10o6b10o6b10o5b11o4b11o4b11o4b11o4b11o4b11o5b10o6b10o6b10o6b10o6b10o12b10o6b10o6b10o6b10o6b10o5b11o4b11o4b11o4b11o4b11o4b11o5b10o6b10o6b10o6b10o6b10o12b10o6b10o6b10o6b10o6b10o5b11o4b11o4b11o4b11o4b11o4b11o5b10o6b10o6b10o6b10o6b10o12b10o6b10o6b10o6b10o6b10o5b11o4b11o4b11o4b11o4b11o4b11o5b10o6b10o6b10o6b10o6b10o12b10o6b10o6b10o6b10o6b10o5b11o4b11o4b11o4b11o4b11o4b11o5b10o6b10o6b10o6b10o6b10o12b10o6b10o6b10o6b10o6b10o5b11o4b11o4b11o4b11o4b11o4b11o5b10o6b10o6b10o6b10o6b10o12b10o6b10o6b10o6b10o6b10o5b11o4b11o4b11o4b11o4b11o4b11o5b10o6b10o6b10o6b10o6b10o12b10o6b10o6b10o6b10o6b10o5b11o4b11o4b11o4b11o4b11o4b11o5b10o6b10o6b10o6b10o6b10o12b10o6b10o6b10o6b10o6b10o5b11o4b11o4b11o4b11o4b11o4b11o5b10o6b10o6b10o6b10o6b10o12b10o6b10o6b10o6b10o6b10o5b11o4b11o4b11o4b11o4b11o4b11o5b10o6b10o6b10o6b10o6b10o12b10o6b10o6b10o6b10o6b10o5b11o4b11o4b11o4b11o4b11o4b11o5b10o6b10o6b10o6b10o6b10o6",
+			},
+			extent = 1.0,
+			sizes = {
+				3,
+			},
+		},
+	},
+}
+
+return BrushOctantTables
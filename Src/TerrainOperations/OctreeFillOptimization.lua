@@ -10,17 +10,21 @@
 	3. Octants fully OUTSIDE the brush → Skip entirely
 	4. Octants on the BOUNDARY → Recurse or per-voxel
 	
+	OCTANT CLASSIFICATION:
+	- Uniform brushes (one cursor size) above size 2, not hollow, look octants up in
+	  BrushOctantTables, generated by terrain-tiles/analyze_brushes.py. Its cells are
+	  proven inside (Add: occupancy 1, Subtract: at least 1 - one256th) or outside
+	  (occupancy 0) everywhere, so FillBlock and skipping match the per-voxel path.
+	- Other brushes fall back to checking the 8 corners.
+	
 	KNOWN ISSUES:
-	- Corner-checking doesn't guarantee octant interior values
-	- Thresholds need proper derivation from OperationHelper.one256th
+	- Corner-checking doesn't guarantee octant interior values (fallback only)
+	- Add's FillBlock replaces the material of voxels that were already solid
 	- Some brush shapes have sharp internal features (Spikepad cones)
-	- Smooth boundary transitions may be lost
 	
 	TODO before production use:
-	1. Use OperationHelper.one256th for air threshold
-	2. For solid threshold, must verify brush SDF properties
-	3. Add center-point sampling, not just corners
-	4. Test thoroughly with all brush shapes
+	1. Derive tables for non-uniform sizes, hollow brushes and falloff
+	2. Test thoroughly with all brush shapes
 	
 	ONLY works for Add/Subtract because:
 	- Add: setting occupancy to 1 is the same regardless of existing value
@@ -29,6 +33,7 @@
 ]]
 
 local Constants = require(script.Parent.Parent.Util.Constants)
+local BrushOctantTables = require(script.Parent.BrushOctantTables)
 local OperationHelper = require(script.Parent.OperationHelper)
 
 local VOXEL_SIZE = Constants.VOXEL_RESOLUTION -- 4 studs
@@ -44,7 +49,20 @@ local SDF_AIR_THRESHOLD = OperationHelper.one256th -- 1/256 ≈ 0.0039
 -- This needs proper analysis of each brush shape's SDF characteristics
 local SDF_SOLID_THRESHOLD = 1.0 -- Only treat as solid if EXACTLY 1.0
 
+-- Brush-local slack (in radii) for octant lookups, covering float32 CFrame and Vector3 math
+local TABLE_LOOKUP_PADDING = 1e-3
+
 export type SDFFunction = (worldPos: Vector3) -> number
+export type Classification = "inside" | "outside" | "boundary"
+export type ClassifyFunction = (center: Vector3, halfSize: number) -> Classification
+
+type BoxCounts = {
+	notInside: { number },
+	notOutside: { number },
+}
+
+-- Summed-volume tables per shape, size and operation, decoded on first use
+local boxCountsCache: { [string]: BoxCounts } = {}
 
 local OctreeFill = {}
 
@@ -52,7 +70,7 @@ local OctreeFill = {}
 	Check if all 8 corners of a cube are above/below thresholds
 	Returns: "inside" | "outside" | "boundary"
 ]]
-local function classifyOctant(sdfFunc: SDFFunction, center: Vector3, halfSize: number): "inside" | "outside" | "boundary"
+local function classifyOctant(sdfFunc: SDFFunction, center: Vector3, halfSize: number): Classification
 	local allInside = true
 	local allOutside = true
 
@@ -87,11 +105,173 @@ local function classifyOctant(sdfFunc: SDFFunction, center: Vector3, halfSize: n
 	end
 end
 
+--[[
+	Decode a run-length encoded lattice (a code, then its run length if above 1)
+	into summed-volume tables of the cells that aren't inside and aren't outside.
+	Codes: o outside, b boundary, s inside for Subtract only, i inside for both
+]]
+local function getBoxCounts(brushShape: string, size: number, isSubtract: boolean): BoxCounts
+	local key = brushShape .. ":" .. size .. (isSubtract and ":subtract" or ":add")
+	local cached = boxCountsCache[key]
+	if cached then
+		return cached
+	end
+
+	local resolution = BrushOctantTables.resolution
+	local stride = resolution + 1
+	local codes = table.create(resolution * resolution * resolution)
+	for code, count in string.gmatch(BrushOctantTables.shapes[brushShape].cells[size], "(%a)(%d*)") do
+		for _ = 1, tonumber(count) or 1 do
+			table.insert(codes, code)
+		end
+	end
+
+	-- counts[index(i, j, k)] = matching cells with x < i, y < j, z < k
+	local notInside = table.create(stride * stride * stride, 0)
+	local notOutside = table.create(stride * stride * stride, 0)
+	local function index(i: number, j: number, k: number): number
+		return (i * stride + j) * stride + k + 1
+	end
+	local function accumulate(counts: { number }, i: number, j: number, k: number, value: number)
+		counts[index(i, j, k)] = value
+			+ counts[index(i - 1, j, k)]
+			+ counts[index(i, j - 1, k)]
+			+ counts[index(i, j, k - 1)]
+			- counts[index(i - 1, j - 1, k)]
+			- counts[index(i - 1, j, k - 1)]
+			- counts[index(i, j - 1, k - 1)]
+			+ counts[index(i - 1, j - 1, k - 1)]
+	end
+
+	local cell = 0
+	for i = 1, resolution do
+		for j = 1, resolution do
+			for k = 1, resolution do
+				cell += 1
+				local code = codes[cell]
+				local inside = code == "i" or (isSubtract and code == "s")
+				accumulate(notInside, i, j, k, inside and 0 or 1)
+				accumulate(notOutside, i, j, k, code == "o" and 0 or 1)
+			end
+		end
+	end
+
+	local boxCounts = { notInside = notInside, notOutside = notOutside }
+	boxCountsCache[key] = boxCounts
+	return boxCounts
+end
+
+-- Cells counted in the inclusive lattice box [i0, i1] x [j0, j1] x [k0, k1] (0-based)
+local function countInBox(
+	counts: { number },
+	stride: number,
+	i0: number,
+	i1: number,
+	j0: number,
+	j1: number,
+	k0: number,
+	k1: number
+): number
+	local function at(i: number, j: number, k: number): number
+		return counts[(i * stride + j) * stride + k + 1]
+	end
+	i1 += 1
+	j1 += 1
+	k1 += 1
+	return at(i1, j1, k1)
+		- at(i0, j1, k1)
+		- at(i1, j0, k1)
+		- at(i1, j1, k0)
+		+ at(i0, j0, k1)
+		+ at(i0, j1, k0)
+		+ at(i1, j0, k0)
+		- at(i0, j0, k0)
+end
+
+--[[
+	Create a classifier that looks octants up in BrushOctantTables
+	
+	The octant's brush-local bounding box is compared with the lattice cells it
+	touches. Tables are derived for a few sizes; a brush uses the largest one not
+	above its size, which is safe since inside cells only grow with size and
+	outside cells don't change.
+	
+	Returns nil if the brush isn't covered (no table, non-uniform size, hollow,
+	or size 2 and below, where the whole brush is solid)
+]]
+function OctreeFill.createTableClassifier(opSet: any, isSubtract: boolean): ClassifyFunction?
+	local shapeTables = BrushOctantTables.shapes[opSet.brushShape]
+	local size = opSet.cursorSizeX or opSet.cursorSize
+	local sizeY = opSet.cursorSizeY or opSet.cursorHeight or opSet.cursorSize
+	local sizeZ = opSet.cursorSizeZ or opSet.cursorSize
+	if not shapeTables or opSet.hollowEnabled or sizeY ~= size or sizeZ ~= size or size < shapeTables.sizes[1] then
+		return nil
+	end
+
+	local tableSize = shapeTables.sizes[1]
+	for _, candidate in shapeTables.sizes do
+		if candidate <= size then
+			tableSize = candidate
+		end
+	end
+	local boxCounts = getBoxCounts(opSet.brushShape, tableSize, isSubtract)
+
+	local resolution = BrushOctantTables.resolution
+	local stride = resolution + 1
+	local extent = shapeTables.extent
+	local cellSize = 2 * extent / resolution
+	local radius = size * VOXEL_SIZE * 0.5
+	local centerPoint = opSet.centerPoint
+	local brushRotation = opSet.brushRotation or CFrame.new()
+	local inverseRotation = brushRotation:Inverse()
+
+	-- Half extent of a rotated unit cube along each brush-local axis
+	local function spread(axis: Vector3): number
+		return math.abs(axis.X) + math.abs(axis.Y) + math.abs(axis.Z)
+	end
+	local unitSpread = Vector3.new(spread(brushRotation.XVector), spread(brushRotation.YVector), spread(brushRotation.ZVector))
+
+	local function cellIndex(value: number): number
+		return math.clamp(math.floor((value + extent) / cellSize), 0, resolution - 1)
+	end
+
+	return function(center: Vector3, halfSize: number): Classification
+		-- Same transform as calculateBrushPowerForCellRotated
+		local localCenter = inverseRotation * (center - centerPoint)
+		local reach = unitSpread * halfSize
+		local low = (localCenter - reach) / radius - Vector3.one * TABLE_LOOKUP_PADDING
+		local high = (localCenter + reach) / radius + Vector3.one * TABLE_LOOKUP_PADDING
+
+		if high.X < -extent or high.Y < -extent or high.Z < -extent or low.X > extent or low.Y > extent or low.Z > extent then
+			return "outside"
+		end
+
+		local i0, i1 = cellIndex(low.X), cellIndex(high.X)
+		local j0, j1 = cellIndex(low.Y), cellIndex(high.Y)
+		local k0, k1 = cellIndex(low.Z), cellIndex(high.Z)
+		local withinLattice = low.X >= -extent
+			and low.Y >= -extent
+			and low.Z >= -extent
+			and high.X <= extent
+			and high.Y <= extent
+			and high.Z <= extent
+
+		if withinLattice and countInBox(boxCounts.notInside, stride, i0, i1, j0, j1, k0, k1) == 0 then
+			return "inside"
+		end
+		if countInBox(boxCounts.notOutside, stride, i0, i1, j0, j1, k0, k1) == 0 then
+			return "outside"
+		end
+		return "boundary"
+	end
+end
+
 --[[
 	Recursively fill using octree decomposition
 	
 	@param terrain - Terrain instance
 	@param sdfFunc - Function that returns brush occupancy at world position (0-1)
+	@param classify - Function that classifies an octant as inside, outside or boundary
 	@param center - Center of current octant (world coordinates)
 	@param size - Size of current octant (studs)
 	@param material - Material to fill with (for Add) or Air (for Subtract)
@@ -100,13 +280,14 @@ end
 local function fillOctantRecursive(
 	terrain: Terrain,
 	sdfFunc: SDFFunction,
+	classify: ClassifyFunction,
 	center: Vector3,
 	size: number,
 	material: Enum.Material,
 	boundaryVoxels: { Vector3 }
 )
 	local halfSize = size * 0.5
-	local classification = classifyOctant(sdfFunc, center, halfSize)
+	local classification = classify(center, halfSize)
 
 	if classification == "inside" then
 		-- This entire octant is fully inside the brush - use FillBlock
@@ -127,7 +308,7 @@ local function fillOctantRecursive(
 			for dy = -1, 1, 2 do
 				for dz = -1, 1, 2 do
 					local childCenter = center + Vector3.new(dx * quarterSize, dy * quarterSize, dz * quarterSize)
-					fillOctantRecursive(terrain, sdfFunc, childCenter, halfSize, material, boundaryVoxels)
+					fillOctantRecursive(terrain, sdfFunc, classify, childCenter, halfSize, material, boundaryVoxels)
 				end
 			end
 		end
@@ -182,7 +363,13 @@ function OctreeFill.fill(
 	local material = isSubtract and Enum.Material.Air or opSet.material
 	local boundaryVoxels: { Vector3 } = {}
 
-	fillOctantRecursive(terrain, sdfFunc, centerPoint, rootSize, material, boundaryVoxels)
+	-- Proven classifications where the brush has a table, corner checks otherwise
+	local classify = OctreeFill.createTableClassifier(opSet, isSubtract)
+		or function(center: Vector3, halfSize: number): Classification
+			return classifyOctant(sdfFunc, center, halfSize)
+		end
+
+	fillOctantRecursive(terrain, sdfFunc, classify, centerPoint, rootSize, material, boundaryVoxels)
 
 	return boundaryVoxels
 end
@@ -0,0 +1,566 @@
+"""
+Brush Octant Analyzer
+Derives which parts of each brush shape OctreeFillOptimization may FillBlock
+or skip, and writes them to Src/TerrainOperations/BrushOctantTables.lua.
+
+Usage:
+    python analyze_brushes.py                      # Analyze, verify, simulate, write the tables
+    python analyze_brushes.py --shapes Sphere Torus --rotations 16
+    python analyze_brushes.py --no-write           # Report only
+
+For an octant, Add and Subtract only reduce to one FillBlock call if the
+per-voxel path would write the same thing everywhere in it:
+    - Add writes occupancy max(cell, brush), so the brush must be 1.
+    - Subtract turns a voxel to air once 1 - brush <= 1/256.
+    - Both leave a voxel alone where the brush is 0. Outside the shape
+      it is exactly 0; inside it is at least 0.01.
+Each brush is analyzed in its local space, scaled by its radius, on a
+RESOLUTION^3 lattice. For every shape a margin function is derived from
+calculateBrushPowerForCellAxisAligned's formulas, positive where a
+condition holds, with a known Lipschitz bound L. If the margin at a cell's
+center exceeds L times the cell's half-diagonal, the condition holds on the
+whole cell. That is a proof, not a sample. Those cells are then checked
+against a NumPy port of the Lua at dense sample points. The check also
+covers every brush size each table is used for (inside grows with size,
+outside doesn't change), and a simulated octree at random rotations,
+compared with the corner check OctreeFill uses today.
+
+The tables cover uniform brushes (one cursor size) above size 2, not
+hollow, with no falloff extent, which is what OctreeFill.createSDFForBrush
+evaluates. OctreeFill falls back to its corner check for anything else.
+
+Requires: NumPy (pip install numpy)
+"""
+
+import argparse
+import math
+import sys
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    print("NumPy is required. Run: pip install numpy")
+    sys.exit(1)
+
+from tile_luau import write_module
+
+VOXEL_RESOLUTION = 4
+ONE_256TH = 1 / 256
+MIN_OCTANT_SIZE = VOXEL_RESOLUTION * 2
+
+# Lattice cells per axis over each shape's extent
+RESOLUTION = 16
+
+# Brush sizes tables are derived for; a brush uses the largest one not above its size
+SIZE_BUCKETS = (3, 4, 6, 8, 12, 16, 24, 32, 48, 64)
+MAX_BRUSH_SIZE = 64
+
+# Brush occupancy an operation needs everywhere in an octant to FillBlock it
+THRESHOLDS = {"add": 1.0, "subtract": 1 - ONE_256TH}
+
+# Lattice codes
+OUTSIDE, BOUNDARY, SUBTRACT_INSIDE, INSIDE = "o", "b", "s", "i"
+
+# Dense samples per cell axis when verifying
+VERIFY_SAMPLES = 4
+
+SIMULATION_SIZES = (6, 16, 40)
+
+# Matches OctreeFill's TABLE_LOOKUP_PADDING (brush-local radii)
+LOOKUP_PADDING = 1e-3
+
+
+def brush_occupancy(shape: str, x, y, z, rx: float, ry: float, rz: float, selection_size: float) -> np.ndarray:
+    """
+    calculateBrushPowerForCellAxisAligned's brushOccupancy over arrays of
+    brush-local offsets, without hollow and falloff extent.
+    """
+    x, y, z = np.broadcast_arrays(*(np.asarray(value, dtype=np.float64) for value in (x, y, z)))
+    if selection_size <= 2:
+        return np.ones(x.shape)
+    a = (rx + ry + rz) / 3 / VOXEL_RESOLUTION
+    
+    def inside_floor(condition, occupancy):
+        return np.where(condition, np.maximum(0.01, np.minimum(1, occupancy)), 0.0)
+    
+    if shape == "Sphere" or shape == "Dome":
+        d = np.sqrt((x / rx) ** 2 + (y / ry) ** 2 + (z / rz) ** 2)
+        inside = d <= 1 if shape == "Sphere" else (y >= 0) & (d <= 1)
+        return inside_floor(inside, (1 - d) * a)
+    if shape == "Cylinder":
+        radial = np.sqrt((x / rx) ** 2 + (z / rz) ** 2)
+        return inside_floor((np.abs(y) / ry <= 1) & (radial <= 1), (1 - radial) * rx / VOXEL_RESOLUTION)
+    if shape == "Cube" or shape == "Spinner":
+        m = np.maximum.reduce([np.abs(x) / rx, np.abs(y) / ry, np.abs(z) / rz])
+        return inside_floor(m <= 1, (1 - m) * a)
+    if shape == "Wedge":
+        nx, ny, nz = np.abs(x) / rx, (y + ry) / (2 * ry), (z + rz) / (2 * rz)
+        max_y = 1 - nz
+        inside = (nx <= 1) & (ny >= 0) & (ny <= max_y) & (nz >= 0) & (nz <= 1)
+        edge = np.minimum.reduce([1 - nx, ny, max_y - ny, nz, 1 - nz])
+        return inside_floor(inside, edge * a)
+    if shape == "CornerWedge":
+        nx, ny, nz = (x + rx) / (2 * rx), (y + ry) / (2 * ry), (z + rz) / (2 * rz)
+        max_y = 1 - np.maximum(nx, nz)
+        inside = (nx >= 0) & (nx <= 1) & (ny >= 0) & (ny <= max_y) & (nz >= 0) & (nz <= 1)
+        edge = np.minimum.reduce([nx, 1 - nx, ny, max_y - ny, nz, 1 - nz])
+        return inside_floor(inside, edge * a)
+    if shape == "Torus":
+        tube = np.sqrt((np.sqrt(x * x + z * z) - rx) ** 2 + y * y) / ry
+        return inside_floor(tube <= 1, (1 - tube) * ry / VOXEL_RESOLUTION)
+    if shape == "Ring":
+        thickness, inner = ry * 0.3, rx * 0.6
+        radial = np.sqrt(x * x + z * z)
+        inside = (radial >= inner) & (radial <= rx) & (np.abs(y) <= thickness)
+        position = (radial - inner) / (rx - inner)
+        edge = np.minimum.reduce([position, 1 - position, (thickness - np.abs(y)) / thickness])
+        return inside_floor(inside, edge * a)
+    if shape == "ZigZag":
+        nx, ny, nz = np.abs(x) / rx, (y + ry) / (2 * ry), (z + rz) / (2 * rz)
+        bar = 0.25
+        in_shape = (nx <= 1) & (nz >= 0) & (nz <= 1) & (
+            ((ny >= 0) & (ny <= bar) & (nz >= 0.5))
+            | ((ny >= 1 - bar) & (ny <= 1) & (nz <= 0.5))
+            | ((ny > bar) & (ny < 1 - bar) & (np.abs(nz - (1 - ny)) <= bar)))
+        return np.where(in_shape, 0.8, 0.0)
+    if shape == "Sheet":
+        thickness = rz * 0.15
+        radial = np.sqrt(x * x + z * z)
+        inside = ((np.abs(radial - rx) <= thickness) & (np.abs(y) <= ry)
+                  & (np.abs(np.arctan2(x, z)) <= math.pi * 0.6))
+        return inside_floor(inside, 1 - np.abs(radial - rx) / thickness)
+    if shape == "Grid":
+        cell = rx * 2 / 8
+        parity = (np.floor((x + rx) / cell) + np.floor((y + ry) / cell) + np.floor((z + rz) / cell)) % 2
+        inside = (parity == 0) & (np.abs(x) <= rx) & (np.abs(y) <= ry) & (np.abs(z) <= rz)
+        return np.where(inside, 1.0, 0.0)
+    if shape == "Stick":
+        radius = rx * 0.15
+        normalized = np.sqrt(x * x + z * z) / radius
+        return inside_floor((normalized <= 1) & (np.abs(y) <= ry), (1 - normalized) * radius / VOXEL_RESOLUTION)
+    if shape == "Spikepad":
+        nx, nz, ny = x / rx, z / rz, (y + ry) / (2 * ry)
+        spacing = 2 / 5
+        max_center = 1 - spacing / 2
+        spike_x = np.clip(np.floor((nx + 1) / spacing + 0.5) * spacing - 1, -max_center, max_center)
+        spike_z = np.clip(np.floor((nz + 1) / spacing + 0.5) * spacing - 1, -max_center, max_center)
+        distance = np.sqrt((nx - spike_x) ** 2 + (nz - spike_z) ** 2)
+        spike_radius = spacing * 0.45
+        max_radius = spike_radius * (1 - (ny - 0.15) / 0.85)
+        in_box = (np.abs(nx) <= 1) & (np.abs(nz) <= 1) & (ny >= 0) & (ny <= 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cone = (distance <= spike_radius) & (distance <= max_radius)
+            sharpness = np.maximum(0.01, 1 - distance / max_radius)
+        return np.where(in_box & (ny <= 0.15), 1.0, np.where(in_box & cone, sharpness, 0.0))
+    raise ValueError(f"Unknown brush shape: {shape}")
+
+
+# Margins, in brush-local coordinates divided by the (uniform) radius.
+# Each returns (inside, outside) for occupancy threshold t and a = radius / VOXEL_RESOLUTION:
+# inside > 0 implies occupancy >= t, outside > 0 implies occupancy == 0.
+
+NEVER = -np.inf
+
+
+def sphere_margins(ux, uy, uz, a, t):
+    d = np.sqrt(ux * ux + uy * uy + uz * uz)
+    return (1 - t / a) - d, d - 1
+
+
+def dome_margins(ux, uy, uz, a, t):
+    d = np.sqrt(ux * ux + uy * uy + uz * uz)
+    return np.minimum((1 - t / a) - d, uy), np.maximum(d - 1, -uy)
+
+
+def cylinder_margins(ux, uy, uz, a, t):
+    radial = np.hypot(ux, uz)
+    return (np.minimum((1 - t / a) - radial, 1 - np.abs(uy)),
+            np.maximum(radial - 1, np.abs(uy) - 1))
+
+
+def cube_margins(ux, uy, uz, a, t):
+    m = np.maximum.reduce([np.abs(ux), np.abs(uy), np.abs(uz)])
+    return (1 - t / a) - m, m - 1
+
+
+def wedge_margins(ux, uy, uz, a, t):
+    ny, nz = (uy + 1) / 2, (uz + 1) / 2
+    edge = np.minimum.reduce([1 - np.abs(ux), ny, 1 - nz - ny, nz, 1 - nz])
+    return edge - t / a, -edge
+
+
+def corner_wedge_margins(ux, uy, uz, a, t):
+    nx, ny, nz = (ux + 1) / 2, (uy + 1) / 2, (uz + 1) / 2
+    edge = np.minimum.reduce([nx, 1 - nx, ny, 1 - np.maximum(nx, nz) - ny, nz, 1 - nz])
+    return edge - t / a, -edge
+
+
+def torus_margins(ux, uy, uz, a, t):
+    tube = np.hypot(np.hypot(ux, uz) - 1, uy)
+    return (1 - t / a) - tube, tube - 1
+
+
+def ring_margins(ux, uy, uz, a, t):
+    position = (np.hypot(ux, uz) - 0.6) / 0.4
+    edge = np.minimum.reduce([position, 1 - position, (0.3 - np.abs(uy)) / 0.3])
+    return edge - t / a, -edge
+
+
+def zigzag_margins(ux, uy, uz, a, t):
+    ny, nz = (uy + 1) / 2, (uz + 1) / 2
+    bottom = np.minimum.reduce([ny, 0.25 - ny, nz - 0.5])
+    top = np.minimum.reduce([ny - 0.75, 1 - ny, 0.5 - nz])
+    diagonal = np.minimum.reduce([ny - 0.25, 0.75 - ny, 0.25 - np.abs(nz + ny - 1)])
+    shape = np.minimum.reduce([1 - np.abs(ux), nz, 1 - nz, np.maximum.reduce([bottom, top, diagonal])])
+    return np.full(shape.shape, NEVER), -shape  # Occupancy is 0.8 at most
+
+
+def sheet_arc_margin(ux, uz):
+    """Signed distance to the back sector Sheet leaves out (|atan2(x, z)| > 0.6 pi), positive on the arc."""
+    radius = np.hypot(ux, uz)
+    angle = np.arctan2(np.abs(ux), -uz)  # From the -z axis
+    half_angle = 0.4 * np.pi
+    return np.where(angle >= half_angle, radius * np.sin(np.minimum(angle - half_angle, np.pi / 2)),
+                    -radius * np.sin(half_angle - angle))
+
+
+def sheet_margins(ux, uy, uz, a, t):
+    surface = np.abs(np.hypot(ux, uz) - 1)
+    arc = sheet_arc_margin(ux, uz)
+    return (np.minimum.reduce([0.15 * (1 - t) - surface, 1 - np.abs(uy), arc]),
+            np.maximum.reduce([surface - 0.15, np.abs(uy) - 1, -arc]))
+
+
+def grid_margins(ux, uy, uz, a, t):
+    cell = 0.25
+    face = np.minimum.reduce([np.minimum(np.mod(u + 1, cell), cell - np.mod(u + 1, cell)) for u in (ux, uy, uz)])
+    parity = (np.floor((ux + 1) / cell) + np.floor((uy + 1) / cell) + np.floor((uz + 1) / cell)) % 2
+    filled = np.where(parity == 0, face, -face)  # Distance into a filled cell, negative in an empty one
+    m = np.maximum.reduce([np.abs(ux), np.abs(uy), np.abs(uz)])
+    return np.minimum(filled, 1 - m), np.maximum(-filled, m - 1)
+
+
+def stick_margins(ux, uy, uz, a, t):
+    radial = np.hypot(ux, uz)
+    return (np.minimum(0.15 - t / a - radial, 1 - np.abs(uy)),
+            np.maximum(radial - 0.15, np.abs(uy) - 1))
+
+
+def spikepad_margins(ux, uy, uz, a, t):
+    ny = (uy + 1) / 2
+    box = np.minimum(1 - np.abs(ux), 1 - np.abs(uz))
+    inside = np.minimum.reduce([box, ny, 0.15 - ny])  # Only the base reaches 1; spike tips are single points
+    spacing = 0.4
+    spike_x, spike_z = (np.clip(np.floor((u + 1) / spacing + 0.5) * spacing - 1, -0.8, 0.8) for u in (ux, uz))
+    cone = 0.18 * (1 - (ny - 0.15) / 0.85) - np.hypot(ux - spike_x, uz - spike_z)
+    shape = np.minimum.reduce([box, ny, 1 - ny, np.maximum(0.15 - ny, cone)])
+    return inside, -shape
+
+
+# Shape -> (extent of the lattice per axis, Lipschitz bound of its margins, margins)
+SHAPES = {
+    "Sphere": (1.0, 1.0, sphere_margins),
+    "Cube": (1.0, 1.0, cube_margins),
+    "Cylinder": (1.0, 1.0, cylinder_margins),
+    "Wedge": (1.0, 1.0, wedge_margins),
+    "CornerWedge": (1.0, 1.0, corner_wedge_margins),
+    "Dome": (1.0, 1.0, dome_margins),
+    "Torus": (2.0, 1.0, torus_margins),
+    "Ring": (1.0, 1 / 0.3, ring_margins),
+    "ZigZag": (1.0, 1.0, zigzag_margins),
+    "Sheet": (1.25, 1.0, sheet_margins),
+    "Grid": (1.0, 1.0, grid_margins),
+    "Stick": (1.0, 1.0, stick_margins),
+    "Spinner": (1.0, 1.0, cube_margins),
+    "Spikepad": (1.0, 1.01, spikepad_margins),
+}
+
+
+def cell_centers(extent: float) -> np.ndarray:
+    """Normalized centers of the lattice cells along one axis."""
+    return -extent + (np.arange(RESOLUTION) + 0.5) * (2 * extent / RESOLUTION)
+
+
+def classify_cells(shape: str, size: float) -> np.ndarray:
+    """(RESOLUTION,)*3 array of lattice codes, indexed [x, y, z], for a uniform brush of this size."""
+    extent, lipschitz, margins = SHAPES[shape]
+    centers = cell_centers(extent)
+    ux, uy, uz = np.meshgrid(centers, centers, centers, indexing="ij")
+    half_diagonal = (extent / RESOLUTION) * math.sqrt(3)
+    proof = lipschitz * half_diagonal + 1e-9
+    a = size * VOXEL_RESOLUTION / 2 / VOXEL_RESOLUTION
+    
+    inside_add, outside = margins(ux, uy, uz, a, THRESHOLDS["add"])
+    inside_subtract, _ = margins(ux, uy, uz, a, THRESHOLDS["subtract"])
+    codes = np.full(ux.shape, BOUNDARY)
+    codes[inside_subtract > proof] = SUBTRACT_INSIDE
+    codes[inside_add > proof] = INSIDE
+    assert not np.any((outside > proof) & (inside_subtract > proof)), f"{shape}: contradictory margins"
+    codes[outside > proof] = OUTSIDE
+    return codes
+
+
+def verify_cells(shape: str, size: float, codes: np.ndarray) -> int:
+    """
+    Evaluate the ported brush at VERIFY_SAMPLES^3 points of every cell (faces
+    and corners included) and in a shell around the lattice. Returns the
+    number of samples that contradict their cell's code.
+    """
+    extent = SHAPES[shape][0]
+    radius = size * VOXEL_RESOLUTION / 2
+    cell = 2 * extent / RESOLUTION
+    offsets = np.linspace(0, cell, VERIFY_SAMPLES)
+    axis = (-extent + np.arange(RESOLUTION)[:, None] * cell + offsets[None, :]).ravel()
+    ux, uy, uz = np.meshgrid(axis, axis, axis, indexing="ij")
+    occupancy = brush_occupancy(shape, ux * radius, uy * radius, uz * radius, radius, radius, radius, size)
+    expanded = np.repeat(np.repeat(np.repeat(codes, VERIFY_SAMPLES, 0), VERIFY_SAMPLES, 1), VERIFY_SAMPLES, 2)
+    wrong = ((expanded == OUTSIDE) & (occupancy != 0)).sum()
+    wrong += ((expanded == INSIDE) & (occupancy < THRESHOLDS["add"])).sum()
+    wrong += ((np.isin(expanded, [INSIDE, SUBTRACT_INSIDE])) & (occupancy < THRESHOLDS["subtract"])).sum()
+    
+    # Nothing of the shape may reach past the lattice
+    shell = np.linspace(-2 * extent, 2 * extent, 4 * RESOLUTION + 1)
+    sx, sy, sz = np.meshgrid(shell, shell, shell, indexing="ij")
+    beyond = np.maximum.reduce([np.abs(sx), np.abs(sy), np.abs(sz)]) > extent
+    occupancy = brush_occupancy(shape, sx * radius, sy * radius, sz * radius, radius, radius, radius, size)
+    wrong += (beyond & (occupancy != 0)).sum()
+    return int(wrong)
+
+
+def bucket_for(size: float, sizes: list[int]) -> int:
+    """The largest tabulated size not above `size` (what OctreeFill looks up)."""
+    return max(bucket for bucket in sizes if bucket <= size)
+
+
+def covers(table: np.ndarray, exact: np.ndarray) -> bool:
+    """Whether every inside or outside claim of `table` also holds in `exact`."""
+    inside_ok = np.all(~(table == INSIDE) | (exact == INSIDE))
+    subtract_ok = np.all(~np.isin(table, [INSIDE, SUBTRACT_INSIDE]) | np.isin(exact, [INSIDE, SUBTRACT_INSIDE]))
+    outside_ok = np.all(~(table == OUTSIDE) | (exact == OUTSIDE))
+    return bool(inside_ok and subtract_ok and outside_ok)
+
+
+def encode_cells(codes: np.ndarray) -> str:
+    """Run-length encode lattice codes in [x][y][z] order: a code, then its run length if above 1."""
+    flat = codes.ravel()
+    starts = np.flatnonzero(np.r_[True, flat[1:] != flat[:-1]])
+    lengths = np.diff(np.r_[starts, flat.size])
+    return "".join(f"{flat[start]}{length if length > 1 else ''}" for start, length in zip(starts, lengths))
+
+
+def box_counts(mask: np.ndarray) -> np.ndarray:
+    """Summed-volume table of a boolean lattice, padded with a zero plane on each axis."""
+    counts = np.zeros(tuple(n + 1 for n in mask.shape), dtype=np.int64)
+    counts[1:, 1:, 1:] = mask.cumsum(0).cumsum(1).cumsum(2)
+    return counts
+
+
+def count_in_box(counts: np.ndarray, i0, i1, j0, j1, k0, k1) -> int:
+    """True cells in the index box [i0, i1] x [j0, j1] x [k0, k1] (inclusive)."""
+    c = counts
+    i1, j1, k1 = i1 + 1, j1 + 1, k1 + 1
+    return int(c[i1, j1, k1] - c[i0, j1, k1] - c[i1, j0, k1] - c[i1, j1, k0]
+               + c[i0, j0, k1] + c[i0, j1, k0] + c[i1, j0, k0] - c[i0, j0, k0])
+
+
+class TableClassifier:
+    """The octant lookup OctreeFillOptimization.lua does with the tables, for the simulation."""
+    
+    def __init__(self, codes: np.ndarray, extent: float, radius: float, operation: str, rotation: np.ndarray):
+        inside = codes == INSIDE if operation == "add" else np.isin(codes, [INSIDE, SUBTRACT_INSIDE])
+        self.not_inside = box_counts(~inside)
+        self.not_outside = box_counts(codes != OUTSIDE)
+        self.extent = extent
+        self.radius = radius
+        self.rotation = rotation
+        self.spread = np.abs(rotation).sum(axis=0)  # Half extent of a rotated unit cube along each local axis
+    
+    def __call__(self, center: np.ndarray, half_size: float) -> str:
+        local = self.rotation.T @ center
+        reach = half_size * self.spread
+        low = (local - reach) / self.radius - LOOKUP_PADDING
+        high = (local + reach) / self.radius + LOOKUP_PADDING
+        cell = 2 * self.extent / RESOLUTION
+        if np.any(high < -self.extent) or np.any(low > self.extent):
+            return "outside"
+        first = np.clip(np.floor((low + self.extent) / cell).astype(int), 0, RESOLUTION - 1)
+        last = np.clip(np.floor((high + self.extent) / cell).astype(int), 0, RESOLUTION - 1)
+        box = (first[0], last[0], first[1], last[1], first[2], last[2])
+        within = np.all(low >= -self.extent) and np.all(high <= self.extent)
+        if within and count_in_box(self.not_inside, *box) == 0:
+            return "inside"
+        if count_in_box(self.not_outside, *box) == 0:
+            return "outside"
+        return "boundary"
+
+
+class CornerClassifier:
+    """OctreeFill's classifyOctant: the brush at the 8 corners."""
+    
+    def __init__(self, shape: str, size: float, rotation: np.ndarray):
+        self.shape, self.size, self.rotation = shape, size, rotation
+        self.radius = size * VOXEL_RESOLUTION / 2
+        self.corners = np.array([[dx, dy, dz] for dx in (-1, 1) for dy in (-1, 1) for dz in (-1, 1)], dtype=float)
+    
+    def __call__(self, center: np.ndarray, half_size: float) -> str:
+        local = (center + self.corners * half_size) @ self.rotation
+        occupancy = brush_occupancy(self.shape, local[:, 0], local[:, 1], local[:, 2],
+                                    self.radius, self.radius, self.radius, self.size)
+        if np.all(occupancy >= 1.0):
+            return "inside"
+        if np.all(occupancy <= ONE_256TH):
+            return "outside"
+        return "boundary"
+
+
+def simulate(shape: str, size: float, rotation: np.ndarray, classify, operation: str) -> dict:
+    """
+    Run OctreeFill's decomposition for a brush centered at the origin with a
+    classifier, and compare every FillBlock and skip with the brush at the
+    voxel centers it covers.
+    """
+    radius = size * VOXEL_RESOLUTION / 2
+    root = 2 ** math.ceil(math.log2(size * VOXEL_RESOLUTION))
+    voxels = root // VOXEL_RESOLUTION
+    axis = -root / 2 + (np.arange(voxels) + 0.5) * VOXEL_RESOLUTION
+    px, py, pz = np.meshgrid(axis, axis, axis, indexing="ij")
+    local = np.stack([px, py, pz], axis=-1) @ rotation
+    occupancy = brush_occupancy(shape, local[..., 0], local[..., 1], local[..., 2], radius, radius, radius, size)
+    solid = occupancy >= THRESHOLDS[operation]
+    empty = occupancy <= (0 if operation == "subtract" else ONE_256TH)
+    
+    stats = {"fill_blocks": 0, "filled": 0, "skipped": 0, "per_voxel": 0, "wrong_octants": 0, "wrong_voxels": 0}
+    
+    def visit(start: np.ndarray, count: int):
+        octant_size = count * VOXEL_RESOLUTION
+        center = -root / 2 + (start + count / 2) * VOXEL_RESOLUTION
+        block = tuple(slice(s, s + count) for s in start)
+        kind = classify(center, octant_size / 2)
+        if kind == "inside" or kind == "outside":
+            if kind == "inside":
+                stats["fill_blocks"] += 1
+                stats["filled"] += count ** 3
+                wrong = int((~solid[block]).sum())
+            else:
+                stats["skipped"] += count ** 3
+                wrong = int((~empty[block]).sum())
+            if wrong:
+                stats["wrong_octants"] += 1
+                stats["wrong_voxels"] += wrong
+            return
+        if octant_size > MIN_OCTANT_SIZE:
+            half = count // 2
+            for dx in (0, half):
+                for dy in (0, half):
+                    for dz in (0, half):
+                        visit(start + np.array([dx, dy, dz]), half)
+        else:
+            stats["per_voxel"] += count ** 3
+    
+    visit(np.zeros(3, dtype=int), voxels)
+    stats["voxels"] = voxels ** 3
+    return stats
+
+
+def random_rotations(count: int, seed: int = 0) -> list[np.ndarray]:
+    """The identity, then `count` uniformly random rotations (from a fixed seed)."""
+    rng = np.random.default_rng(seed)
+    rotations = [np.eye(3)]
+    for _ in range(count):
+        q = rng.normal(size=4)
+        w, x, y, z = q / np.linalg.norm(q)
+        rotations.append(np.array([
+            [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+            [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+            [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)],
+        ]))
+    return rotations
+
+
+def analyze_shape(shape: str) -> tuple[dict, int]:
+    """Classify a shape at every size bucket; returns ({size: codes} without repeats, failures)."""
+    tables = {}
+    failures = 0
+    for size in SIZE_BUCKETS:
+        codes = classify_cells(shape, size)
+        failures += verify_cells(shape, size, codes)
+        if not tables or not np.array_equal(codes, tables[max(tables)]):
+            tables[size] = codes
+    # Every size a table is used for must allow what the table claims
+    sizes = sorted(tables)
+    for size in range(SIZE_BUCKETS[0], MAX_BRUSH_SIZE + 1):
+        if not covers(tables[bucket_for(size, sizes)], classify_cells(shape, size)):
+            print(f"  ERROR: {shape} table {bucket_for(size, sizes)} claims too much at size {size}")
+            failures += 1
+    return tables, failures
+
+
+def main():
+    script_dir = Path(__file__).parent
+    parser = argparse.ArgumentParser(description="Derive safe octant classifications for the brush shapes.")
+    parser.add_argument("--shapes", nargs="+", choices=sorted(SHAPES), default=list(SHAPES),
+                        help="Shapes to analyze (default: all)")
+    parser.add_argument("--rotations", type=int, default=4,
+                        help="Random rotations per simulated brush, besides the identity (default: 4)")
+    parser.add_argument("--sizes", type=float, nargs="+", default=list(SIMULATION_SIZES),
+                        help="Brush sizes to simulate (default: 6 16 40)")
+    parser.add_argument("--output", "-o", type=Path,
+                        default=script_dir.parent / "Src" / "TerrainOperations" / "BrushOctantTables.lua",
+                        help="Luau module to write (default: Src/TerrainOperations/BrushOctantTables.lua)")
+    parser.add_argument("--no-write", action="store_true", help="Report only, don't write the module")
+    args = parser.parse_args()
+    
+    print("=" * 60)
+    print("Brush Octant Analyzer")
+    print("=" * 60)
+    print(f"Lattice: {RESOLUTION}^3 cells, sizes {', '.join(map(str, SIZE_BUCKETS))}")
+    
+    rotations = random_rotations(args.rotations)
+    module = {}
+    failures = 0
+    for shape in args.shapes:
+        tables, shape_failures = analyze_shape(shape)
+        failures += shape_failures
+        extent = SHAPES[shape][0]
+        module[shape] = {
+            "extent": extent,
+            "sizes": sorted(tables),
+            "cells": {size: encode_cells(codes) for size, codes in tables.items()},
+        }
+        
+        largest = tables[max(tables)]
+        share = {code: float(np.mean(largest == code)) for code in (INSIDE, SUBTRACT_INSIDE, OUTSIDE)}
+        print(f"\n{shape}: {len(tables)} table(s), at size {max(tables)}: {share[INSIDE]:.0%} inside, "
+              f"{share[SUBTRACT_INSIDE]:.0%} Subtract-only, {share[OUTSIDE]:.0%} outside"
+              + (f", {shape_failures} FAILED CHECKS" if shape_failures else ""))
+        
+        for operation in THRESHOLDS:
+            totals = {"tables": {}, "corners": {}}
+            for size in args.sizes:
+                codes = tables[bucket_for(size, sorted(tables))]
+                radius = size * VOXEL_RESOLUTION / 2
+                for rotation in rotations:
+                    for method, classify in (("tables", TableClassifier(codes, extent, radius, operation, rotation)),
+                                             ("corners", CornerClassifier(shape, size, rotation))):
+                        for key, value in simulate(shape, size, rotation, classify, operation).items():
+                            totals[method][key] = totals[method].get(key, 0) + value
+            failures += totals["tables"]["wrong_octants"]
+            for method, total in totals.items():
+                fast = (total["filled"] + total["skipped"]) / total["voxels"]
+                print(f"  {operation:>8} {method:>7}: {total['fill_blocks']} FillBlocks, {fast:.0%} of voxels "
+                      f"without per-voxel work, {total['wrong_octants']} wrong octants "
+                      f"({total['wrong_voxels']} voxels)")
+    
+    if not args.no_write:
+        write_module(args.output, "BrushOctantTables", {"resolution": RESOLUTION, "shapes": module},
+                     "terrain-tiles/analyze_brushes.py")
+    
+    print("\n" + "=" * 60)
+    print("All classifications verified." if not failures else f"FAILED: {failures} checks.")
+    print("=" * 60)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,421 @@
+"""
+Noise Baker
+NumPy port of Src/Util/Noise.lua (hash3D, noise3D, fbm3D), bit-compatible with
+the Luau version, and a baker that writes its hash lattices into a Luau module
+so tools can sample noise by buffer lookup instead of hashing 8 corners per
+noise3D call.
+
+Usage:
+    python bake_noise.py                        # Seed 0, 3 octaves, 16^3 lattice -> generated/noise.luau
+    python bake_noise.py --seeds 0 42 --octaves 2 --period 32
+    python bake_noise.py --check                # Verify an existing bake against the port
+
+The baked lattices wrap every `period` lattice units, so baked noise is
+tileable: inside [0, (period - 1) / 2^(octaves - 1)) on every axis (see
+exact_extent; 3.75 for the defaults), fbm3D matches Noise.fbm3D exactly.
+The finest octave's upper corner must stay below the lattice's last row, so
+the last cell before period / 2^(octaves - 1) already wraps. Beyond that it
+repeats. In Studio,
+
+    local BakedNoise = require(path.to.noise)
+    print(BakedNoise.verify(require(Plugin.Src.Util.Noise)))  -- 0 mismatches
+
+checks Noise.lua and the lookups against reference values from this port.
+
+The reference values, and --check, come from Python: reference_hash3d and
+reference_fbm3d re-implement Noise.lua line by line on floats, but they
+share the port's reading of Luau's number semantics (double arithmetic,
+bit32 truncation). So --check only shows the port and the bake agree with
+that reading. BakedNoise.verify in Studio is the check against real Luau.
+
+Requires: NumPy (pip install numpy)
+"""
+
+import argparse
+import math
+import re
+import sys
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    print("NumPy is required. Run: pip install numpy")
+    sys.exit(1)
+
+from tile_luau import GENERATED_HEADER, luau_value
+
+# hash3D's multipliers, as in Noise.lua
+HASH_X = 374761393
+HASH_Y = 668265263
+HASH_Z = 1274126177
+HASH_SEED = 1013904223
+HASH_MIX = 1274126177
+HASH_RANGE = 1000000
+
+# fbm3D offsets the seed by this per octave
+OCTAVE_SEED_STEP = 100
+
+REFERENCE_SAMPLES = 64
+
+
+def to_uint32(values: np.ndarray) -> np.ndarray:
+    """
+    A double as Luau's bit32 functions read it: truncated to a 64-bit integer,
+    then the low 32 bits. Exact for |values| < 2^63, which hash3D stays within.
+    """
+    return values.astype(np.int64) & 0xFFFFFFFF
+
+
+def hash_units(x, y, z, seed) -> np.ndarray:
+    """hash3D before the final division: integers in [0, HASH_RANGE)."""
+    x, y, z, seed = (np.asarray(value, dtype=np.float64) for value in (x, y, z, seed))
+    n = x * HASH_X + y * HASH_Y + z * HASH_Z + seed * HASH_SEED
+    u = to_uint32(n)
+    n = (u ^ (u >> 13)).astype(np.float64) * HASH_MIX  # Rounds like Luau's double multiply
+    u = to_uint32(n)
+    return (u ^ (u >> 16)) % HASH_RANGE
+
+
+def hash3d(x, y, z, seed) -> np.ndarray:
+    """Noise.hash3D: 0 to 1."""
+    return hash_units(x, y, z, seed) / HASH_RANGE
+
+
+def smoothstep(t: np.ndarray) -> np.ndarray:
+    return t * t * (3 - 2 * t)
+
+
+def interpolate(corners: list[np.ndarray], fx: np.ndarray, fy: np.ndarray, fz: np.ndarray) -> np.ndarray:
+    """Noise.noise3D's trilinear blend of n000, n100, n010, n110, n001, n101, n011, n111."""
+    n000, n100, n010, n110, n001, n101, n011, n111 = corners
+    nx00 = n000 + fx * (n100 - n000)
+    nx10 = n010 + fx * (n110 - n010)
+    nx01 = n001 + fx * (n101 - n001)
+    nx11 = n011 + fx * (n111 - n011)
+    nxy0 = nx00 + fy * (nx10 - nx00)
+    nxy1 = nx01 + fy * (nx11 - nx01)
+    return nxy0 + fz * (nxy1 - nxy0)
+
+
+CORNERS = [(0, 0, 0), (1, 0, 0), (0, 1, 0), (1, 1, 0), (0, 0, 1), (1, 0, 1), (0, 1, 1), (1, 1, 1)]
+
+
+def noise3d(x, y, z, seed, hash_corner=hash3d) -> np.ndarray:
+    """Noise.noise3D: value noise, 0 to 1. hash_corner(x0, y0, z0, seed) samples the lattice."""
+    x, y, z = (np.asarray(value, dtype=np.float64) for value in (x, y, z))
+    x0, y0, z0 = np.floor(x), np.floor(y), np.floor(z)
+    fx, fy, fz = smoothstep(x - x0), smoothstep(y - y0), smoothstep(z - z0)
+    corners = [hash_corner(x0 + dx, y0 + dy, z0 + dz, seed) for dx, dy, dz in CORNERS]
+    return interpolate(corners, fx, fy, fz)
+
+
+def fbm3d(x, y, z, seed, octaves: int = 3, hash_corner=hash3d) -> np.ndarray:
+    """Noise.fbm3D: octaves of noise3D, 0 to 1."""
+    x, y, z = (np.asarray(value, dtype=np.float64) for value in (x, y, z))
+    value = np.zeros(np.broadcast_shapes(x.shape, y.shape, z.shape))
+    amplitude = 1.0
+    frequency = 1.0
+    max_value = 0.0
+    for i in range(1, octaves + 1):
+        value = value + amplitude * noise3d(x * frequency, y * frequency, z * frequency,
+                                            seed + i * OCTAVE_SEED_STEP, hash_corner)
+        max_value = max_value + amplitude
+        amplitude = amplitude * 0.5
+        frequency = frequency * 2
+    return value / max_value
+
+
+def reference_hash3d(x: float, y: float, z: float, seed: float) -> float:
+    """Noise.hash3D line by line on Python floats, the scalar reference for --check."""
+    n = x * HASH_X + y * HASH_Y + z * HASH_Z + seed * HASH_SEED
+    n = (int(n) & 0xFFFFFFFF) ^ ((int(n) & 0xFFFFFFFF) >> 13)
+    n = n * float(HASH_MIX)
+    n = (int(n) & 0xFFFFFFFF) ^ ((int(n) & 0xFFFFFFFF) >> 16)
+    return (n % HASH_RANGE) / HASH_RANGE
+
+
+def reference_fbm3d(x: float, y: float, z: float, seed: float, octaves: int) -> float:
+    """Noise.fbm3D line by line on Python floats."""
+    def noise(x: float, y: float, z: float, seed: float) -> float:
+        x0, y0, z0 = math.floor(x), math.floor(y), math.floor(z)
+        fx = (x - x0) * (x - x0) * (3 - 2 * (x - x0))
+        fy = (y - y0) * (y - y0) * (3 - 2 * (y - y0))
+        fz = (z - z0) * (z - z0) * (3 - 2 * (z - z0))
+        corners = [reference_hash3d(x0 + dx, y0 + dy, z0 + dz, seed) for dx, dy, dz in CORNERS]
+        return float(interpolate(corners, fx, fy, fz))
+    
+    value = 0.0
+    amplitude = 1.0
+    frequency = 1.0
+    max_value = 0.0
+    for i in range(1, octaves + 1):
+        value = value + amplitude * noise(x * frequency, y * frequency, z * frequency, seed + i * OCTAVE_SEED_STEP)
+        max_value = max_value + amplitude
+        amplitude = amplitude * 0.5
+        frequency = frequency * 2
+    return value / max_value
+
+
+def bake_lattice(seed: int, period: int) -> np.ndarray:
+    """hash_units over [0, period)^3 for one octave seed, as (x, y, z)."""
+    x, y, z = np.meshgrid(*(np.arange(period, dtype=np.float64),) * 3, indexing="ij")
+    return hash_units(x, y, z, seed).astype(np.uint32)
+
+
+def lattice_sampler(lattices: dict[int, np.ndarray], period: int):
+    """A hash_corner for noise3d/fbm3d that looks up baked lattices, wrapping like the Luau module."""
+    def sample(x0, y0, z0, seed):
+        lattice = lattices[int(seed)]
+        return lattice[(x0 % period).astype(int), (y0 % period).astype(int), (z0 % period).astype(int)] / HASH_RANGE
+    return sample
+
+
+def octave_seeds(seeds: list[int], octaves: int) -> list[int]:
+    """Seeds of every octave lattice fbm3D needs for these seeds."""
+    return sorted({seed + i * OCTAVE_SEED_STEP for seed in seeds for i in range(1, octaves + 1)})
+
+
+def exact_extent(period: int, octaves: int) -> float:
+    """Coordinates in [0, extent) hit no wrapped lattice cell at any octave."""
+    return (period - 1) / 2 ** (octaves - 1)
+
+
+def reference_points(seeds: list[int], octaves: int, period: int, count: int = REFERENCE_SAMPLES) -> list:
+    """[x, y, z, seed, octaves, Noise.fbm3D value] inside the exact extent, from a fixed RNG."""
+    rng = np.random.default_rng(0)
+    rows = []
+    for seed in seeds:
+        points = rng.uniform(0, exact_extent(period, octaves), (count, 3)).round(3)
+        for x, y, z in points.tolist():
+            rows.append([x, y, z, seed, octaves, reference_fbm3d(x, y, z, seed, octaves)])
+    return rows
+
+
+def luau_bytes(data: bytes) -> str:
+    """A Luau string literal holding arbitrary bytes: printable ASCII as is, the rest as \\xHH."""
+    parts = []
+    for byte in data:
+        if 0x20 <= byte < 0x7F and byte not in (0x22, 0x5C):
+            parts.append(chr(byte))
+        else:
+            parts.append(f"\\x{byte:02x}")
+    return '"' + "".join(parts) + '"'
+
+
+def parse_luau_bytes(literal: str) -> bytes:
+    """Inverse of luau_bytes, for the string inside the quotes."""
+    return re.sub(r"\\x([0-9a-f]{2})", lambda match: chr(int(match.group(1), 16)), literal).encode("latin-1")
+
+
+SAMPLER = """
+local BakedNoise = {}
+
+BakedNoise.period = PERIOD
+BakedNoise.seeds = SEEDS
+BakedNoise.reference = REFERENCE
+
+local function lattice(seed: number): buffer
+	local baked = lattices[seed]
+	if not baked then
+		error(`No baked noise lattice for seed {seed}; rerun bake_noise.py with it`)
+	end
+	return baked
+end
+
+local function at(baked: buffer, x: number, y: number, z: number): number
+	return buffer.readu32(baked, (((x % PERIOD) * PERIOD + y % PERIOD) * PERIOD + z % PERIOD) * 4) / 1000000
+end
+
+-- Same as Noise.hash3D inside the baked period; wraps outside it
+function BakedNoise.hash3D(x: number, y: number, z: number, seed: number): number
+	return at(lattice(seed), x, y, z)
+end
+
+-- Same as Noise.noise3D inside the baked period; wraps outside it
+function BakedNoise.noise3D(x: number, y: number, z: number, seed: number): number
+	local baked = lattice(seed)
+	local x0 = math.floor(x)
+	local y0 = math.floor(y)
+	local z0 = math.floor(z)
+ 
+	local tx, ty, tz = x - x0, y - y0, z - z0
+	local fx = tx * tx * (3 - 2 * tx)
+	local fy = ty * ty * (3 - 2 * ty)
+	local fz = tz * tz * (3 - 2 * tz)
+ 
+	local n000 = at(baked, x0, y0, z0)
+	local n100 = at(baked, x0 + 1, y0, z0)
+	local n010 = at(baked, x0, y0 + 1, z0)
+	local n110 = at(baked, x0 + 1, y0 + 1, z0)
+	local n001 = at(baked, x0, y0, z0 + 1)
+	local n101 = at(baked, x0 + 1, y0, z0 + 1)
+	local n011 = at(baked, x0, y0 + 1, z0 + 1)
+	local n111 = at(baked, x0 + 1, y0 + 1, z0 + 1)
+ 
+	local nx00 = n000 + fx * (n100 - n000)
+	local nx10 = n010 + fx * (n110 - n010)
+	local nx01 = n001 + fx * (n101 - n001)
+	local nx11 = n011 + fx * (n111 - n011)
+ 
+	local nxy0 = nx00 + fy * (nx10 - nx00)
+	local nxy1 = nx01 + fy * (nx11 - nx01)
+ 
+	return nxy0 + fz * (nxy1 - nxy0)
+end
+
+-- Same as Noise.fbm3D inside [0, (period - 1) / 2^(octaves - 1)); tiles outside it
+function BakedNoise.fbm3D(x: number, y: number, z: number, seed: number, octaves: number?): number
+	octaves = octaves or 3
+	local value = 0
+	local amplitude = 1
+	local frequency = 1
+	local maxValue = 0
+ 
+	for i = 1, octaves do
+		value = value + amplitude * BakedNoise.noise3D(x * frequency, y * frequency, z * frequency, seed + i * 100)
+		maxValue = maxValue + amplitude
+		amplitude = amplitude * 0.5
+		frequency = frequency * 2
+	end
+ 
+	return value / maxValue
+end
+
+-- Compare Noise.lua and the lookups with the reference values; returns the number of mismatches
+function BakedNoise.verify(noise: any): number
+	local mismatches = 0
+	for _, row in BakedNoise.reference do
+		local x, y, z, seed, octaves, expected = table.unpack(row)
+		if noise.fbm3D(x, y, z, seed, octaves) ~= expected then
+			mismatches += 1
+			warn(`Noise.fbm3D({x}, {y}, {z}, {seed}, {octaves}) differs from the baked reference`)
+		end
+		if BakedNoise.fbm3D(x, y, z, seed, octaves) ~= expected then
+			mismatches += 1
+			warn(`BakedNoise.fbm3D({x}, {y}, {z}, {seed}, {octaves}) differs from the baked reference`)
+		end
+	end
+	return mismatches
+end
+
+return BakedNoise
+"""
+
+
+def write_noise_module(path: Path, seeds: list[int], octaves: int, period: int) -> dict[int, np.ndarray]:
+    """Bake every octave lattice for `seeds` into a Luau module. Returns {octave seed: lattice}."""
+    lattices = {seed: bake_lattice(seed, period) for seed in octave_seeds(seeds, octaves)}
+    lines = [GENERATED_HEADER.format(generator="bake_noise.py"), "--!strict", f"local PERIOD = {period}", "",
+             "-- Octave seed -> hash3D * 1000000 as little-endian u32, indexed ((x * PERIOD + y) * PERIOD + z)",
+             "local lattices: { [number]: buffer } = {"]
+    for seed, lattice in lattices.items():
+        lines.append(f"\t[{seed}] = buffer.fromstring({luau_bytes(lattice.astype('<u4').tobytes())}),")
+    lines.append("}")
+    
+    sampler = (SAMPLER.replace("SEEDS", luau_value({seed: octaves for seed in seeds}))
+               .replace("REFERENCE", luau_value(reference_points(seeds, octaves, period))))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(lines) + "\n" + sampler)
+    print(f"Wrote {path.name}: {len(lattices)} lattices of {period}^3, {path.stat().st_size / 1024:.0f} KB")
+    return lattices
+
+
+def read_noise_module(path: Path) -> tuple[int, dict[int, np.ndarray], list]:
+    """Read back a baked module: (period, {octave seed: lattice}, reference rows)."""
+    text = path.read_text()
+    period = int(re.search(r"^local PERIOD = (\d+)$", text, re.MULTILINE).group(1))
+    lattices = {}
+    for seed, literal in re.findall(r'^\t\[(-?\d+)\] = buffer\.fromstring\("((?:[^"\\]|\\.)*)"\),$', text, re.MULTILINE):
+        values = np.frombuffer(parse_luau_bytes(literal), dtype="<u4")
+        lattices[int(seed)] = values.reshape(period, period, period)
+    reference = []
+    for row in re.findall(r"^\t\{\n(.*?)\n\t\},$", text[text.index("BakedNoise.reference = "):],
+                          re.MULTILINE | re.DOTALL):
+        reference.append([float(value.strip().rstrip(",")) for value in row.splitlines()])
+    return period, lattices, reference
+
+
+def check(path: Path, samples: int = 20000) -> int:
+    """
+    Cross-check a bake: the vectorized port against the line-by-line scalar
+    reference (over wide coordinates, negative ones included), every lattice
+    against a fresh bake, and the module's reference values and lookups
+    against the port. Returns the number of failures.
+    Both sides are Python, so this can't catch a misreading of Luau they
+    share; run BakedNoise.verify in Studio for that.
+    """
+    period, lattices, reference = read_noise_module(path)
+    failures = 0
+    rng = np.random.default_rng(1)
+    
+    points = rng.uniform(-5000, 5000, (samples, 3))
+    seeds = rng.integers(-1000, 100000, samples)
+    hashed = hash3d(np.floor(points[:, 0]), np.floor(points[:, 1]), np.floor(points[:, 2]), seeds)
+    expected = [reference_hash3d(math.floor(x), math.floor(y), math.floor(z), float(seed))
+                for (x, y, z), seed in zip(points.tolist(), seeds.tolist())]
+    mismatched = int(np.count_nonzero(hashed != np.array(expected)))
+    print(f"  hash3D, port vs scalar reference: {samples - mismatched}/{samples} identical")
+    failures += mismatched
+    
+    fbm = fbm3d(points[:2000, 0] / 50, points[:2000, 1] / 50, points[:2000, 2] / 50, 7, 3)
+    expected = [reference_fbm3d(x / 50, y / 50, z / 50, 7, 3) for x, y, z in points[:2000].tolist()]
+    mismatched = int(np.count_nonzero(fbm != np.array(expected)))
+    print(f"  fbm3D, port vs scalar reference: {2000 - mismatched}/2000 identical")
+    failures += mismatched
+    
+    stale = [seed for seed, lattice in lattices.items() if not np.array_equal(lattice, bake_lattice(seed, period))]
+    print(f"  Lattices: {len(lattices) - len(stale)}/{len(lattices)} match a fresh bake")
+    failures += len(stale)
+    
+    sampler = lattice_sampler(lattices, period)
+    mismatched = 0
+    for x, y, z, seed, octaves, value in reference:
+        port = float(fbm3d(x, y, z, seed, int(octaves)))
+        baked = float(fbm3d(x, y, z, seed, int(octaves), hash_corner=sampler))
+        mismatched += (port != value) + (baked != value)
+    print(f"  Reference values: {2 * len(reference) - mismatched}/{2 * len(reference)} reproduced "
+          f"(port and lattice lookups)")
+    failures += mismatched
+    return failures
+
+
+def main():
+    script_dir = Path(__file__).parent
+    parser = argparse.ArgumentParser(description="Bake Noise.lua hash lattices into a Luau lookup module.")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0],
+                        help="fbm3D seeds to bake (default: 0)")
+    parser.add_argument("--octaves", type=int, default=3,
+                        help="Most octaves fbm3D is called with; fewer work too (default: 3)")
+    parser.add_argument("--period", type=int, default=16,
+                        help="Lattice size per axis; noise repeats every period units (default: 16)")
+    parser.add_argument("--output", "-o", type=Path, default=script_dir / "generated" / "noise.luau",
+                        help="Module to write (default: generated/noise.luau)")
+    parser.add_argument("--check", action="store_true",
+                        help="Verify the module at --output against the port instead of baking")
+    args = parser.parse_args()
+    
+    print("=" * 60)
+    print("Noise Baker")
+    print("=" * 60)
+    
+    if not args.check:
+        if args.octaves < 1 or args.period < 2:
+            parser.error("--octaves must be at least 1 and --period at least 2")
+        print(f"Seeds: {', '.join(map(str, args.seeds))}, octaves: {args.octaves}, period: {args.period}")
+        write_noise_module(args.output, args.seeds, args.octaves, args.period)
+        print(f"Exact (untiled) range: [0, {exact_extent(args.period, args.octaves):g}) on each axis")
+    elif not args.output.exists():
+        print(f"ERROR: {args.output} not found, bake it first")
+        sys.exit(1)
+    
+    print(f"\nChecking {args.output.name}:")
+    failures = check(args.output)
+    print("\n" + "=" * 60)
+    print("Check passed." if not failures else f"Check FAILED: {failures} mismatches.")
+    print("=" * 60)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,377 @@
+"""
+Terrain Tile Extractor - Detector benchmark
+Generates synthetic composites with known tile rectangles and runs every detector
+in extract_tiles_auto.py on them. Reports accuracy (IoU and edge error per tile)
+and speed (sheets/s, time per stage, peak memory) so regressions show up as numbers
+instead of in previews.
+
+Usage:
+    python benchmark_detectors.py                            # All scenarios, 1K-16K, all detectors
+    python benchmark_detectors.py --sizes 1024 4096          # Only these sheet widths
+    python benchmark_detectors.py --detector grid pyramid --scenario jpeg near-white
+    python benchmark_detectors.py --json bench.json --fail-under 0.98
+    python benchmark_detectors.py --keep sheets/             # Keep the sheets (with .tiles.json sidecars)
+
+Scenarios:
+    standard    4x3 grid with label strips under the tiles, like the real sheets
+    tight       4x3 grid with narrow gaps and no labels
+    wide        6x4 grid
+    partial     4x3 grid with an empty cell, like terrain-raw-mud-air.png
+    near-white  Snow, salt and glacier tiles close to the background threshold
+    jpeg        JPEG compression noise around every edge
+    jitter      Tiles nudged off a uniform lattice
+
+Each detector run happens in a fresh process, so peak RSS is that run's alone
+(not reported on Windows, which has no resource module).
+
+Requires: Pillow, NumPy (pip install Pillow numpy)
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import numpy as np
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:
+    print("Pillow and NumPy are required. Run: pip install Pillow numpy")
+    sys.exit(1)
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from extract_tiles_auto import DETECTORS
+from tile_encoding import encode_png_pillow
+
+DEFAULT_SIZES = [1024, 2048, 4096, 8192, 16384]
+
+SCENARIO_DEFAULTS = {
+    "cols": 4,
+    "rows": 3,
+    "gap": 0.12,          # Fraction of each cell left as background between tiles
+    "labels": True,       # Dark label text in a strip under each tile
+    "empty": [],          # Cells with no tile
+    "near_white": 0,      # How many tiles use near-white materials
+    "jpeg_quality": None, # Round-trip the sheet through JPEG at this quality
+    "jitter": 0.0,        # Max tile offset, as a fraction of the cell size
+}
+
+SCENARIOS = {
+    "standard": {},
+    "tight": {"gap": 0.02, "labels": False},
+    "wide": {"cols": 6, "rows": 4},
+    "partial": {"empty": [(3, 2)]},
+    "near-white": {"near_white": 3},
+    "jpeg": {"jpeg_quality": 70},
+    "jitter": {"jitter": 0.03},
+}
+
+# Base colors for tile textures
+MATERIAL_COLORS = [
+    (75, 151, 75), (143, 126, 95), (102, 92, 86), (115, 95, 70), (88, 70, 58),
+    (120, 120, 125), (160, 80, 60), (60, 60, 64), (200, 180, 130), (80, 110, 160),
+]
+NEAR_WHITE_COLORS = [
+    (242, 244, 247),  # Snow
+    (236, 235, 230),  # Salt
+    (214, 232, 242),  # Glacier
+]
+
+STAGES = ("decode", "detect", "encode")
+
+
+def scenario_params(name: str) -> dict:
+    """Full parameter set of a scenario, defaults filled in."""
+    return {**SCENARIO_DEFAULTS, **SCENARIOS[name]}
+
+
+def tile_texture(width: int, height: int, color: tuple[int, int, int],
+                 rng: np.random.Generator) -> Image.Image:
+    """A noisy, blotchy texture around a base color, roughly like a terrain material."""
+    blotches = rng.integers(-14, 15, size=(8, 8, 3)) + np.array(color)
+    base = Image.fromarray(np.clip(blotches, 0, 255).astype(np.uint8)).resize((width, height), Image.BILINEAR)
+    grain = rng.normal(0, 6, size=(height, width, 3)).astype(np.float32)
+    pixels = np.asarray(base, dtype=np.float32) + grain
+    return Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8))
+
+
+def label_font(size: int) -> ImageFont.ImageFont:
+    """Default font at a size, or the fixed bitmap font on older Pillow."""
+    try:
+        return ImageFont.load_default(size=size)
+    except TypeError:
+        return ImageFont.load_default()
+
+
+def make_sheet(width: int, params: dict, rng: np.random.Generator) -> tuple[Image.Image, list, dict]:
+    """
+    Build a synthetic composite with the 3:4 proportions and margins of the real sheets.
+    Returns (image, tiles as (name, col, row), {name: (left, top, right, bottom)}).
+    """
+    height = width * 3 // 4
+    cols, rows = params["cols"], params["rows"]
+    
+    left_margin = width * 0.03
+    top_margin = height * 0.03
+    cell_width = (width - 2 * left_margin) / cols
+    cell_height = (height - top_margin - height * 0.08) / rows
+    label_height = int(cell_height * 0.08) if params["labels"] else 0
+    tile_width = int(cell_width * (1 - params["gap"]))
+    tile_height = int(cell_height * (1 - params["gap"])) - label_height
+    max_jitter = int(min(cell_width, cell_height) * params["jitter"])
+    
+    img = Image.new("RGB", (width, height), (255, 255, 255))
+    draw = ImageDraw.Draw(img)
+    font = label_font(max(8, int(label_height * 0.7)))
+    
+    cells = [(col, row) for row in range(rows) for col in range(cols) if (col, row) not in params["empty"]]
+    near_white = set(rng.choice(len(cells), size=params["near_white"], replace=False).tolist())
+    
+    tiles = []
+    truth = {}
+    for index, (col, row) in enumerate(cells):
+        name = f"tile_{col}_{row}"
+        left = int(left_margin + col * cell_width + (cell_width - tile_width) / 2)
+        top = int(top_margin + row * cell_height + cell_height * params["gap"] / 2)
+        if max_jitter:
+            left += int(rng.integers(-max_jitter, max_jitter + 1))
+            top += int(rng.integers(-max_jitter, max_jitter + 1))
+        
+        if index in near_white:
+            color = NEAR_WHITE_COLORS[index % len(NEAR_WHITE_COLORS)]
+        else:
+            color = MATERIAL_COLORS[int(rng.integers(len(MATERIAL_COLORS)))]
+        img.paste(tile_texture(tile_width, tile_height, color, rng), (left, top))
+        
+        if label_height:
+            draw.text((left + tile_width // 3, top + tile_height + label_height // 8), name,
+                      fill=(40, 40, 40), font=font)
+        
+        tiles.append((name, col, row))
+        truth[name] = (left, top, left + tile_width, top + tile_height)
+    
+    if params["jpeg_quality"] is not None:
+        buffer = io.BytesIO()
+        img.save(buffer, "JPEG", quality=params["jpeg_quality"])
+        img = Image.open(buffer).convert("RGB")
+    
+    return img, tiles, truth
+
+
+def peak_rss_mb() -> float:
+    """Peak resident memory of this process in MB, or None where it can't be measured."""
+    # On Linux ru_maxrss survives exec, so a spawned worker would report the
+    # parent's peak at fork time; VmHWM belongs to this process image only
+    status = Path("/proc/self/status")
+    if status.exists():
+        for line in status.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024  # Bytes on macOS, KB elsewhere
+
+
+def run_detector(sheet_path: Path, tiles: list[tuple[str, int, int]], detector: str) -> dict:
+    """
+    Worker: decode a sheet, detect its tiles and encode the crops, timing each stage.
+    Detector output is collected through its log callable and returned rather than printed.
+    """
+    log = []
+    stages = {}
+    start = time.perf_counter()
+    img = Image.open(sheet_path).convert("RGB")
+    stages["decode"] = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    detections = DETECTORS[detector](img, tiles, log=log.append)
+    stages["detect"] = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for _, bounds in detections.values():
+        if bounds is not None:
+            encode_png_pillow(img.crop(bounds))
+    stages["encode"] = time.perf_counter() - start
+    
+    return {
+        "stages": stages,
+        "bounds": {name: bounds for name, (_, bounds) in detections.items()},
+        "peak_rss_mb": peak_rss_mb(),
+        "log": "".join(f"{line}\n" for line in log),
+    }
+
+
+def iou(a: tuple[int, int, int, int], b: tuple[int, int, int, int]) -> float:
+    """Intersection over union of two (left, top, right, bottom) rectangles."""
+    width = min(a[2], b[2]) - max(a[0], b[0])
+    height = min(a[3], b[3]) - max(a[1], b[1])
+    if width <= 0 or height <= 0:
+        return 0.0
+    overlap = width * height
+    area_a = (a[2] - a[0]) * (a[3] - a[1])
+    area_b = (b[2] - b[0]) * (b[3] - b[1])
+    return overlap / (area_a + area_b - overlap)
+
+
+def score_tiles(truth: dict, found: dict) -> dict:
+    """
+    Compare detected bounds to ground truth, per tile.
+    A tile that was not found scores IoU 0 and has no edge error.
+    """
+    scores = {}
+    for name, expected in truth.items():
+        bounds = found.get(name)
+        if bounds is None:
+            scores[name] = {"iou": 0.0, "edge_error": None}
+            continue
+        scores[name] = {
+            "iou": iou(expected, bounds),
+            "edge_error": max(abs(edge - true_edge) for edge, true_edge in zip(bounds, expected)),
+        }
+    return scores
+
+
+def summarize(runs: list[dict]) -> dict:
+    """Accuracy and speed totals for a set of runs (usually one detector's)."""
+    ious = [tile["iou"] for run in runs for tile in run["tiles"].values()]
+    errors = [tile["edge_error"] for run in runs for tile in run["tiles"].values() if tile["edge_error"] is not None]
+    total_time = sum(sum(run["stages"].values()) for run in runs)
+    peaks = [run["peak_rss_mb"] for run in runs if run["peak_rss_mb"] is not None]
+    return {
+        "sheets": len(runs),
+        "failed_sheets": sum(1 for run in runs if run["error"] is not None),
+        "mean_iou": sum(ious) / len(ious) if ious else 0.0,
+        "min_iou": min(ious, default=0.0),
+        "missed_tiles": sum(1 for run in runs for tile in run["tiles"].values() if tile["edge_error"] is None),
+        "max_edge_error": max(errors, default=None),
+        "sheets_per_second": len(runs) / total_time if total_time else 0.0,
+        "stage_seconds": {stage: sum(run["stages"].get(stage, 0.0) for run in runs) for stage in STAGES},
+        "peak_rss_mb": max(peaks, default=None),
+    }
+
+
+def format_row(run: dict) -> str:
+    """One line of the per-sheet results table."""
+    ious = [tile["iou"] for tile in run["tiles"].values()]
+    errors = [tile["edge_error"] for tile in run["tiles"].values() if tile["edge_error"] is not None]
+    missed = sum(1 for tile in run["tiles"].values() if tile["edge_error"] is None)
+    stages = " ".join(f"{run['stages'].get(stage, 0.0) * 1000:7.0f}" for stage in STAGES)
+    peak = f"{run['peak_rss_mb']:7.0f}" if run["peak_rss_mb"] is not None else "    n/a"
+    edge = f"{max(errors):5d}" if errors else "    -"
+    status = f"  ERROR: {run['error']}" if run["error"] else ""
+    return (f"  {run['scenario']:<11} {run['size']:>6} {run['detector']:<8} "
+            f"{sum(ious) / len(ious):6.3f} {min(ious):6.3f} {edge} {missed:4d} {stages} {peak}{status}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark tile detectors on synthetic composites.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Sheet widths in pixels (height is 3/4 of width)")
+    parser.add_argument("--scenario", nargs="+", choices=sorted(SCENARIOS), default=list(SCENARIOS),
+                        help="Scenarios to generate (default: all)")
+    parser.add_argument("--detector", nargs="+", choices=sorted(DETECTORS), default=list(DETECTORS),
+                        help="Detectors to run (default: all)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for sheet generation")
+    parser.add_argument("--keep", type=Path, help="Write the generated sheets here instead of a temp folder")
+    parser.add_argument("--json", type=Path, help="Write per-tile results and summaries to this JSON file")
+    parser.add_argument("--fail-under", type=float,
+                        help="Exit with status 1 if any tile's IoU is below this")
+    args = parser.parse_args()
+    
+    print("=" * 60)
+    print("Terrain Tile Extractor - DETECTOR BENCHMARK")
+    print("=" * 60)
+    print(f"Sizes: {', '.join(str(size) for size in args.sizes)}")
+    print(f"Scenarios: {', '.join(args.scenario)}")
+    print(f"Detectors: {', '.join(args.detector)}")
+    print("")
+    print(f"  {'scenario':<11} {'width':>6} {'detector':<8} {'IoU':>6} {'minIoU':>6} {'edge':>5} "
+          f"{'miss':>4} {'dec ms':>7} {'det ms':>7} {'enc ms':>7} {'RSS MB':>7}")
+    
+    # A fresh spawned process per run keeps peak RSS and import state independent
+    context = multiprocessing.get_context("spawn")
+    runs = []
+    with contextlib.ExitStack() as stack:
+        if args.keep is not None:
+            sheet_dir = args.keep
+            sheet_dir.mkdir(parents=True, exist_ok=True)
+        else:
+            sheet_dir = Path(stack.enter_context(tempfile.TemporaryDirectory()))
+        pool = stack.enter_context(ProcessPoolExecutor(max_workers=1, mp_context=context, max_tasks_per_child=1))
+        
+        for size in args.sizes:
+            for scenario_index, scenario in enumerate(args.scenario):
+                rng = np.random.default_rng([args.seed, size, scenario_index])
+                img, tiles, truth = make_sheet(size, scenario_params(scenario), rng)
+                sheet_path = sheet_dir / f"bench-{scenario}-{size}.png"
+                img.save(sheet_path, "PNG", compress_level=1)
+                del img
+                
+                for detector in args.detector:
+                    try:
+                        result = pool.submit(run_detector, sheet_path, tiles, detector).result()
+                        error = None
+                    except Exception as exc:
+                        result = {"stages": {}, "bounds": {}, "peak_rss_mb": None, "log": ""}
+                        error = f"{type(exc).__name__}: {exc}"
+                    
+                    run = {
+                        "scenario": scenario,
+                        "size": size,
+                        "detector": detector,
+                        "error": error,
+                        "stages": result["stages"],
+                        "peak_rss_mb": result["peak_rss_mb"],
+                        "tiles": score_tiles(truth, result["bounds"]),
+                        "log": result["log"],
+                    }
+                    runs.append(run)
+                    print(format_row(run))
+                
+                if args.keep is None:
+                    sheet_path.unlink()
+                else:
+                    # Sidecar in the format extract_tiles_batch.py reads, plus the ground truth
+                    sheet_path.with_name(f"{sheet_path.stem}.tiles.json").write_text(
+                        json.dumps({"tiles": tiles, "truth": truth}, indent=2))
+    
+    summaries = {detector: summarize([run for run in runs if run["detector"] == detector])
+                 for detector in args.detector}
+    
+    print("\n" + "=" * 60)
+    print("Summary per detector")
+    print("=" * 60)
+    for detector, summary in summaries.items():
+        stages = ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in summary["stage_seconds"].items())
+        peak = f"{summary['peak_rss_mb']:.0f} MB" if summary["peak_rss_mb"] is not None else "n/a"
+        edge = summary["max_edge_error"] if summary["max_edge_error"] is not None else "-"
+        print(f"{detector}:")
+        print(f"  Accuracy: mean IoU {summary['mean_iou']:.4f}, min IoU {summary['min_iou']:.4f}, "
+              f"max edge error {edge} px, {summary['missed_tiles']} tiles missed, "
+              f"{summary['failed_sheets']} sheets failed")
+        print(f"  Speed: {summary['sheets_per_second']:.2f} sheets/s ({stages}), peak RSS {peak}")
+    
+    if args.json is not None:
+        args.json.write_text(json.dumps({"runs": runs, "summary": summaries}, indent=2))
+        print(f"\nResults written to {args.json}")
+    
+    if args.fail_under is not None:
+        worst = min(summary["min_iou"] for summary in summaries.values())
+        if worst < args.fail_under:
+            print(f"\nFAILED: lowest tile IoU {worst:.4f} is under {args.fail_under}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
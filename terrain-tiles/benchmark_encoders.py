@@ -0,0 +1,180 @@
+"""
+Terrain Tile Extractor - Encoder benchmark
+Encodes tiles with every encoder in tile_encoding.py and reports bytes,
+encode time and PSNR per tile and encoder, so the trade-off between client
+download size, upload time and quality can be picked from numbers.
+
+Usage:
+    python benchmark_encoders.py                          # Every tile in this folder (no mips or atlases), every encoder
+    python benchmark_encoders.py --encoders optimized palette webp
+    python benchmark_encoders.py grass.png "s*.png" --repeat 5
+    python benchmark_encoders.py --json encoders.json     # Per-tile results and summaries as JSON
+    python benchmark_encoders.py --jobs 1                 # Uncontended timings (one encode at a time)
+
+The WebP encoders are measured only: Roblox doesn't accept WebP image
+uploads, so the extractors can't write them (see tile_encoding.py).
+Encodes run on --jobs threads (Pillow releases the GIL while encoding);
+with more jobs than CPUs the times include waiting for a CPU.
+
+Requires: Pillow, NumPy (pip install Pillow numpy)
+"""
+
+import argparse
+import io
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:
+    print("Pillow and NumPy are required. Run: pip install Pillow numpy")
+    sys.exit(1)
+
+from tile_encoding import ENCODERS, MEASURE_ONLY_ENCODERS
+from tile_verify import tile_paths_in
+
+ALL_ENCODERS = {**ENCODERS, **MEASURE_ONLY_ENCODERS}
+
+# Sizes are compared with what the extractors write by default
+BASELINE_ENCODER = "pillow"
+
+
+def psnr(original: Image.Image, data: bytes) -> float:
+    """PSNR in dB of encoded bytes against the original pixels (inf if identical)."""
+    with Image.open(io.BytesIO(data)) as decoded:
+        decoded = decoded.convert(original.mode)
+    error = np.asarray(original, dtype=np.float64) - np.asarray(decoded, dtype=np.float64)
+    mse = float(np.mean(error * error))
+    return math.inf if mse == 0 else 10 * math.log10(255 ** 2 / mse)
+
+
+def measure(tile: Image.Image, encoder: str, repeat: int) -> dict:
+    """Encode `repeat` times; returns bytes, the fastest encode in ms and PSNR."""
+    encode = ALL_ENCODERS[encoder]
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        data = encode(tile)
+        best = min(best, time.perf_counter() - start)
+    return {"bytes": len(data), "ms": best * 1000, "psnr": psnr(tile, data)}
+
+
+def load_tiles(patterns: list[str], folder: Path) -> dict[str, Image.Image]:
+    """
+    Tiles from paths or glob patterns (relative to `folder`), decoded to RGB
+    or RGBA. Without patterns, the tiles in `folder`, skipping mips and atlases.
+    """
+    paths = [] if patterns else tile_paths_in(folder)
+    for pattern in patterns:
+        path = Path(pattern)
+        matches = [path] if path.exists() else sorted(folder.glob(pattern))
+        if not matches:
+            print(f"  WARNING: no tiles match {pattern}")
+        paths += [match for match in matches if match not in paths]
+    tiles = {}
+    for path in paths:
+        with Image.open(path) as img:
+            tiles[path.stem] = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+    return tiles
+
+
+def format_psnr(value: float) -> str:
+    return "lossless" if math.isinf(value) else f"{value:.1f}"
+
+
+def summarize(results: dict[str, dict[str, dict]], encoders: list[str]) -> dict[str, dict]:
+    """Totals per encoder: bytes, ms, share of the baseline's bytes, worst and mean PSNR."""
+    summary = {}
+    for encoder in encoders:
+        rows = [tile_results[encoder] for tile_results in results.values()]
+        finite = [row["psnr"] for row in rows if not math.isinf(row["psnr"])]
+        summary[encoder] = {
+            "bytes": sum(row["bytes"] for row in rows),
+            "ms": sum(row["ms"] for row in rows),
+            "min_psnr": min(row["psnr"] for row in rows),
+            "mean_psnr": sum(finite) / len(finite) if finite else math.inf,
+        }
+    if BASELINE_ENCODER in summary:
+        baseline = summary[BASELINE_ENCODER]["bytes"]
+        for totals in summary.values():
+            totals["vs_baseline"] = totals["bytes"] / baseline
+    return summary
+
+
+def json_safe(value):
+    """Infinite PSNR (lossless) as null, since JSON has no infinity."""
+    if isinstance(value, dict):
+        return {key: json_safe(item) for key, item in value.items()}
+    return None if isinstance(value, float) and math.isinf(value) else value
+
+
+def main():
+    script_dir = Path(__file__).parent
+    parser = argparse.ArgumentParser(description="Compare tile encoders by bytes, encode time and PSNR.")
+    parser.add_argument("tiles", nargs="*",
+                        help="Tile paths or glob patterns, relative to the script folder "
+                             "(default: its tiles, without mips and atlases)")
+    parser.add_argument("--encoders", nargs="+", choices=list(ALL_ENCODERS), default=list(ALL_ENCODERS),
+                        help="Encoders to compare (default: all)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Encodes per tile and encoder; the fastest is reported (default: 3)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="Parallel encodes (default: CPU count)")
+    parser.add_argument("--json", type=Path, help="Write per-tile results and summaries to this JSON file")
+    args = parser.parse_args()
+    
+    print("=" * 60)
+    print("Terrain Tile Extractor - ENCODER BENCHMARK")
+    print("=" * 60)
+    
+    tiles = load_tiles(args.tiles, script_dir)
+    if not tiles:
+        print("ERROR: no tiles to encode")
+        sys.exit(1)
+    print(f"Tiles: {len(tiles)}")
+    print(f"Encoders: {', '.join(args.encoders)}")
+    print(f"Jobs: {args.jobs}, best of {args.repeat}")
+    
+    jobs = [(name, encoder) for name in tiles for encoder in args.encoders]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        measured = list(pool.map(lambda job: measure(tiles[job[0]], job[1], args.repeat), jobs))
+    elapsed = time.perf_counter() - start
+    
+    results = {name: {} for name in tiles}
+    for (name, encoder), result in zip(jobs, measured):
+        results[name][encoder] = result
+    
+    print("")
+    print(f"  {'tile':<14} {'encoder':<14} {'bytes':>9} {'ms':>8} {'PSNR dB':>9}")
+    for name, tile_results in results.items():
+        for encoder, result in tile_results.items():
+            print(f"  {name:<14} {encoder:<14} {result['bytes']:>9,} {result['ms']:>8.1f} "
+                  f"{format_psnr(result['psnr']):>9}")
+    
+    summary = summarize(results, args.encoders)
+    print("\n" + "=" * 60)
+    print("Summary per encoder")
+    print("=" * 60)
+    print(f"  {'encoder':<14} {'bytes':>11} {f'vs {BASELINE_ENCODER}':>10} {'ms':>9} {'min PSNR':>9} "
+          f"{'mean PSNR':>9}  upload")
+    for encoder, totals in summary.items():
+        share = f"{totals['vs_baseline']:.0%}" if "vs_baseline" in totals else "-"
+        upload = "yes" if encoder in ENCODERS else "no"
+        print(f"  {encoder:<14} {totals['bytes']:>11,} {share:>10} {totals['ms']:>9.1f} "
+              f"{format_psnr(totals['min_psnr']):>9} {format_psnr(totals['mean_psnr']):>9}  {upload}")
+    print(f"\n{len(jobs)} encodes x {args.repeat} in {elapsed:.1f}s")
+    
+    if args.json:
+        args.json.write_text(json.dumps(json_safe({"tiles": results, "summary": summary}), indent=2))
+        print(f"Wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,19 +5,27 @@ Extracts individual terrain texture tiles from composite screenshot images.
 Usage:
     python extract_tiles.py           # Extract tiles
     python extract_tiles.py --preview # Generate preview showing crop boundaries
+    python extract_tiles.py --auto    # Derive grid params from the image
+    python extract_tiles.py --canonical # Byte-stable PNGs, predict asphalt uploads
+    python extract_tiles.py --encoder palette # Or optimized (lossless), see tile_encoding.py
 
-Requires: Pillow (pip install Pillow)
+Requires: Pillow, NumPy (pip install Pillow numpy)
 """
 
 import sys
 from pathlib import Path
 
 try:
+    import numpy  # noqa: F401 (tile_encoding and the --auto grid detection need it)
     from PIL import Image, ImageDraw
 except ImportError:
-    print("Pillow not installed. Run: pip install Pillow")
+    print("Pillow and NumPy are required. Run: pip install Pillow numpy")
     exit(1)
 
+from extract_tiles_auto import background_mask, detect_lattice, lattice_cell
+from tile_encoding import ENCODERS, report_lock_changes, write_tile
+from tile_preview import PREVIEW_DIR, PREVIEW_FACTOR, preview_base, preview_output_path, save_preview
+
 
 # Grid configuration - adjust these if tiles don't align perfectly
 # These values are estimated from the image layout
@@ -155,31 +163,43 @@ def get_grid_params(width: int, height: int) -> dict:
     }
 
 
-def generate_preview(image_path: Path, tiles: list[tuple[str, int, int]], output_path: Path):
-    """Generate a preview image showing crop boundaries."""
+def derive_grid_params(img: Image.Image) -> dict:
+    """
+    Derive the grid parameters from the image instead of the tuning constants.
+    Pitch and origin come from the tile bands of the background mask and the
+    tile size from its run lengths (see extract_tiles_auto.detect_lattice), so
+    sheets with uniform spacing need no manual margins or ratios. Margins and
+    cell sizes are fractional; lattice_cell rounds them.
+    """
+    params = detect_lattice(background_mask(img))
+    if params is None:
+        raise ValueError("No tiles found: the image is entirely background")
+    return params
+
+
+def generate_preview(image_path: Path, tiles: list[tuple[str, int, int]], output_path: Path,
+                     auto: bool = False):
+    """Generate a lightweight (downscaled, palette) preview image showing crop boundaries."""
     print(f"\nGenerating preview for: {image_path.name}")
     
     if not image_path.exists():
         print(f"  ERROR: File not found: {image_path}")
         return
     
-    img = Image.open(image_path).convert("RGBA")
+    img = Image.open(image_path).convert("RGB")
     width, height = img.size
-    params = get_grid_params(width, height)
+    params = derive_grid_params(img) if auto else get_grid_params(width, height)
     
-    # Create overlay for drawing
-    overlay = Image.new("RGBA", img.size, (0, 0, 0, 0))
-    draw = ImageDraw.Draw(overlay)
+    # Draw straight onto a downscaled copy; coordinates are scaled to match
+    preview = preview_base(img)
+    draw = ImageDraw.Draw(preview, "RGBA")
     
     print(f"  Image size: {width}x{height}")
-    print(f"  Cell size: {params['cell_width']}x{params['cell_height']}")
+    print(f"  Cell size: {params['cell_width']:g}x{params['cell_height']:g}")
     print(f"  Tile size: {params['tile_width']}x{params['tile_height']}")
     
     for name, col, row in tiles:
-        x = params["left_margin"] + col * params["cell_width"]
-        y = params["top_margin"] + row * params["cell_height"]
-        x2 = x + params["tile_width"]
-        y2 = y + params["tile_height"]
+        x, y, x2, y2 = (value // PREVIEW_FACTOR for value in lattice_cell(params, col, row))
         
         # Draw rectangle outline (green = crop boundary)
         draw.rectangle([x, y, x2, y2], outline=(0, 255, 0, 255), width=2)
@@ -198,49 +218,56 @@ def generate_preview(image_path: Path, tiles: list[tuple[str, int, int]], output
         # Label
         draw.text((x + 5, y + 5), name, fill=(255, 255, 0, 255))
     
-    # Composite overlay onto image
-    result = Image.alpha_composite(img, overlay)
-    result.save(output_path, "PNG")
-    print(f"  Saved preview: {output_path.name}")
+    save_preview(preview, output_path)
+    print(f"  Saved preview: {PREVIEW_DIR}/{output_path.name} ({preview.size[0]}x{preview.size[1]})")
 
 
-def process_image(image_path: Path, tiles: list[tuple[str, int, int]], output_dir: Path):
-    """Process a single composite image and extract all tiles."""
+def process_image(image_path: Path, tiles: list[tuple[str, int, int]], output_dir: Path,
+                  auto: bool = False, encoder: str = "pillow") -> list[Path]:
+    """
+    Process a single composite image and extract all tiles.
+    Returns the paths of the extracted tiles.
+    """
     print(f"\nProcessing: {image_path.name}")
     
     if not image_path.exists():
         print(f"  ERROR: File not found: {image_path}")
-        return
+        return []
     
     img = Image.open(image_path)
     width, height = img.size
-    params = get_grid_params(width, height)
+    params = derive_grid_params(img.convert("RGB")) if auto else get_grid_params(width, height)
     
     print(f"  Image size: {width}x{height}")
-    print(f"  Cell size: {params['cell_width']}x{params['cell_height']}")
+    print(f"  Cell size: {params['cell_width']:g}x{params['cell_height']:g}")
     print(f"  Tile size: {params['tile_width']}x{params['tile_height']}")
     
-    extracted = 0
+    written = []
     for name, col, row in tiles:
-        # Calculate tile position
-        x = params["left_margin"] + col * params["cell_width"]
-        y = params["top_margin"] + row * params["cell_height"]
-        
         # Crop just the texture tile
-        tile = img.crop((x, y, x + params["tile_width"], y + params["tile_height"]))
+        tile = img.crop(lattice_cell(params, col, row))
         
-        # Save as PNG
+        # Save as PNG (skipped if the file on disk already holds this tile)
         output_path = output_dir / f"{name}.png"
-        tile.save(output_path, "PNG")
-        print(f"  Extracted: {name}.png ({tile.size[0]}x{tile.size[1]})")
-        extracted += 1
+        _, changed = write_tile(tile, output_path, encoder)
+        print(f"  {'Extracted' if changed else 'Unchanged'}: {name}.png ({tile.size[0]}x{tile.size[1]})")
+        written.append(output_path)
     
-    print(f"  Total extracted: {extracted}")
+    print(f"  Total extracted: {len(written)}")
+    return written
 
 
 def main():
     # Check for preview mode
     preview_mode = "--preview" in sys.argv or "-p" in sys.argv
+    auto_mode = "--auto" in sys.argv or "-a" in sys.argv
+    encoder = "canonical" if "--canonical" in sys.argv or "-c" in sys.argv else "pillow"
+    if "--encoder" in sys.argv:
+        index = sys.argv.index("--encoder") + 1
+        if index >= len(sys.argv) or sys.argv[index] not in ENCODERS:
+            print(f"ERROR: --encoder needs one of: {', '.join(sorted(ENCODERS))}")
+            sys.exit(1)
+        encoder = sys.argv[index]
     
     # Paths
     script_dir = Path(__file__).parent
@@ -264,17 +291,17 @@ def main():
     
     if preview_mode:
         # Generate preview images showing crop boundaries
-        generate_preview(image1_path, IMAGE1_TILES, output_dir / "preview-1.png")
-        generate_preview(image2_path, IMAGE2_TILES, output_dir / "preview-2.png")
+        generate_preview(image1_path, IMAGE1_TILES, preview_output_path(output_dir, "preview-1"), auto=auto_mode)
+        generate_preview(image2_path, IMAGE2_TILES, preview_output_path(output_dir, "preview-2"), auto=auto_mode)
         
         print("\n" + "=" * 50)
         print("Preview generated!")
-        print("Open preview-1.png and preview-2.png to check crop boundaries.")
+        print(f"Open {PREVIEW_DIR}/preview-1.png and preview-2.png to check crop boundaries.")
         print("")
         print("GREEN rectangles = crop boundaries")
         print("RED corners = exact corner positions")
         print("")
-        print("To adjust, edit get_grid_params() in this script:")
+        print("To adjust, edit get_grid_params() in this script (or use --auto):")
         print("  - Increase top_margin to move crops DOWN")
         print("  - Increase left_margin to move crops RIGHT")
         print("  - Increase tile_width_ratio to capture MORE horizontally")
@@ -282,8 +309,11 @@ def main():
         print("=" * 50)
     else:
         # Process both images
-        process_image(image1_path, IMAGE1_TILES, output_dir)
-        process_image(image2_path, IMAGE2_TILES, output_dir)
+        written = process_image(image1_path, IMAGE1_TILES, output_dir, auto=auto_mode, encoder=encoder)
+        written += process_image(image2_path, IMAGE2_TILES, output_dir, auto=auto_mode, encoder=encoder)
+        
+        if encoder == "canonical":
+            report_lock_changes(written, output_dir / "asphalt.lock.toml")
         
         print("\n" + "=" * 50)
         print("Extraction complete!")
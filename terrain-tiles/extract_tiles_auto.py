@@ -1,24 +1,59 @@
 """
 Terrain Tile Extractor - Auto-detect boundaries
 Automatically detects exact tile boundaries by finding white background edges.
+The background mask is computed once per image; edges are found by array scans.
 
 Usage:
     python extract_tiles_auto.py           # Extract tiles
     python extract_tiles_auto.py --preview # Generate preview showing detected boundaries
+    python extract_tiles_auto.py --extract --preview # Both from a single decode and detection
     python extract_tiles_auto.py --debug   # Show detailed detection info
+    python extract_tiles_auto.py --grid    # Detect the whole grid from row/column profiles
+    python extract_tiles_auto.py --lattice # Uniform sheets: fractional pitch/origin fitted to the tile bands
+    python extract_tiles_auto.py --pyramid # Large sheets: coarse grid at up to 1/8 scale, refined edges
+    python extract_tiles_auto.py --label   # Any layout: tiles are connected components, named in reading order
+    python extract_tiles_auto.py --force   # Ignore the extraction cache and re-detect every sheet
+    python extract_tiles_auto.py --canonical # Byte-stable PNGs, predict asphalt uploads
+    python extract_tiles_auto.py --encoder palette # Or optimized (lossless), see tile_encoding.py
+    python extract_tiles_auto.py --stream  # Huge sheets: decode in strips, memory independent of sheet size
+    python extract_tiles_auto.py --report run.json # Stage timings, bounds and cache status as JSON
+    python extract_tiles_auto.py --profile # Also dump cProfile and tracemalloc stats (with allocations per stage)
+    python extract_tiles_auto.py --mips    # Also write 256/128/64/32 px mips and generated/mips.luau
+    python extract_tiles_auto.py --mips 128,64 # Custom mip sizes (longest side, px)
+    python extract_tiles_auto.py --colors  # Mean/median/dominant swatch colors to generated/colors.luau
+    python extract_tiles_auto.py --phash   # Keep tiles that only changed by a few pixels (phash-index.json)
+    python extract_tiles_auto.py --watch   # Then re-run only the sheets that change, until Ctrl+C
+    python extract_tiles_auto.py --verify  # Check sizes, borders, duplicates and names; exit 1 on failure
+    python extract_tiles_auto.py --jobs 4  # Tiles encoded on 4 threads (default: CPU count)
 
-Requires: Pillow (pip install Pillow)
+Requires: Pillow, NumPy (pip install Pillow numpy)
 """
 
+import contextlib
+import os
 import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 try:
+    import numpy as np
     from PIL import Image, ImageDraw
 except ImportError:
-    print("Pillow not installed. Run: pip install Pillow")
+    print("Pillow and NumPy are required. Run: pip install Pillow numpy")
     exit(1)
 
+from tile_cache import file_sha256, load_cache, output_matches, output_record, save_cache, sheet_key
+from tile_colors import write_colors
+from tile_encoding import ENCODERS, encode_tile, file_holding, report_lock_changes, write_tile
+from tile_mips import MIP_SIZES, parse_mip_sizes, write_mips
+from tile_phash import PHASH_INDEX_FILE, load_index, save_index, similar_on_disk, similar_pairs, update_index
+from tile_preview import PREVIEW_DIR, PREVIEW_FACTOR, preview_base, preview_output_path, save_preview
+from tile_report import add_stage_time, recording, sheet_report, stage, start_profile, stop_profile, write_report
+from tile_verify import run_verification
+from tile_watch import watch
+
 
 # Tile definitions (name, column, row)
 IMAGE1_TILES = [
@@ -33,91 +68,124 @@ IMAGE2_TILES = [
     ("water", 0, 2), ("woodplanks", 1, 2), ("air", 2, 2),
 ]
 
+# Known composites (in the parent directory) and the tiles they hold
+SHEETS = {
+    "terrain-raw-asphalt-limestone.png": IMAGE1_TILES,
+    "terrain-raw-mud-air.png": IMAGE2_TILES,
+}
+
+# Pixels with every RGB channel at or above this are white background
+BACKGROUND_THRESHOLD = 245
+
 
-def is_background(pixel: tuple, threshold: int = 245) -> bool:
+def background_mask(img: Image.Image, threshold: int = BACKGROUND_THRESHOLD) -> np.ndarray:
     """
-    Check if a pixel is part of the white background.
-    The background is white (#FFFFFF) or very close to it.
+    Build a boolean mask of the white background, computed once per image.
+    mask[y, x] is True where the pixel is background: all RGB channels at or
+    above threshold (near-white), or alpha below 128 for RGBA images.
     """
-    if len(pixel) == 4:  # RGBA
-        r, g, b, a = pixel
-        if a < 128:  # Transparent
-            return True
-    else:  # RGB
-        r, g, b = pixel[:3]
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGB")
+    pixels = np.asarray(img)
     
-    # Check if all channels are above threshold (near-white)
-    return r >= threshold and g >= threshold and b >= threshold
+    mask = (pixels[..., 0] >= threshold) & (pixels[..., 1] >= threshold) & (pixels[..., 2] >= threshold)
+    if img.mode == "RGBA":
+        mask |= pixels[..., 3] < 128  # Transparent
+    return mask
 
 
-def find_edge(img: Image.Image, start_x: int, start_y: int, dx: int, dy: int, 
-              max_steps: int = 500, threshold: int = 245) -> tuple[int, int]:
+def find_edge(mask: np.ndarray, start_x: int, start_y: int, dx: int, dy: int,
+              max_steps: int = 500) -> tuple[int, int]:
     """
     Walk from start position in direction (dx, dy) until we hit background.
     Returns the last non-background pixel position.
+    
+    The walk is a single array scan: slice the row or column ahead of the
+    start point and argmax for the first background pixel.
     """
-    x, y = start_x, start_y
-    width, height = img.size
+    height, width = mask.shape
     
-    for _ in range(max_steps):
-        next_x = x + dx
-        next_y = y + dy
-        
-        # Check bounds
-        if next_x < 0 or next_x >= width or next_y < 0 or next_y >= height:
-            break
-        
-        pixel = img.getpixel((next_x, next_y))
-        if is_background(pixel, threshold):
-            break
-        
-        x, y = next_x, next_y
+    if dy == 0 and dx in (-1, 1):
+        if dx > 0:
+            ray = mask[start_y, start_x + 1:min(width, start_x + 1 + max_steps)]
+        else:
+            ray = mask[start_y, max(0, start_x - max_steps):start_x][::-1]
+    elif dx == 0 and dy in (-1, 1):
+        if dy > 0:
+            ray = mask[start_y + 1:min(height, start_y + 1 + max_steps), start_x]
+        else:
+            ray = mask[max(0, start_y - max_steps):start_y, start_x][::-1]
+    else:
+        raise ValueError(f"find_edge only walks along an axis, got direction ({dx}, {dy})")
     
-    return x, y
+    # Number of foreground pixels before the first background pixel (or the end of the ray)
+    steps = int(ray.argmax()) if ray.any() else len(ray)
+    return start_x + dx * steps, start_y + dy * steps
 
 
-def detect_tile_bounds(img: Image.Image, approx_center_x: int, approx_center_y: int,
-                       threshold: int = 245, debug: bool = False) -> tuple[int, int, int, int]:
+# Seeds further than this (px) from every tile pixel are reported as not found
+SEED_SEARCH_RADIUS = 70
+
+
+def nearest_foreground(mask: np.ndarray, x: int, y: int,
+                       max_distance: int = SEED_SEARCH_RADIUS) -> tuple[int, int]:
+    """
+    The tile (non-background) pixel nearest to (x, y) in any direction, by
+    exact Euclidean distance. Returns (x, y), or None if there is none
+    within max_distance.
+    
+    Searches squares around the seed whose radius grows 8x, capped at
+    max_distance (8, 64, 70 by default): a hit at distance d <= radius is
+    exact, since every pixel outside the square is further than radius. A
+    seed next to its tile reads a few hundred pixels; only a seed with no
+    tile in reach reads the whole max_distance square. A distance transform
+    of the sheet would read every pixel to answer the handful of seeds that
+    land on background, so it isn't worth building.
+    """
+    radius = 1
+    while True:
+        radius = min(radius * 8, max_distance)
+        left, top = max(0, x - radius), max(0, y - radius)
+        ys, xs = np.nonzero(~mask[top:y + radius + 1, left:x + radius + 1])
+        if len(xs):
+            distances = (xs + left - x) ** 2 + (ys + top - y) ** 2
+            nearest = int(distances.argmin())
+            if distances[nearest] <= radius ** 2:
+                return int(xs[nearest]) + left, int(ys[nearest]) + top
+        if radius == max_distance:
+            return None
+
+
+def detect_tile_bounds(mask: np.ndarray, approx_center_x: int, approx_center_y: int,
+                       debug: bool = False, log: Callable[[str], None] = print) -> tuple[int, int, int, int]:
     """
     Detect the exact bounds of a tile by walking outward from an approximate center.
     Returns (left, top, right, bottom) pixel coordinates.
     """
     # First, make sure we're actually inside a tile (not on background)
-    center_pixel = img.getpixel((approx_center_x, approx_center_y))
-    if is_background(center_pixel, threshold):
-        # Try to find the actual tile by searching nearby
-        found = False
-        for offset in range(1, 50):
-            for dx, dy in [(0, 0), (offset, 0), (-offset, 0), (0, offset), (0, -offset),
-                          (offset, offset), (-offset, -offset), (offset, -offset), (-offset, offset)]:
-                test_x = approx_center_x + dx
-                test_y = approx_center_y + dy
-                if 0 <= test_x < img.size[0] and 0 <= test_y < img.size[1]:
-                    if not is_background(img.getpixel((test_x, test_y)), threshold):
-                        approx_center_x = test_x
-                        approx_center_y = test_y
-                        found = True
-                        break
-            if found:
-                break
+    if mask[approx_center_y, approx_center_x]:
+        # Move to the nearest tile pixel, whichever direction it lies in
+        nearest = nearest_foreground(mask, approx_center_x, approx_center_y)
         
-        if not found:
+        if nearest is None:
             if debug:
-                print(f"    WARNING: Could not find tile at ({approx_center_x}, {approx_center_y})")
+                log(f"    WARNING: Could not find tile at ({approx_center_x}, {approx_center_y})")
             return None
+        
+        approx_center_x, approx_center_y = nearest
     
     # Walk in all 4 directions to find edges
-    _, top = find_edge(img, approx_center_x, approx_center_y, 0, -1, threshold=threshold)  # Up
-    _, bottom = find_edge(img, approx_center_x, approx_center_y, 0, 1, threshold=threshold)  # Down
-    left, _ = find_edge(img, approx_center_x, approx_center_y, -1, 0, threshold=threshold)  # Left
-    right, _ = find_edge(img, approx_center_x, approx_center_y, 1, 0, threshold=threshold)  # Right
+    _, top = find_edge(mask, approx_center_x, approx_center_y, 0, -1)  # Up
+    _, bottom = find_edge(mask, approx_center_x, approx_center_y, 0, 1)  # Down
+    left, _ = find_edge(mask, approx_center_x, approx_center_y, -1, 0)  # Left
+    right, _ = find_edge(mask, approx_center_x, approx_center_y, 1, 0)  # Right
     
     # Also check corners to ensure we have the full extent
     # Sometimes walking straight doesn't capture corner pixels
-    _, corner_top = find_edge(img, left, approx_center_y, 0, -1, threshold=threshold)
-    _, corner_bottom = find_edge(img, left, approx_center_y, 0, 1, threshold=threshold)
-    corner_left, _ = find_edge(img, approx_center_x, top, -1, 0, threshold=threshold)
-    corner_right, _ = find_edge(img, approx_center_x, top, 1, 0, threshold=threshold)
+    _, corner_top = find_edge(mask, left, approx_center_y, 0, -1)
+    _, corner_bottom = find_edge(mask, left, approx_center_y, 0, 1)
+    corner_left, _ = find_edge(mask, approx_center_x, top, -1, 0)
+    corner_right, _ = find_edge(mask, approx_center_x, top, 1, 0)
     
     # Use the most extreme values
     top = min(top, corner_top)
@@ -126,8 +194,8 @@ def detect_tile_bounds(img: Image.Image, approx_center_x: int, approx_center_y:
     right = max(right, corner_right)
     
     if debug:
-        print(f"    Detected bounds: ({left}, {top}) to ({right}, {bottom})")
-        print(f"    Size: {right - left + 1} x {bottom - top + 1}")
+        log(f"    Detected bounds: ({left}, {top}) to ({right}, {bottom})")
+        log(f"    Size: {right - left + 1} x {bottom - top + 1}")
     
     return left, top, right + 1, bottom + 1  # +1 because crop is exclusive on right/bottom
 
@@ -159,129 +227,729 @@ def get_approximate_centers(width: int, height: int, cols: int = 4, rows: int =
     return centers
 
 
-def detect_tile_size(img: Image.Image, tiles: list[tuple[str, int, int]], 
-                     debug: bool = False) -> tuple[int, int]:
+def find_runs(profile: np.ndarray) -> list[tuple[int, int]]:
     """
-    Detect the common tile size by sampling a few tiles and finding the mode.
+    Find runs of consecutive True values in a 1D boolean profile.
+    Returns (start, end) pairs, end exclusive.
     """
-    width, height = img.size
-    centers = get_approximate_centers(width, height)
+    padded = np.concatenate(([False], profile, [False]))
+    edges = np.flatnonzero(padded[1:] != padded[:-1])
+    return list(zip(edges[0::2].tolist(), edges[1::2].tolist()))
+
+
+def occupancy_bands(counts: np.ndarray, min_fill: float = 0.2,
+                    min_run_ratio: float = 0.25) -> list[tuple[int, int]]:
+    """
+    Find the tile bands in a projection profile (foreground pixels per row or column).
+    A band is a run of lines holding at least min_fill of the busiest line's foreground.
+    Runs much shorter than the longest one are label text slivers and get dropped.
+    """
+    peak = counts.max()
+    if peak == 0:
+        return []
     
-    sizes = []
-    for name, col, row in tiles[:6]:  # Sample first 6 tiles
-        idx = row * 4 + col
-        if idx < len(centers):
-            cx, cy = centers[idx]
-            bounds = detect_tile_bounds(img, cx, cy, debug=debug)
-            if bounds:
-                left, top, right, bottom = bounds
-                tile_width = right - left
-                tile_height = bottom - top
-                sizes.append((tile_width, tile_height))
-                if debug:
-                    print(f"  {name}: {tile_width}x{tile_height}")
-    
-    if not sizes:
-        return None, None
+    runs = find_runs(counts >= peak * min_fill)
+    longest = max(end - start for start, end in runs)
+    return [(start, end) for start, end in runs if end - start >= longest * min_run_ratio]
+
+
+def detect_grid(mask: np.ndarray, min_fill: float = 0.2, debug: bool = False,
+                log: Callable[[str], None] = print) -> dict:
+    """
+    Detect the whole tile lattice in one pass over the background mask.
     
-    # Find the most common size (mode)
-    from collections import Counter
-    width_counter = Counter(s[0] for s in sizes)
-    height_counter = Counter(s[1] for s in sizes)
+    The mask is reduced to row and column occupancy profiles once; their
+    foreground runs give the rows x cols lattice. Each cell is then trimmed to
+    the lines that are mostly foreground, which drops label text below a tile.
+    Cells with no such lines are empty (e.g. the (3, 2) slot in IMAGE2_TILES).
     
-    common_width = width_counter.most_common(1)[0][0]
-    common_height = height_counter.most_common(1)[0][0]
+    Returns a dict with the lattice size, the row/column bands, and
+    cells[(col, row)] = (left, top, right, bottom), or None for an empty cell.
+    """
+    height, width = mask.shape
+    row_counts = width - np.count_nonzero(mask, axis=1)
+    col_counts = height - np.count_nonzero(mask, axis=0)
     
-    return common_width, common_height
+    row_bands = occupancy_bands(row_counts, min_fill)
+    col_bands = occupancy_bands(col_counts, min_fill)
+    
+    cells = {}
+    for row, (band_top, band_bottom) in enumerate(row_bands):
+        for col, (band_left, band_right) in enumerate(col_bands):
+            cell = mask[band_top:band_bottom, band_left:band_right]
+            row_fill = 1.0 - np.count_nonzero(cell, axis=1) / cell.shape[1]
+            col_fill = 1.0 - np.count_nonzero(cell, axis=0) / cell.shape[0]
+            cells[(col, row)] = trim_cell(row_fill, col_fill, band_left, band_top)
+            
+            if debug and cells[(col, row)] is not None:
+                left, top, right, bottom = cells[(col, row)]
+                log(f"    Cell ({col}, {row}): ({left}, {top}) to ({right}, {bottom})")
+    
+    return grid_result(col_bands, row_bands, cells)
 
 
-def process_image(image_path: Path, tiles: list[tuple[str, int, int]], 
-                  output_dir: Path, debug: bool = False):
-    """Process a single composite image and extract all tiles with auto-detection."""
-    print(f"\nProcessing: {image_path.name}")
+def trim_cell(row_fill: np.ndarray, col_fill: np.ndarray, band_left: int,
+              band_top: int) -> tuple[int, int, int, int]:
+    """
+    Trim a grid cell to the lines that are mostly foreground.
+    row_fill/col_fill are the foreground fractions of the cell's rows/columns.
+    Returns sheet (left, top, right, bottom), or None for an empty cell.
+    """
+    rows = np.flatnonzero(row_fill >= 0.5)
+    cols = np.flatnonzero(col_fill >= 0.5)
+    if len(rows) == 0 or len(cols) == 0:
+        return None
+    return (band_left + int(cols[0]), band_top + int(rows[0]),
+            band_left + int(cols[-1]) + 1, band_top + int(rows[-1]) + 1)
+
+
+def grid_result(col_bands: list[tuple[int, int]], row_bands: list[tuple[int, int]],
+                cells: dict[tuple[int, int], tuple]) -> dict:
+    """The dict detect_grid returns, from its bands and trimmed cells."""
+    return {
+        "cols": len(col_bands),
+        "rows": len(row_bands),
+        "col_bands": col_bands,
+        "row_bands": row_bands,
+        "cells": cells,
+        "empty": [cell for cell, bounds in cells.items() if bounds is None],
+    }
+
+
+def estimate_period(signal: np.ndarray) -> float:
+    """
+    Estimate the repeat period of a 1D signal from its autocorrelation (via FFT).
+    The period is the highest autocorrelation peak after the first dip below zero,
+    refined to a fraction of a sample by fitting a parabola through the peak.
+    Returns None if there is no dip (a single tile along this axis, or gaps too
+    narrow to pull the correlation below zero) or no peak after it.
+    """
+    centered = signal - signal.mean()
+    n = len(centered)
+    spectrum = np.fft.rfft(centered, 2 * n)  # Zero-padded so the correlation is linear, not circular
+    autocorr = np.fft.irfft(spectrum * np.conj(spectrum))[:n]
     
-    if not image_path.exists():
-        print(f"  ERROR: File not found: {image_path}")
-        return
+    negative = np.flatnonzero(autocorr < 0)
+    if len(negative) == 0:
+        return None
     
-    img = Image.open(image_path).convert("RGB")
+    lag = int(negative[0] + np.argmax(autocorr[negative[0]:]))
+    if autocorr[lag] <= 0:
+        return None
+    if lag + 1 >= n:
+        return float(lag)
+    before, peak, after = autocorr[lag - 1:lag + 2]
+    curvature = before - 2 * peak + after
+    return float(lag + (0.5 * (before - after) / curvature if curvature < 0 else 0.0))
+
+
+# Lines sampled across the sheet to measure tile sizes from foreground run lengths
+SIZE_SAMPLE_LINES = 256
+
+
+def run_length_mode(mask: np.ndarray, shortest: int, longest: int) -> int:
+    """
+    The most common length of the horizontal foreground runs between shortest
+    and longest pixels, over SIZE_SAMPLE_LINES rows spread across the mask.
+    Every row through a tile holds a run of its exact width, while label
+    text, noise and near-white tiles break up into shorter runs.
+    Returns None if no run is in range.
+    """
+    lines = np.unique(np.linspace(0, mask.shape[0] - 1, SIZE_SAMPLE_LINES).astype(int))
+    _, starts, ends = foreground_runs(mask[lines])
+    lengths = ends - starts
+    lengths = lengths[(lengths >= shortest) & (lengths <= longest)]
+    if len(lengths) == 0:
+        return None
+    return int(np.bincount(lengths).argmax())
+
+
+def lattice_axis(mask: np.ndarray, min_fill: float = 0.2,
+                 min_run_ratio: float = 0.25) -> tuple[float, float, int, int]:
+    """
+    Solve the horizontal axis of a uniformly spaced lattice (pass mask.T for
+    the vertical one). Returns (origin, pitch, tile_size, count), or None if
+    the mask has no foreground.
+    
+    The column occupancy profile gives the tile bands; slivers much shorter
+    than the longest band (label text) are dropped. The pitch is fractional
+    (a 1024 px sheet of four tiles has a pitch of 240.64, and rounding it
+    drifts the last tile by several pixels): the spacing of the band starts
+    gives a first estimate, and a least-squares line through them refines it.
+    When the gaps never empty out and there is a single band, the first
+    estimate comes from the autocorrelation of the profile across it instead.
+    The tile size is the most common foreground run length along the rows.
+    """
+    counts = mask.shape[0] - np.count_nonzero(mask, axis=0)
+    peak = counts.max()
+    if peak == 0:
+        return None
+    
+    band = counts >= peak * min_fill
+    runs = find_runs(band)
+    longest = max(end - start for start, end in runs)
+    runs = [(start, end) for start, end in runs if end - start >= longest * min_run_ratio]
+    starts = np.array([start for start, _ in runs], dtype=np.float64)
+    first, last = runs[0][0], runs[-1][1]
+    
+    if len(runs) > 1:
+        pitch = float(np.median(np.diff(starts)))
+    else:
+        # One band: the gaps never drop below min_fill (e.g. jittered tiles), but still dent the profile
+        pitch = estimate_period(counts[first:last].astype(np.float64))
+        if pitch is not None and pitch > last - first:
+            pitch = None
+    if pitch is None:
+        return float(first), float(last - first), last - first, 1
+    
+    # Which lattice slot each band starts, then the best line through the starts
+    origin = float(first)
+    slots = np.round((starts - first) / pitch)
+    if len(np.unique(slots)) > 1:
+        pitch, origin = (float(value) for value in np.polyfit(slots, starts, 1))
+    
+    tile_size = run_length_mode(mask, int(pitch / 2), int(np.ceil(pitch)))
+    if tile_size is None:
+        tile_size = min(end - start for start, end in runs)
+    
+    # The occupied extent spans (count - 1) pitches plus one tile
+    count = int(round((last - first - tile_size) / pitch)) + 1
+    return origin, pitch, tile_size, max(count, 1)
+
+
+def detect_lattice(mask: np.ndarray, min_fill: float = 0.2) -> dict:
+    """
+    Estimate tile pitch, origin and size of a uniformly spaced sheet in closed form.
+    
+    Cost is one profile reduction, two FFTs and a few hundred sampled lines,
+    independent of how many tiles the sheet holds. Keys match
+    extract_tiles.get_grid_params, so the result can stand in for its
+    hand-tuned margins and ratios; margins and cell sizes are fractional, so
+    round (see lattice_cell) when turning them into pixels.
+    Returns None if the mask has no foreground.
+    """
+    x_axis = lattice_axis(mask, min_fill)
+    y_axis = lattice_axis(mask.T, min_fill)
+    if x_axis is None or y_axis is None:
+        return None
+    
+    left_margin, cell_width, tile_width, cols = x_axis
+    top_margin, cell_height, tile_height, rows = y_axis
+    return {
+        "cols": cols,
+        "rows": rows,
+        "left_margin": round(left_margin, 2),
+        "top_margin": round(top_margin, 2),
+        "cell_width": round(cell_width, 2),
+        "cell_height": round(cell_height, 2),
+        "tile_width": tile_width,
+        "tile_height": tile_height,
+    }
+
+
+def lattice_cell(params: dict, col: int, row: int) -> tuple[int, int, int, int]:
+    """Pixel (left, top, right, bottom) of a cell's tile, from detect_lattice or get_grid_params keys."""
+    left = int(round(params["left_margin"] + col * params["cell_width"]))
+    top = int(round(params["top_margin"] + row * params["cell_height"]))
+    return left, top, left + params["tile_width"], top + params["tile_height"]
+
+
+def pyramid_factor(width: int, height: int) -> int:
+    """Downscale factor for coarse detection: 1/8 for 8K+ sheets, 1/4 otherwise."""
+    return 8 if max(width, height) >= 8000 else 4
+
+
+# Narrowest gap between coarse bands (coarse px) the coarse grid is trusted with
+PYRAMID_MIN_GAP = 2
+
+
+def coarse_grid_resolved(grid: dict) -> bool:
+    """
+    Whether a coarse detect_grid result still separates the tiles. Gaps of a
+    few pixels blend into the tiles when reduced: bands then merge (one band
+    much wider than another) or are left a coarse pixel apart.
+    """
+    for bands in (grid["col_bands"], grid["row_bands"]):
+        widths = [end - start for start, end in bands]
+        gaps = [next_start - end for (_, end), (next_start, _) in zip(bands, bands[1:])]
+        if gaps and min(gaps) < PYRAMID_MIN_GAP:
+            return False
+        if widths and max(widths) > 1.5 * min(widths):
+            return False
+    return True
+
+
+def refine_edge(img: Image.Image, box: tuple[int, int, int, int], axis: int,
+                leading: bool) -> int:
+    """
+    Find a tile edge at full resolution inside a narrow band around its coarse position.
+    Only the band is cropped and masked. axis=0 scans rows (top/bottom edges),
+    axis=1 scans columns (left/right edges). The scan starts on the band's side
+    inside the tile (its end for a leading top/left edge, its start for a
+    bottom/right one) and stops at the first line that isn't mostly foreground,
+    so a neighbouring tile or label further out in the band is never reached.
+    Returns None if the band doesn't start inside the tile or never leaves it.
+    """
+    band = background_mask(img.crop(box))
+    fill = 1.0 - np.count_nonzero(band, axis=1 - axis) / band.shape[1 - axis]
+    inside = fill >= 0.5
+    if leading:
+        inside = inside[::-1]
+    outside = np.flatnonzero(~inside)
+    if not inside[0] or len(outside) == 0:
+        return None
+    steps = int(outside[0])  # Tile lines between the interior end of the band and the edge
+    return box[axis ^ 1] + (len(inside) - steps if leading else steps)
+
+
+def refine_bounds(img: Image.Image, coarse_bounds: tuple[int, int, int, int],
+                  factor: int) -> tuple[int, int, int, int]:
+    """
+    Refine bounds detected on a 1/factor image to exact full-resolution bounds.
+    Each edge is searched within +/- 2 coarse pixels, outward from the tile's
+    interior, over a span inside the tile so neighbouring tiles and labels to
+    the side stay out of the band.
+    """
     width, height = img.size
-    print(f"  Image size: {width}x{height}")
+    left, top, right, bottom = (value * factor for value in coarse_bounds)
+    pad = 2 * factor
     
-    # Detect common tile size first
-    print("  Detecting tile size...")
-    tile_width, tile_height = detect_tile_size(img, tiles, debug=debug)
-    if tile_width is None:
-        print("  ERROR: Could not detect tile size")
-        return
-    print(f"  Detected tile size: {tile_width}x{tile_height}")
+    def interior(start: int, end: int) -> tuple[int, int]:
+        # Span safely inside the tile; tiny tiles fall back to their coarse span
+        return (start + pad, end - pad) if end - start > 2 * pad else (start, end)
+    
+    def refined(coarse: int, box: tuple[int, int, int, int], axis: int, leading: bool) -> int:
+        edge = refine_edge(img, box, axis, leading)
+        return coarse if edge is None else edge
+    
+    inner_left, inner_right = interior(left, right)
+    top = refined(top, (inner_left, max(0, top - pad), inner_right, min(height, top + pad)), 0, True)
+    bottom = refined(bottom, (inner_left, max(0, bottom - pad), inner_right, min(height, bottom + pad)), 0, False)
+    
+    inner_top, inner_bottom = interior(top, bottom)
+    left = refined(left, (max(0, left - pad), inner_top, min(width, left + pad), inner_bottom), 1, True)
+    right = refined(right, (max(0, right - pad), inner_top, min(width, right + pad), inner_bottom), 1, False)
+    
+    return left, top, right, bottom
+
+
+def detect_grid_pyramid(img: Image.Image, factor: int = None, debug: bool = False,
+                        log: Callable[[str], None] = print) -> dict:
+    """
+    Coarse-to-fine version of detect_grid for very large composites.
+    
+    The lattice is detected on a 1/factor image (Image.reduce), then each tile edge
+    is refined at full resolution inside a narrow band. No full-resolution mask is
+    ever built, so detection work and memory scale with the coarse image plus the
+    edge bands. Returns the same structure as detect_grid, in full-resolution pixels.
+    
+    Without an explicit factor, the factor is halved (down to full resolution)
+    while the gaps between tiles are too narrow to survive the reduce.
+    """
+    adaptive = factor is None
+    if adaptive:
+        factor = pyramid_factor(*img.size)
+    
+    coarse = detect_grid(background_mask(img.reduce(factor)))
+    while adaptive and factor > 1 and not coarse_grid_resolved(coarse):
+        factor //= 2
+        coarse = detect_grid(background_mask(img.reduce(factor)))
+    
+    cells = {}
+    for cell, coarse_bounds in coarse["cells"].items():
+        cells[cell] = None if coarse_bounds is None else refine_bounds(img, coarse_bounds, factor)
+        if debug and cells[cell] is not None:
+            left, top, right, bottom = cells[cell]
+            log(f"    Cell {cell}: coarse {coarse_bounds} -> ({left}, {top}) to ({right}, {bottom})")
     
-    # Get approximate centers
+    return {
+        "cols": coarse["cols"],
+        "rows": coarse["rows"],
+        "col_bands": [(start * factor, end * factor) for start, end in coarse["col_bands"]],
+        "row_bands": [(start * factor, end * factor) for start, end in coarse["row_bands"]],
+        "cells": cells,
+        "empty": coarse["empty"],
+        "factor": factor,
+    }
+
+
+def foreground_runs(mask: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Horizontal runs of foreground in the background mask, in reading order.
+    Returns (rows, starts, ends) arrays, ends exclusive.
+    """
+    height, width = mask.shape
+    padded = np.ones((height, width + 2), dtype=bool)
+    padded[:, 1:-1] = mask
+    edges = padded[:, 1:] != padded[:, :-1]  # Alternating run starts and ends along each row
+    rows, cols = np.nonzero(edges)
+    return rows[0::2], cols[0::2], cols[1::2]
+
+
+def label_runs(rows: np.ndarray, starts: np.ndarray, ends: np.ndarray, width: int) -> np.ndarray:
+    """
+    Connected-component label of every run (4-connected), by vectorized union-find.
+    Runs on consecutive rows that overlap are joined: the runs a run touches on the
+    row above are a contiguous range, found by binary search on run keys.
+    Returns the smallest run index of each run's component.
+    """
+    stride = width + 1
+    start_keys = rows * stride + starts
+    end_keys = rows * stride + ends
+    below = np.flatnonzero(rows > 0)
+    row_above = (rows[below] - 1) * stride
+    first = np.searchsorted(end_keys, row_above + starts[below], side="right")
+    last = np.searchsorted(start_keys, row_above + ends[below], side="left")
+    counts = np.maximum(last - first, 0)
+    a = np.repeat(below, counts)
+    b = np.repeat(first, counts) + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    
+    parent = np.arange(len(rows))
+    while True:
+        root_a, root_b = parent[a], parent[b]
+        if np.array_equal(root_a, root_b):
+            return parent
+        low = np.minimum(root_a, root_b)
+        np.minimum.at(parent, root_a, low)
+        np.minimum.at(parent, root_b, low)
+        # Pointer jumping until every run points straight at its root
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+
+
+def find_components(mask: np.ndarray) -> list[dict]:
+    """
+    Every foreground component of the mask in one pass.
+    Returns [{"bounds": (left, top, right, bottom), "area": pixels}, ...].
+    """
+    rows, starts, ends = foreground_runs(mask)
+    if len(rows) == 0:
+        return []
+    
+    labels = label_runs(rows, starts, ends, mask.shape[1])
+    roots, index = np.unique(labels, return_inverse=True)
+    count = len(roots)
+    left = np.full(count, mask.shape[1])
+    top = np.full(count, mask.shape[0])
+    right = np.zeros(count, dtype=np.int64)
+    bottom = np.zeros(count, dtype=np.int64)
+    area = np.zeros(count, dtype=np.int64)
+    np.minimum.at(left, index, starts)
+    np.minimum.at(top, index, rows)
+    np.maximum.at(right, index, ends)
+    np.maximum.at(bottom, index, rows + 1)
+    np.add.at(area, index, ends - starts)
+    
+    return [{"bounds": (int(l), int(t), int(r), int(b)), "area": int(a)}
+            for l, t, r, b, a in zip(left, top, right, bottom, area)]
+
+
+def tile_components(components: list[dict], min_size: float = 0.25, max_aspect: float = 3.0,
+                    min_fill: float = 0.5) -> list[dict]:
+    """
+    Keep the components that look like tiles, taking the largest one as a tile.
+    Label text and specks are much smaller than it, lines of text are far more
+    elongated than it, and outlines are mostly empty inside their bounding box.
+    """
+    if not components:
+        return []
+    
+    def shape(component: dict) -> tuple[int, float]:
+        left, top, right, bottom = component["bounds"]
+        return (right - left) * (bottom - top), (right - left) / (bottom - top)
+    
+    largest_area, largest_aspect = max(shape(component) for component in components)
+    kept = []
+    for component in components:
+        area, aspect = shape(component)
+        if area < largest_area * min_size:
+            continue
+        if not 1 / max_aspect <= aspect / largest_aspect <= max_aspect:
+            continue
+        if component["area"] < area * min_fill:
+            continue
+        kept.append(component)
+    return kept
+
+
+def reading_order(boxes: list[tuple[int, int, int, int]]) -> list[list[tuple[int, int, int, int]]]:
+    """
+    Group boxes into rows, top to bottom, each sorted left to right.
+    A box joins the current row if its vertical center lies within the row's first box.
+    """
+    rows = []
+    for box in sorted(boxes, key=lambda box: (box[1], box[0])):
+        center_y = (box[1] + box[3]) / 2
+        if rows and rows[-1][0][1] <= center_y < rows[-1][0][3]:
+            rows[-1].append(box)
+        else:
+            rows.append([box])
+    return [sorted(row) for row in rows]
+
+
+def detect_tiles_seeded(img: Image.Image, tiles: list[tuple[str, int, int]],
+                        debug: bool = False, mask: np.ndarray = None,
+                        log: Callable[[str], None] = print) -> dict[str, tuple]:
+    """
+    Detect each tile by walking outward from its approximate grid center.
+    mask is the image's background_mask, if the caller already built it.
+    Returns {name: ((seed_x, seed_y), bounds or None)}.
+    """
+    if mask is None:
+        mask = background_mask(img)
+    height, width = mask.shape
     centers = get_approximate_centers(width, height)
     
-    extracted = 0
+    detections = {}
     for name, col, row in tiles:
         idx = row * 4 + col
         if idx >= len(centers):
-            print(f"  WARNING: No center for {name} at ({col}, {row})")
+            log(f"  WARNING: No center for {name} at ({col}, {row})")
             continue
         
         cx, cy = centers[idx]
-        bounds = detect_tile_bounds(img, cx, cy, debug=debug)
+        detections[name] = ((cx, cy), detect_tile_bounds(mask, cx, cy, debug=debug, log=log))
+    
+    return detections
+
+
+def name_grid_cells(grid: dict, tiles: list[tuple[str, int, int]],
+                    log: Callable[[str], None] = print) -> dict[str, tuple]:
+    """
+    Assign tile names to the cells of a detected grid, flagging empty and unnamed cells.
+    Returns {name: ((cell_center_x, cell_center_y), bounds or None)}.
+    """
+    log(f"  Detected grid: {grid['cols']} cols x {grid['rows']} rows")
+    if grid["empty"]:
+        log(f"  Empty cells: {', '.join(str(cell) for cell in grid['empty'])}")
+    
+    detections = {}
+    for name, col, row in tiles:
+        if (col, row) not in grid["cells"]:
+            log(f"  WARNING: {name} at ({col}, {row}) is outside the detected grid")
+            continue
         
-        if bounds is None:
-            print(f"  WARNING: Could not detect bounds for {name}")
+        left, right = grid["col_bands"][col]
+        top, bottom = grid["row_bands"][row]
+        detections[name] = (((left + right) // 2, (top + bottom) // 2), grid["cells"][(col, row)])
+    
+    named_cells = {(col, row) for _, col, row in tiles}
+    for cell, bounds in grid["cells"].items():
+        if bounds is not None and cell not in named_cells:
+            log(f"  WARNING: Tile found at {cell} but no name is assigned to it")
+    
+    return detections
+
+
+def detect_tiles_grid(img: Image.Image, tiles: list[tuple[str, int, int]],
+                      debug: bool = False, mask: np.ndarray = None,
+                      log: Callable[[str], None] = print) -> dict[str, tuple]:
+    """
+    Detect every tile from the projection-profile lattice, no seeds or margins needed.
+    mask is the image's background_mask, if the caller already built it.
+    Returns {name: ((cell_center_x, cell_center_y), bounds or None)}.
+    """
+    if mask is None:
+        mask = background_mask(img)
+    return name_grid_cells(detect_grid(mask, debug=debug, log=log), tiles, log=log)
+
+
+def detect_tiles_pyramid(img: Image.Image, tiles: list[tuple[str, int, int]],
+                         debug: bool = False, log: Callable[[str], None] = print) -> dict[str, tuple]:
+    """
+    Detect the projection-profile lattice on a downscaled image, refining edges at full res.
+    Returns {name: ((cell_center_x, cell_center_y), bounds or None)}.
+    """
+    grid = detect_grid_pyramid(img, debug=debug, log=log)
+    log(f"  Coarse detection at 1/{grid['factor']} scale")
+    return name_grid_cells(grid, tiles, log=log)
+
+
+def detect_tiles_lattice(img: Image.Image, tiles: list[tuple[str, int, int]],
+                         debug: bool = False, mask: np.ndarray = None,
+                         log: Callable[[str], None] = print) -> dict[str, tuple]:
+    """
+    Compute every tile rectangle arithmetically from the fitted lattice (detect_lattice).
+    Only suited to sheets with uniform spacing. A cell whose center is background
+    is reported as empty. mask is the image's background_mask, if the caller
+    already built it.
+    Returns {name: ((cell_center_x, cell_center_y), bounds or None)}.
+    """
+    if mask is None:
+        mask = background_mask(img)
+    lattice = detect_lattice(mask)
+    if lattice is None:
+        log("  WARNING: No foreground found, cannot estimate lattice")
+        return {}
+    
+    log(f"  Detected lattice: {lattice['cols']} cols x {lattice['rows']} rows, "
+          f"pitch {lattice['cell_width']:g}x{lattice['cell_height']:g}, "
+          f"origin ({lattice['left_margin']:g}, {lattice['top_margin']:g}), "
+          f"tile {lattice['tile_width']}x{lattice['tile_height']}")
+    
+    detections = {}
+    for name, col, row in tiles:
+        if col >= lattice["cols"] or row >= lattice["rows"]:
+            log(f"  WARNING: {name} at ({col}, {row}) is outside the detected lattice")
             continue
         
-        left, top, right, bottom = bounds
+        left, top, right, bottom = lattice_cell(lattice, col, row)
+        cx, cy = (left + right) // 2, (top + bottom) // 2
         
-        # Crop the tile
-        tile = img.crop((left, top, right, bottom))
+        if mask[cy, cx]:
+            if debug:
+                log(f"    Cell ({col}, {row}) is empty")
+            detections[name] = ((cx, cy), None)
+            continue
         
-        # Save as PNG
-        output_path = output_dir / f"{name}.png"
-        tile.save(output_path, "PNG")
-        print(f"  Extracted: {name}.png ({tile.size[0]}x{tile.size[1]}) at ({left},{top})")
-        extracted += 1
+        detections[name] = ((cx, cy), (left, top, right, bottom))
     
-    print(f"  Total extracted: {extracted}")
+    return detections
 
 
-def generate_preview(image_path: Path, tiles: list[tuple[str, int, int]], 
-                     output_path: Path, debug: bool = False):
-    """Generate a preview image showing auto-detected boundaries."""
-    print(f"\nGenerating preview for: {image_path.name}")
+def detect_tiles_labeled(img: Image.Image, tiles: list[tuple[str, int, int]],
+                         debug: bool = False, mask: np.ndarray = None,
+                         log: Callable[[str], None] = print) -> dict[str, tuple]:
+    """
+    Find every tile as a connected component of the foreground, with no grid
+    assumed. Components that aren't tile-like (label text) are dropped, the
+    rest are put in reading order and named in the layout's (row, col) order,
+    so a sheet of any shape works with a plain list of names. mask is the
+    image's background_mask, if the caller already built it.
+    Returns {name: ((center_x, center_y), bounds)}; names left over are reported and omitted.
+    """
+    if mask is None:
+        mask = background_mask(img)
+    components = find_components(mask)
+    found = tile_components(components)
+    rows = reading_order([component["bounds"] for component in found])
+    log(f"  Labeled {len(components)} components: {len(found)} tiles in "
+          f"{len(rows)} rows ({', '.join(str(len(row)) for row in rows)})")
     
-    if not image_path.exists():
-        print(f"  ERROR: File not found: {image_path}")
-        return
+    ordered = [box for row in rows for box in row]
+    names = [name for name, _, _ in sorted(tiles, key=lambda tile: (tile[2], tile[1]))]
+    if len(ordered) < len(names):
+        log(f"  WARNING: No tile left for {', '.join(names[len(ordered):])}")
     
-    img = Image.open(image_path).convert("RGBA")
-    width, height = img.size
-    print(f"  Image size: {width}x{height}")
+    detections = {}
+    for name, (left, top, right, bottom) in zip(names, ordered):
+        detections[name] = (((left + right) // 2, (top + bottom) // 2), (left, top, right, bottom))
+        if debug:
+            log(f"    {name}: ({left}, {top}) to ({right}, {bottom})")
+    for left, top, right, bottom in ordered[len(names):]:
+        log(f"  WARNING: Tile found at ({left}, {top}) but no name is assigned to it")
     
-    # Create overlay for drawing
-    overlay = Image.new("RGBA", img.size, (0, 0, 0, 0))
-    draw = ImageDraw.Draw(overlay)
+    return detections
+
+
+# Every detector is called as detector(img, tiles, debug=False, log=print); progress
+# and warnings go to log one line at a time, so in-process callers can redirect them
+DETECTORS = {
+    "seed": detect_tiles_seeded,
+    "grid": detect_tiles_grid,
+    "lattice": detect_tiles_lattice,
+    "pyramid": detect_tiles_pyramid,
+    "label": detect_tiles_labeled,
+}
+
+# Detectors that work on the full-resolution background mask (and take it as mask=)
+MASK_DETECTORS = {"seed", "grid", "lattice", "label"}
+
+
+def common_tile_size(bounds_list: list[tuple[int, int, int, int]]) -> tuple[int, int]:
+    """Find the common tile size (mode of widths and heights) among detected bounds."""
+    if not bounds_list:
+        return None, None
     
-    # Get approximate centers
-    centers = get_approximate_centers(width, height)
+    from collections import Counter
+    width_counter = Counter(right - left for left, _, right, _ in bounds_list)
+    height_counter = Counter(bottom - top for _, top, _, bottom in bounds_list)
     
-    # Convert to RGB for detection (RGBA can cause issues)
-    img_rgb = img.convert("RGB")
+    common_width = width_counter.most_common(1)[0][0]
+    common_height = height_counter.most_common(1)[0][0]
     
-    for name, col, row in tiles:
-        idx = row * 4 + col
-        if idx >= len(centers):
-            continue
+    return common_width, common_height
+
+
+def save_tiles(img: Image.Image, crops: dict[str, tuple[int, int, int, int]],
+               output_dir: Path, jobs: int = 1, encoder: str = "pillow",
+               stats: dict = None, phash_index: dict = None) -> dict[str, tuple[Path, str, bool]]:
+    """
+    Crop and PNG-encode tiles, `jobs` at a time.
+    Pillow and zlib release the GIL while encoding, so threads encode in parallel.
+    A tile already on disk is not rewritten (see tile_encoding.write_tile),
+    so its mtime is preserved.
+    With a phash_index (see tile_phash.py), a tile that changed but looks the
+    same as the one on disk keeps the file on disk, and the index is updated
+    in place.
+    If given, `stats` receives {name: {"crop", "encode", "write", "bytes"}},
+    plus "similar" (the perceptual distance) for tiles kept that way.
+    Returns {name: (path, sha256, changed)} in the order of `crops`.
+    """
+    def save(item: tuple[str, tuple[int, int, int, int]]) -> tuple[Path, str, bool]:
+        name, bounds = item
+        output_path = output_dir / f"{name}.png"
+        start = time.perf_counter()
+        tile = img.crop(bounds)
+        tile_stats = {"crop": time.perf_counter() - start}
+        if stats is not None:
+            stats[name] = tile_stats
         
-        cx, cy = centers[idx]
+        if phash_index is None:
+            digest, changed = write_tile(tile, output_path, encoder, stats=tile_stats)
+            return output_path, digest, changed
         
-        # Draw approximate center (yellow dot)
-        draw.ellipse([cx-3, cy-3, cx+3, cy+3], fill=(255, 255, 0, 200))
+        # Same bytes (or pixels) first: only a tile that really changed goes through the pHash check
+        data, digest = encode_tile(tile, encoder, stats=tile_stats)
+        start = time.perf_counter()
+        on_disk = file_holding(output_path, tile, data, digest, encoder)
+        if on_disk is None:
+            hashes, similar = similar_on_disk(phash_index, output_path, tile)
+            if similar is not None:
+                on_disk = phash_index[name]["sha256"]
+                tile_stats.update(bytes=output_path.stat().st_size, similar=similar)
+            else:
+                output_path.write_bytes(data)
+                phash_index[name] = {**hashes, "sha256": digest}
+        tile_stats["write"] = time.perf_counter() - start
+        return (output_path, digest, True) if on_disk is None else (output_path, on_disk, False)
+    
+    if jobs <= 1:
+        results = [save(item) for item in crops.items()]
+    else:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(save, crops.items()))
+    return dict(zip(crops, results))
+
+
+def cached_sheet(cache: dict, image_path: Path, key: str, output_dir: Path) -> dict:
+    """Return the cache entry for a composite if its key matches and its outputs are untouched."""
+    entry = cache.get(str(image_path.resolve()))
+    if entry is None or entry["key"] != key:
+        return None
+    for name, record in entry["outputs"].items():
+        if not output_matches(output_dir / f"{name}.png", record):
+            return None
+    return entry
+
+
+def draw_detections(img: Image.Image, detections: dict[str, tuple], debug: bool = False,
+                    factor: int = 1):
+    """
+    Draw detected boundaries straight onto an RGB image that is 1/factor of the sheet.
+    Colors are alpha-blended by ImageDraw in RGBA mode, so no overlay layer
+    or RGBA copy is needed. Modifies img in place.
+    """
+    draw = ImageDraw.Draw(img, "RGBA")
+    
+    for name, ((cx, cy), bounds) in detections.items():
+        cx, cy = cx // factor, cy // factor
         
-        # Detect bounds
-        bounds = detect_tile_bounds(img_rgb, cx, cy, debug=debug)
+        # Draw search anchor (yellow dot)
+        draw.ellipse([cx-3, cy-3, cx+3, cy+3], fill=(255, 255, 0, 200))
         
         if bounds is None:
             # Draw red X for failed detection
@@ -289,7 +957,11 @@ def generate_preview(image_path: Path, tiles: list[tuple[str, int, int]],
             draw.line([cx-10, cy+10, cx+10, cy-10], fill=(255, 0, 0, 255), width=3)
             continue
         
-        left, top, right, bottom = bounds
+        if debug:
+            left, top, right, bottom = bounds
+            print(f"  {name}: ({left},{top}) to ({right},{bottom}) = {right-left}x{bottom-top}")
+        
+        left, top, right, bottom = (value // factor for value in bounds)
         
         # Draw detected rectangle (green)
         draw.rectangle([left, top, right-1, bottom-1], outline=(0, 255, 0, 255), width=2)
@@ -303,58 +975,398 @@ def generate_preview(image_path: Path, tiles: list[tuple[str, int, int]],
         
         # Label
         draw.text((left + 5, top + 5), name, fill=(255, 255, 0, 255))
+
+
+def render_preview(img: Image.Image, detections: dict[str, tuple], output_path: Path,
+                   debug: bool = False, reduced: bool = False):
+    """
+    Draw detections on a downscaled copy of the sheet and save it as a lightweight preview.
+    With reduced, img already is that copy (see preview_base and sheet_preview_base).
+    """
+    preview = img if reduced else preview_base(img)
+    draw_detections(preview, detections, debug=debug, factor=PREVIEW_FACTOR)
+    save_preview(preview, output_path)
+    print(f"  Saved preview: {PREVIEW_DIR}/{output_path.name} ({preview.size[0]}x{preview.size[1]})")
+
+
+def report_phash_changes(reports: list[dict], phash_index: dict):
+    """Summarize which materials really changed, and flag tiles that look alike."""
+    tiles = {name: entry for report in reports for name, entry in report["tiles"].items()}
+    changed = sorted(name for name, entry in tiles.items() if entry["changed"])
+    kept = sorted(name for name, entry in tiles.items() if entry.get("similar") is not None)
+    
+    print(f"\nPerceptual check ({PHASH_INDEX_FILE}):")
+    print(f"  Changed materials: {len(changed)}" + (f": {', '.join(changed)}" if changed else ""))
+    if kept:
+        print(f"  Kept, only changed by noise or a few pixels: {len(kept)}: {', '.join(kept)}")
+    for name, other, distance in similar_pairs({name: phash_index[name] for name in tiles if name in phash_index}):
+        print(f"  WARNING: {name} and {other} look the same (distance {distance})")
+
+
+def tile_stream():
+    """The streaming decoder, imported on first use (it builds on this module)."""
+    import tile_stream
+    return tile_stream
+
+
+def sheet_preview_base(image_path: Path, stream: bool = False) -> Image.Image:
+    """
+    The downscaled copy of a composite that previews are drawn on (see
+    preview_base), straight from the file: reduced strip by strip when
+    streaming, so the full sheet is never held or spooled; else decoded in full.
+    """
+    if stream:
+        try:
+            return tile_stream().reduce_png(image_path, PREVIEW_FACTOR)
+        except ValueError:
+            pass
+    with Image.open(image_path) as img:
+        return preview_base(img)
+
+
+def process_image(image_path: Path, tiles: list[tuple[str, int, int]], 
+                  output_dir: Path, debug: bool = False, detector: str = "seed",
+                  jobs: int = 1, cache: dict = None, encoder: str = "pillow",
+                  preview_path: Path = None, report: dict = None, stream: bool = False,
+                  phash_index: dict = None) -> list[Path]:
+    """
+    Process a single composite image and extract all tiles with auto-detection.
+    With a cache (see tile_cache.py), an unchanged composite whose outputs are
+    untouched skips decode, detection and encode; the entry is updated in place.
+    With preview_path, the preview is drawn from the same decode and detection
+    once the tiles are saved (on a cache hit, from the cached bounds).
+    With a report (see tile_report.sheet_report), stage timings, cache status
+    and every tile's bounds and output are recorded into it.
+    With stream, the sheet is decoded strip by strip into a temporary spool and
+    detected with the grid detector (see tile_stream.py), so memory use does not
+    grow with the sheet; sheets that can't be streamed are decoded in full.
+    With a phash_index (see tile_phash.py), tiles that only differ from the
+    ones on disk by a few pixels of border or compression noise are kept.
+    Returns the paths of the extracted tiles.
+    """
+    print(f"\nProcessing: {image_path.name}")
+    
+    if not image_path.exists():
+        print(f"  ERROR: File not found: {image_path}")
+        return []
+    
+    with recording(report), contextlib.ExitStack() as sheets:
+        if cache is not None:
+            with stage("cache"):
+                key = sheet_key(file_sha256(image_path), {
+                    "detector": detector,
+                    "encoder": encoder,
+                    "threshold": BACKGROUND_THRESHOLD,
+                    "tiles": tiles,
+                })
+                entry = cached_sheet(cache, image_path, key, output_dir)
+            if report is not None:
+                report["cache"] = "miss" if entry is None else "hit"
+            if entry is not None:
+                print(f"  Cache hit: {len(entry['outputs'])} tiles unchanged, skipped")
+                if report is not None:
+                    report["tiles"] = {
+                        name: {"bounds": entry["bounds"][name], "path": str(output_dir / f"{name}.png"),
+                               "sha256": record["sha256"], "bytes": record["size"], "changed": False}
+                        for name, record in entry["outputs"].items()
+                    }
+                if preview_path is not None:
+                    with stage("preview"):
+                        render_preview(sheet_preview_base(image_path, stream), {
+                            name: (((left + right) // 2, (top + bottom) // 2), (left, top, right, bottom))
+                            for name, (left, top, right, bottom) in entry["bounds"].items()
+                        }, preview_path, reduced=True)
+                return [output_dir / f"{name}.png" for name in entry["outputs"]]
         
-        if debug:
-            print(f"  {name}: ({left},{top}) to ({right},{bottom}) = {right-left}x{bottom-top}")
+        # The only full-size decode; tiles and the preview all come from this buffer
+        profiles = None
+        if stream:
+            try:
+                with stage("decode"):
+                    img, *profiles = tile_stream().spool_png(image_path)
+                sheets.enter_context(img)  # Deletes the spool when the sheet is done
+            except ValueError as error:
+                print(f"  WARNING: Can't stream ({error}), decoding in full")
+        if profiles is None:
+            with stage("decode"):
+                img = Image.open(image_path)
+                img.load()
+            with stage("convert"):
+                img = img.convert("RGB")
+        width, height = img.size
+        print(f"  Image size: {width}x{height}")
+        if report is not None:
+            report["size"] = [width, height]
+        
+        mask = None
+        if profiles is None and detector in MASK_DETECTORS:
+            with stage("mask"):
+                mask = background_mask(img)
+        
+        with stage("detect"):
+            if profiles is not None:
+                detections = tile_stream().detect_tiles_streamed(img, *profiles, tiles, debug=debug)
+            elif mask is not None:
+                detections = DETECTORS[detector](img, tiles, debug=debug, mask=mask)
+            else:
+                detections = DETECTORS[detector](img, tiles, debug=debug)
+        
+        tile_width, tile_height = common_tile_size([bounds for _, bounds in detections.values() if bounds])
+        if tile_width is None:
+            print("  ERROR: Could not detect tile size")
+            return []
+        print(f"  Detected tile size: {tile_width}x{tile_height}")
+        
+        crops = {}
+        for name, (_, bounds) in detections.items():
+            if bounds is None:
+                print(f"  WARNING: Could not detect bounds for {name}")
+                continue
+            crops[name] = bounds
+        
+        stats = {}
+        saved = save_tiles(img, crops, output_dir, jobs=jobs, encoder=encoder, stats=stats,
+                           phash_index=phash_index)
+        for name, (left, top, right, bottom) in crops.items():
+            status = "Extracted" if saved[name][2] else "Unchanged"
+            if "similar" in stats[name]:
+                status = f"Kept (looks the same, distance {stats[name]['similar']})"
+            print(f"  {status}: {name}.png ({right - left}x{bottom - top}) at ({left},{top})")
+        
+        changed = sum(1 for _, _, is_changed in saved.values() if is_changed)
+        print(f"  Total extracted: {len(saved)} ({changed} written, {len(saved) - changed} unchanged)")
+        
+        if report is not None:
+            for name, (path, digest, is_changed) in saved.items():
+                tile_stats = stats[name]
+                report["tiles"][name] = {
+                    "bounds": crops[name], "path": str(path), "sha256": digest,
+                    "bytes": tile_stats["bytes"], "changed": is_changed, "similar": tile_stats.get("similar"),
+                    "seconds": {part: tile_stats[part] for part in ("crop", "encode", "write")},
+                }
+                # Summed over tiles; with jobs > 1 these overlap in wall time
+                for part in ("crop", "encode", "write"):
+                    add_stage_time(report, part, tile_stats[part])
+        
+        if cache is not None:
+            cache[str(image_path.resolve())] = {
+                "key": key,
+                "bounds": crops,
+                "outputs": {name: output_record(path, digest) for name, (path, digest, _) in saved.items()},
+            }
+        
+        if preview_path is not None:
+            with stage("preview"):
+                render_preview(img, detections, preview_path, debug=debug)
+        
+        return [path for path, _, _ in saved.values()]
+
+
+def generate_preview(image_path: Path, tiles: list[tuple[str, int, int]], 
+                     output_path: Path, debug: bool = False, detector: str = "seed",
+                     stream: bool = False):
+    """Generate a preview image showing auto-detected boundaries."""
+    print(f"\nGenerating preview for: {image_path.name}")
+    
+    if not image_path.exists():
+        print(f"  ERROR: File not found: {image_path}")
+        return
+    
+    if stream:
+        try:
+            sheet, *profiles = tile_stream().spool_png(image_path)
+        except ValueError as error:
+            print(f"  WARNING: Can't stream ({error}), decoding in full")
+        else:
+            with sheet:
+                print(f"  Image size: {sheet.size[0]}x{sheet.size[1]}")
+                detections = tile_stream().detect_tiles_streamed(sheet, *profiles, tiles, debug=debug)
+                render_preview(sheet, detections, output_path, debug=debug)
+            return
+    
+    img = Image.open(image_path).convert("RGB")
+    width, height = img.size
+    print(f"  Image size: {width}x{height}")
     
-    # Composite overlay onto image
-    result = Image.alpha_composite(img, overlay)
-    result.save(output_path, "PNG")
-    print(f"  Saved preview: {output_path.name}")
+    detections = DETECTORS[detector](img, tiles, debug=debug)
+    render_preview(img, detections, output_path, debug=debug)
 
 
 def main():
     preview_mode = "--preview" in sys.argv or "-p" in sys.argv
+    extract_mode = "--extract" in sys.argv or "-e" in sys.argv or not preview_mode
     debug_mode = "--debug" in sys.argv or "-d" in sys.argv
+    force_mode = "--force" in sys.argv or "-f" in sys.argv
+    encoder = "canonical" if "--canonical" in sys.argv or "-c" in sys.argv else "pillow"
+    if "--encoder" in sys.argv:
+        index = sys.argv.index("--encoder") + 1
+        if index >= len(sys.argv) or sys.argv[index] not in ENCODERS:
+            print(f"ERROR: --encoder needs one of: {', '.join(sorted(ENCODERS))}")
+            sys.exit(1)
+        encoder = sys.argv[index]
+    detector = "seed"
+    if "--grid" in sys.argv or "-g" in sys.argv:
+        detector = "grid"
+    if "--lattice" in sys.argv or "-l" in sys.argv:
+        detector = "lattice"
+    if "--pyramid" in sys.argv:
+        detector = "pyramid"
+    if "--label" in sys.argv:
+        detector = "label"
+    stream_mode = "--stream" in sys.argv
+    if stream_mode:
+        detector = "grid"  # Only the grid detector works from strips
+    profile_mode = "--profile" in sys.argv
+    report_path = None
+    if "--report" in sys.argv:
+        index = sys.argv.index("--report") + 1
+        if index >= len(sys.argv):
+            print("ERROR: --report needs a file path")
+            sys.exit(1)
+        report_path = Path(sys.argv[index])
+    colors_mode = "--colors" in sys.argv
+    phash_mode = "--phash" in sys.argv
+    watch_mode = "--watch" in sys.argv or "-w" in sys.argv
+    verify_mode = "--verify" in sys.argv
+    jobs = os.cpu_count() or 1
+    for flag in ("--jobs", "-j"):
+        if flag in sys.argv:
+            index = sys.argv.index(flag) + 1
+            if index >= len(sys.argv) or not sys.argv[index].isdigit() or int(sys.argv[index]) < 1:
+                print(f"ERROR: {flag} needs a number of threads")
+                sys.exit(1)
+            jobs = int(sys.argv[index])
+    mip_sizes = None
+    if "--mips" in sys.argv:
+        index = sys.argv.index("--mips") + 1
+        mip_sizes = MIP_SIZES
+        if index < len(sys.argv) and not sys.argv[index].startswith("-"):
+            try:
+                mip_sizes = parse_mip_sizes(sys.argv[index])
+            except ValueError as error:
+                print(f"ERROR: --mips: {error}")
+                sys.exit(1)
     
     script_dir = Path(__file__).parent
     parent_dir = script_dir.parent
     output_dir = script_dir
     
-    image1_path = parent_dir / "terrain-raw-asphalt-limestone.png"
-    image2_path = parent_dir / "terrain-raw-mud-air.png"
-    
     output_dir.mkdir(parents=True, exist_ok=True)
     
     print("=" * 60)
-    if preview_mode:
+    if preview_mode and extract_mode:
+        print("Terrain Tile Extractor - AUTO-DETECT EXTRACT + PREVIEW MODE")
+    elif preview_mode:
         print("Terrain Tile Extractor - AUTO-DETECT PREVIEW MODE")
     else:
         print("Terrain Tile Extractor - AUTO-DETECT MODE")
     print("=" * 60)
     print(f"Output directory: {output_dir}")
+    print(f"Detector: {detector}")
+    if extract_mode:
+        print(f"Jobs: {jobs}")
     
-    if preview_mode:
-        generate_preview(image1_path, IMAGE1_TILES, output_dir / "preview-auto-1.png", debug=debug_mode)
-        generate_preview(image2_path, IMAGE2_TILES, output_dir / "preview-auto-2.png", debug=debug_mode)
+    preview_paths = {sheet_name: preview_output_path(output_dir, f"preview-auto-{index}")
+                     for index, sheet_name in enumerate(SHEETS, start=1)}
+    
+    profiler = start_profile() if profile_mode else None
+    
+    if extract_mode:
+        # Combined with --preview, each sheet is decoded and detected once for both outputs
+        cache = {} if force_mode else load_cache(output_dir)
+        phash_index = load_index(output_dir) if phash_mode else None
+        outputs = {}
+        reports = {}
+        verification = {"passed": True}
         
-        print("\n" + "=" * 60)
+        def refresh(sheet_names: list[str]):
+            """Extract these sheets, then update everything derived from the tiles."""
+            for sheet_name in sheet_names:
+                reports[sheet_name] = sheet_report(parent_dir / sheet_name, detector, encoder)
+                outputs[sheet_name] = process_image(parent_dir / sheet_name, SHEETS[sheet_name], output_dir,
+                                                    debug=debug_mode, detector=detector, jobs=jobs, cache=cache,
+                                                    encoder=encoder,
+                                                    preview_path=preview_paths[sheet_name] if preview_mode else None,
+                                                    report=reports[sheet_name], stream=stream_mode,
+                                                    phash_index=phash_index)
+            save_cache(output_dir, cache)
+            written = [path for paths in outputs.values() for path in paths]
+            
+            if phash_index is not None:
+                update_index(phash_index, written)
+                save_index(output_dir, phash_index)
+                report_phash_changes([reports[sheet_name] for sheet_name in sheet_names], phash_index)
+            
+            if colors_mode:
+                print("\nComputing swatch colors")
+                write_colors(written, output_dir)
+            
+            if mip_sizes is not None:
+                print("\nGenerating mips")
+                written += write_mips(written, output_dir, mip_sizes, encoder=encoder)
+            
+            if encoder == "canonical":
+                report_lock_changes(written, output_dir / "asphalt.lock.toml")
+            
+            if verify_mode:
+                tiles = [path for paths in outputs.values() for path in paths]
+                verification["passed"] = run_verification(tiles, script_dir / "README.md", output_dir)
+    else:
+        def refresh(sheet_names: list[str]):
+            """Redraw the previews of these sheets."""
+            for sheet_name in sheet_names:
+                generate_preview(parent_dir / sheet_name, SHEETS[sheet_name], preview_paths[sheet_name],
+                                 debug=debug_mode, detector=detector, stream=stream_mode)
+    
+    refresh(list(SHEETS))
+    
+    profile = None
+    if profiler is not None:
+        # Without a report, under previews/ where git and asphalt's "./*.png" glob don't look
+        prefix = report_path.with_suffix("") if report_path else output_dir / PREVIEW_DIR / "extract-profile"
+        profile = stop_profile(profiler, prefix)
+        print(f"\nProfile written: {profile['cprofile']}, {profile['tracemalloc']}")
+    if report_path is not None:
+        if extract_mode:
+            write_report(report_path, list(reports.values()), command=sys.argv, detector=detector, encoder=encoder,
+                         cache=not force_mode, profile=profile)
+        else:
+            print("No report: --report covers extraction, run with --extract")
+    if (mip_sizes is not None or colors_mode) and not extract_mode:
+        print("No mips or colors: --mips and --colors cover extraction, run with --extract")
+    if verify_mode and not extract_mode:
+        print("No verification: --verify covers extraction, run with --extract")
+    
+    print("\n" + "=" * 60)
+    if extract_mode:
+        print("Extraction complete!")
+        print(f"Check {output_dir} for extracted tiles.")
+        if verify_mode:
+            print(f"Verification {'passed' if verification['passed'] else 'FAILED'}: "
+                  f"{PREVIEW_DIR}/verification.html")
+        else:
+            print("Open terrain-verification.html (or run with --verify) to verify the results.")
+    if preview_mode:
         print("Preview generated!")
-        print("Open preview-auto-1.png and preview-auto-2.png to verify detection.")
+        print(f"Open {PREVIEW_DIR}/preview-auto-1.png and preview-auto-2.png to verify detection.")
         print("")
         print("GREEN rectangles = auto-detected boundaries")
-        print("YELLOW dots = approximate search centers")
+        print("YELLOW dots = approximate search centers (cell centers for other detectors)")
         print("CYAN squares = detected corners")
-        print("=" * 60)
-    else:
-        process_image(image1_path, IMAGE1_TILES, output_dir, debug=debug_mode)
-        process_image(image2_path, IMAGE2_TILES, output_dir, debug=debug_mode)
+    print("=" * 60)
+    
+    if watch_mode:
+        # The cache and phash index stay in memory; a sheet that was only touched is a cache hit
+        def on_change(sheet_names: list[str]):
+            print(f"\n[{time.strftime('%H:%M:%S')}] Changed: {', '.join(sheet_names)}")
+            start = time.perf_counter()
+            refresh(sheet_names)
+            print(f"Updated in {time.perf_counter() - start:.2f}s")
         
-        print("\n" + "=" * 60)
-        print("Extraction complete!")
-        print(f"Check {output_dir} for extracted tiles.")
-        print("Open terrain-verification.html to verify the results.")
-        print("=" * 60)
+        print()
+        watch(parent_dir, set(SHEETS), on_change)
+    elif extract_mode and verify_mode and not verification["passed"]:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,286 @@
+"""
+Terrain Tile Extractor - Batch mode
+Extracts tiles from many composite images at once, one worker process per sheet,
+with tile PNG encoding spread over threads inside each worker.
+
+Usage:
+    python extract_tiles_batch.py "../packs/*/terrain-raw-*.png"   # Globs
+    python extract_tiles_batch.py --manifest sheets.json            # Manifest
+    python extract_tiles_batch.py "../*.png" --jobs 16 --detector grid --output out/
+    python extract_tiles_batch.py "../*.png" --report run.json --profile   # Timings per sheet/tile, profiles
+    python extract_tiles_batch.py "../huge/*.png" --stream -j 2             # Sheets larger than memory
+
+Each composite needs a tile layout, looked up in this order:
+    1. "tiles" in its manifest entry
+    2. A sidecar next to it: <composite name>.tiles.json
+    3. The built-in SHEETS table in extract_tiles_auto.py (matched by file name)
+
+Manifest format (paths are relative to the manifest file):
+    {"sheets": [{"path": "pack-a/terrain-raw-mud-air.png", "output": "pack-a/tiles"},
+                {"path": "custom.png", "tiles": [["mud", 0, 0], ["rock", 1, 0]]}]}
+
+Sidecar format:
+    {"tiles": [["mud", 0, 0], ["rock", 1, 0]]}
+
+With --detector label, names alone are enough (in reading order: rows top to
+bottom, each left to right), in a sidecar or a manifest entry:
+    {"names": ["mud", "rock", "sand"]}
+The other detectors need each tile's column and row, so they refuse to run
+on a names-only layout.
+
+Requires: Pillow, NumPy (pip install Pillow numpy)
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from extract_tiles_auto import DETECTORS, SHEETS, process_image
+from tile_cache import load_cache, save_cache
+from tile_encoding import ENCODERS, report_lock_changes
+from tile_preview import PREVIEW_DIR
+from tile_report import sheet_report, start_profile, stop_profile, write_report
+
+
+def load_tile_list(entries: list) -> list[tuple[str, int, int]]:
+    """Convert [[name, col, row], ...] from JSON into tile tuples."""
+    return [(str(name), int(col), int(row)) for name, col, row in entries]
+
+
+def load_layout(entry: dict) -> list[tuple[str, int, int]]:
+    """
+    Tile tuples from a sidecar or manifest entry: its "tiles", or its "names"
+    in reading order (one row, which is all the label detector needs).
+    Returns None if the entry has neither.
+    """
+    if "tiles" in entry:
+        return load_tile_list(entry["tiles"])
+    if "names" in entry:
+        return [(str(name), col, 0) for col, name in enumerate(entry["names"])]
+    return None
+
+
+def names_only(entry: dict) -> bool:
+    """Whether a layout entry gives names without columns and rows (label detector only)."""
+    return "names" in entry and "tiles" not in entry
+
+
+def resolve_layout(image_path: Path) -> dict:
+    """
+    Find the layout entry for a composite: its sidecar, or its row in the
+    SHEETS table as {"tiles": ...}. Returns None if there is neither.
+    """
+    sidecar = image_path.with_name(f"{image_path.stem}.tiles.json")
+    if sidecar.exists():
+        return json.loads(sidecar.read_text())
+    if image_path.name in SHEETS:
+        return {"tiles": SHEETS[image_path.name]}
+    return None
+
+
+def layout_job(path: Path, layout: dict, output: Path) -> dict:
+    """A job for collect_jobs from a composite's layout entry (tiles None without one)."""
+    return {
+        "path": path,
+        "tiles": None if layout is None else load_layout(layout),
+        "output": output,
+        "names_only": layout is not None and names_only(layout),
+    }
+
+
+def collect_jobs(patterns: list[str], manifest: Path, default_output: Path) -> list[dict]:
+    """
+    Build the list of sheets to process from glob patterns and/or a manifest.
+    Each job is {"path", "tiles", "output", "names_only"}; sheets without a
+    layout are reported and skipped.
+    """
+    jobs = []
+    
+    if manifest is not None:
+        base_dir = manifest.parent
+        for entry in json.loads(manifest.read_text())["sheets"]:
+            path = (base_dir / entry["path"]).resolve()
+            layout = entry if load_layout(entry) else resolve_layout(path)
+            output = (base_dir / entry["output"]).resolve() if "output" in entry else default_output
+            jobs.append(layout_job(path, layout, output))
+    
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True))
+        if not matches:
+            print(f"WARNING: No files match {pattern}")
+        for match in matches:
+            path = Path(match).resolve()
+            jobs.append(layout_job(path, resolve_layout(path), default_output))
+    
+    # The same composite can match several patterns; keep the first entry
+    unique = {}
+    for job in jobs:
+        unique.setdefault(job["path"], job)
+    
+    ready = []
+    for job in unique.values():
+        if job["tiles"] is None:
+            print(f"WARNING: No tile layout for {job['path'].name} (add {job['path'].stem}.tiles.json), skipping")
+            continue
+        ready.append(job)
+    
+    # Sheets sharing an output directory must not write the same tile names
+    owners = {}
+    for job in ready:
+        for name, _, _ in job["tiles"]:
+            owner = owners.setdefault((job["output"], name), job["path"])
+            if owner != job["path"]:
+                print(f"WARNING: {name}.png in {job['output']} is written by both {owner.name} and {job['path'].name}")
+    return ready
+
+
+def extract_sheet(job: dict, detector: str, encoder: str, tile_jobs: int, cache: dict,
+                  profile_prefix: Path = None, stream: bool = False) -> tuple[str, list[Path], float, dict, dict]:
+    """
+    Worker: extract one composite. Output is captured so logs from parallel
+    sheets don't interleave. `cache` holds only this sheet's entry (if any);
+    workers never touch the cache file, the parent merges and saves it.
+    With profile_prefix, the sheet is profiled into <prefix>.prof/.alloc.txt.
+    Returns (log, written paths, seconds, updated cache, sheet report).
+    """
+    start = time.perf_counter()
+    log = io.StringIO()
+    report = sheet_report(job["path"], detector, encoder)
+    profiler = start_profile() if profile_prefix is not None else None
+    with contextlib.redirect_stdout(log):
+        job["output"].mkdir(parents=True, exist_ok=True)
+        written = process_image(job["path"], job["tiles"], job["output"], detector=detector,
+                                jobs=tile_jobs, cache=cache, encoder=encoder, report=report, stream=stream)
+    if profiler is not None:
+        report["profile"] = stop_profile(profiler, profile_prefix)
+    return log.getvalue(), written, time.perf_counter() - start, cache, report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract terrain tiles from many composite images in parallel.")
+    parser.add_argument("patterns", nargs="*", help="Composite image paths or glob patterns")
+    parser.add_argument("--manifest", "-m", type=Path, help="JSON manifest listing composites")
+    parser.add_argument("--output", "-o", type=Path, default=Path(__file__).parent,
+                        help="Output directory for sheets without their own (default: script directory)")
+    parser.add_argument("--detector", choices=sorted(DETECTORS), default="grid",
+                        help="Tile detector (default: grid)")
+    parser.add_argument("--encoder", choices=sorted(ENCODERS), default="pillow",
+                        help="PNG encoder; canonical is byte-stable and predicts asphalt uploads, optimized is "
+                             "the smallest lossless, palette is lossy (default: pillow)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="Total parallel workers (default: CPU count)")
+    parser.add_argument("--force", "-f", action="store_true",
+                        help="Ignore the extraction cache and re-detect every sheet")
+    parser.add_argument("--stream", action="store_true",
+                        help="Decode sheets in strips through a temp spool so memory doesn't grow with "
+                             "sheet size (uses the grid detector)")
+    parser.add_argument("--report", type=Path,
+                        help="Write stage timings, bounds and cache status for every sheet and tile as JSON")
+    parser.add_argument("--profile", action="store_true",
+                        help="Profile each sheet (cProfile + tracemalloc), with allocations per stage in the report")
+    args = parser.parse_args()
+    
+    if not args.patterns and args.manifest is None:
+        parser.error("give at least one composite pattern or --manifest")
+    if args.stream and args.detector != "grid":
+        print(f"NOTE: --stream uses the grid detector, not {args.detector}")
+        args.detector = "grid"
+    
+    jobs = collect_jobs(args.patterns, args.manifest, args.output.resolve())
+    if not jobs:
+        print("Nothing to do.")
+        sys.exit(1)
+    names_only_sheets = [job["path"].name for job in jobs if job["names_only"]]
+    if names_only_sheets and args.detector != "label":
+        print(f"ERROR: the layout of {', '.join(names_only_sheets)} has \"names\" only, which just "
+              f"--detector label can place; {args.detector} needs [name, col, row] \"tiles\"")
+        sys.exit(1)
+    
+    # One process per sheet; leftover workers become encode threads inside each sheet
+    processes = max(1, min(args.jobs, len(jobs)))
+    tile_jobs = max(1, args.jobs // processes)
+    
+    print("=" * 60)
+    print("Terrain Tile Extractor - BATCH MODE")
+    print("=" * 60)
+    print(f"Sheets: {len(jobs)}")
+    print(f"Detector: {args.detector}")
+    print(f"Encoder: {args.encoder}")
+    print(f"Workers: {processes} processes x {tile_jobs} encode threads")
+    
+    # One cache per output directory, loaded and saved only by this process
+    caches = {job["output"]: {} if args.force else load_cache(job["output"]) for job in jobs}
+    
+    # Profiles go next to the report, or into each sheet's output previews/ folder
+    # (ignored by git and outside asphalt's "./*.png" glob)
+    def profile_prefix(job: dict) -> Path:
+        if not args.profile:
+            return None
+        if args.report is not None:
+            return args.report.with_name(f"{args.report.stem}-{job['path'].stem}")
+        return job["output"] / PREVIEW_DIR / f"extract-profile-{job['path'].stem}"
+    
+    start = time.perf_counter()
+    written = []
+    failed = []
+    reports = []
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        futures = {}
+        for job in jobs:
+            key = str(job["path"])
+            sheet_cache = {key: caches[job["output"]][key]} if key in caches[job["output"]] else {}
+            futures[pool.submit(extract_sheet, job, args.detector, args.encoder, tile_jobs, sheet_cache,
+                                profile_prefix(job), args.stream)] = job
+        
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                log, paths, seconds, sheet_cache, report = future.result()
+            except Exception as error:
+                print(f"\nERROR: {job['path'].name} failed: {error}")
+                failed.append(job["path"])
+                reports.append({**sheet_report(job["path"], args.detector, args.encoder), "error": str(error)})
+                continue
+            
+            print(log, end="")
+            print(f"  Sheet time: {seconds:.2f}s")
+            if not paths:
+                failed.append(job["path"])
+            written.extend(paths)
+            caches[job["output"]].update(sheet_cache)
+            reports.append(report)
+    elapsed = time.perf_counter() - start
+    
+    for output_dir, cache in caches.items():
+        save_cache(output_dir, cache)
+        if args.encoder == "canonical":
+            report_lock_changes([path for path in written if path.parent == output_dir],
+                                output_dir / "asphalt.lock.toml")
+    
+    total_bytes = sum(path.stat().st_size for path in written)
+    print("\n" + "=" * 60)
+    print(f"Batch complete: {len(jobs) - len(failed)}/{len(jobs)} sheets, {len(written)} tiles, "
+          f"{total_bytes / 1e6:.1f} MB in {elapsed:.2f}s")
+    print(f"Throughput: {len(jobs) / elapsed:.2f} sheets/s, {len(written) / elapsed:.1f} tiles/s, "
+          f"{total_bytes / 1e6 / elapsed:.1f} MB/s")
+    print("=" * 60)
+    
+    if args.report is not None:
+        write_report(args.report, sorted(reports, key=lambda report: report["source"]),
+                     command=sys.argv, detector=args.detector, encoder=args.encoder,
+                     cache=not args.force, processes=processes, encode_threads=tile_jobs,
+                     seconds=elapsed, failed=[str(path) for path in failed])
+    
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
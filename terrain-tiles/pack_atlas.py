@@ -0,0 +1,227 @@
+"""
+Terrain Tile Atlas Packer
+Packs the extracted tiles into one or a few power-of-two atlas sheets and
+generates a Luau module of ImageRectOffset/ImageRectSize per material, so the
+material picker loads one texture instead of one per tile.
+
+Usage:
+    python pack_atlas.py                    # Pack every tile in SHEETS into atlas-N.png
+    python pack_atlas.py --tile-size 128    # Downscale tiles first (UI swatches are 72 px)
+    python pack_atlas.py --max-size 2048 --padding 4
+    python pack_atlas.py --canonical        # Byte-stable atlases, predict asphalt uploads
+
+Atlases are written next to the tiles as atlas-1.png, atlas-2.png, ..., so
+asphalt uploads them with the tiles; generated/atlas.luau maps each material
+to its atlas key (in generated/terrain.luau) and rectangle:
+
+    local entry = atlas.asphalt
+    button.Image = terrain[entry.image]
+    button.ImageRectOffset = entry.ImageRectOffset
+    button.ImageRectSize = entry.ImageRectSize
+
+Requires: Pillow, NumPy (pip install Pillow numpy)
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:
+    print("Pillow and NumPy are required. Run: pip install Pillow numpy")
+    sys.exit(1)
+
+from extract_tiles_auto import SHEETS
+from tile_encoding import ENCODERS, report_lock_changes, write_tile
+from tile_luau import vector2, write_module
+
+# Roblox downscales uploaded images larger than this on either side
+ROBLOX_MAX_IMAGE_SIZE = 1024
+
+ATLAS_PREFIX = "atlas"
+
+
+def pot_sizes(min_width: int, min_height: int, max_size: int) -> list[tuple[int, int]]:
+    """Power-of-two (width, height) candidates that fit the largest tile, smallest area first."""
+    sizes = []
+    width = 1
+    while width <= max_size:
+        height = 1
+        while height <= max_size:
+            if width >= min_width and height >= min_height and max(width, height) <= 2 * min(width, height):
+                sizes.append((width, height))
+            height *= 2
+        width *= 2
+    return sorted(sizes, key=lambda size: (size[0] * size[1], abs(size[0] - size[1]), -size[0]))
+
+
+def pack_shelves(sizes: dict[str, tuple[int, int]], width: int, height: int,
+                 padding: int) -> tuple[dict[str, tuple[int, int]], list[str]]:
+    """
+    Shelf-pack rectangles into a width x height sheet, tallest first.
+    Every rectangle gets `padding` px of gutter on each side.
+    Returns ({name: (x, y)} of what fit, names that did not fit).
+    """
+    order = sorted(sizes, key=lambda name: (-sizes[name][1], -sizes[name][0], name))
+    placed = {}
+    leftover = []
+    x = y = shelf_height = 0
+    for name in order:
+        w, h = sizes[name][0] + 2 * padding, sizes[name][1] + 2 * padding
+        if x + w > width:
+            x, y, shelf_height = 0, y + shelf_height, 0
+        if w > width or y + h > height:
+            leftover.append(name)
+            continue
+        placed[name] = (x + padding, y + padding)
+        x += w
+        shelf_height = max(shelf_height, h)
+    return placed, leftover
+
+
+def plan_atlases(sizes: dict[str, tuple[int, int]], max_size: int,
+                 padding: int) -> list[tuple[tuple[int, int], dict[str, tuple[int, int]]]]:
+    """
+    Split tiles over as few atlases as possible, each the smallest power-of-two
+    sheet that holds what's left, up to max_size.
+    Returns [((width, height), {name: (x, y)}), ...].
+    """
+    remaining = dict(sizes)
+    atlases = []
+    while remaining:
+        widest = max(w for w, _ in remaining.values()) + 2 * padding
+        tallest = max(h for _, h in remaining.values()) + 2 * padding
+        candidates = pot_sizes(widest, tallest, max_size)
+        if not candidates:
+            raise ValueError(f"A {widest}x{tallest} tile (with padding) doesn't fit in {max_size}x{max_size}; "
+                             f"use --tile-size or --max-size")
+        
+        # Smallest sheet that takes everything, else the largest (and carry the rest over)
+        for size in candidates:
+            placed, leftover = pack_shelves(remaining, *size, padding)
+            if not leftover:
+                break
+        else:
+            size = max(candidates, key=lambda size: size[0] * size[1])
+            placed, leftover = pack_shelves(remaining, *size, padding)
+        
+        atlases.append((size, placed))
+        remaining = {name: remaining[name] for name in leftover}
+    return atlases
+
+
+def render_atlas(size: tuple[int, int], placed: dict[str, tuple[int, int]],
+                 tiles: dict[str, Image.Image], padding: int) -> Image.Image:
+    """
+    Paste tiles into an atlas. Each tile's edge pixels are repeated into its
+    gutter, so filtering at small display sizes doesn't bleed in neighbours.
+    """
+    pixels = np.zeros((size[1], size[0], 3), dtype=np.uint8)
+    for name, (x, y) in placed.items():
+        tile = np.asarray(tiles[name])
+        if padding:
+            tile = np.pad(tile, ((padding, padding), (padding, padding), (0, 0)), mode="edge")
+        pixels[y - padding:y - padding + tile.shape[0], x - padding:x - padding + tile.shape[1]] = tile
+    return Image.fromarray(pixels)
+
+
+def load_tiles(tiles_dir: Path, names: list[str], tile_size: int) -> dict[str, Image.Image]:
+    """Open the extracted tiles as RGB, downscaled so the longest side is tile_size if given."""
+    tiles = {}
+    for name in names:
+        path = tiles_dir / f"{name}.png"
+        if not path.exists():
+            print(f"  WARNING: {path.name} not found, skipping")
+            continue
+        tile = Image.open(path).convert("RGB")
+        if tile_size and max(tile.size) > tile_size:
+            scale = tile_size / max(tile.size)
+            tile = tile.resize((max(1, round(tile.size[0] * scale)), max(1, round(tile.size[1] * scale))),
+                               Image.LANCZOS)
+        tiles[name] = tile
+    return tiles
+
+
+def main():
+    script_dir = Path(__file__).parent
+    parser = argparse.ArgumentParser(description="Pack extracted terrain tiles into texture atlases.")
+    parser.add_argument("--tiles", type=Path, default=script_dir,
+                        help="Folder with the extracted tiles (default: script directory)")
+    parser.add_argument("--output", "-o", type=Path, default=script_dir,
+                        help="Folder for atlas-N.png; the module goes to its generated/ (default: script directory)")
+    parser.add_argument("--max-size", type=int, default=ROBLOX_MAX_IMAGE_SIZE,
+                        help=f"Largest atlas side, a power of two (default: {ROBLOX_MAX_IMAGE_SIZE}, Roblox's limit)")
+    parser.add_argument("--padding", type=int, default=2,
+                        help="Gutter around each tile in px, filled with its edge pixels (default: 2)")
+    parser.add_argument("--tile-size", type=int,
+                        help="Downscale tiles so their longest side is at most this many px")
+    parser.add_argument("--encoder", choices=sorted(ENCODERS), default="pillow",
+                        help="PNG encoder; canonical is byte-stable and predicts asphalt uploads, optimized is "
+                             "the smallest lossless, palette is lossy (default: pillow)")
+    parser.add_argument("--canonical", "-c", action="store_const", const="canonical", dest="encoder",
+                        help="Shorthand for --encoder canonical")
+    args = parser.parse_args()
+    
+    if args.max_size & (args.max_size - 1):
+        parser.error("--max-size must be a power of two")
+    
+    names = [name for tiles in SHEETS.values() for name, _, _ in tiles]
+    
+    print("=" * 60)
+    print("Terrain Tile Atlas Packer")
+    print("=" * 60)
+    print(f"Tiles: {args.tiles}")
+    print(f"Max atlas size: {args.max_size}, padding: {args.padding}px")
+    
+    tiles = load_tiles(args.tiles, names, args.tile_size)
+    if not tiles:
+        print("No tiles found. Run extract_tiles_auto.py first.")
+        sys.exit(1)
+    
+    try:
+        atlases = plan_atlases({name: tile.size for name, tile in tiles.items()}, args.max_size, args.padding)
+    except ValueError as error:
+        print(f"ERROR: {error}")
+        sys.exit(1)
+    
+    args.output.mkdir(parents=True, exist_ok=True)
+    written = []
+    entries = {}
+    for index, (size, placed) in enumerate(atlases, start=1):
+        key = f"{ATLAS_PREFIX}-{index}"
+        path = args.output / f"{key}.png"
+        _, changed = write_tile(render_atlas(size, placed, tiles, args.padding), path, args.encoder)
+        written.append(path)
+        
+        used = sum(tiles[name].size[0] * tiles[name].size[1] for name in placed)
+        status = "Packed" if changed else "Unchanged"
+        print(f"  {status}: {path.name} {size[0]}x{size[1]}, {len(placed)} tiles, "
+              f"{used / (size[0] * size[1]):.0%} used")
+        
+        for name, (x, y) in placed.items():
+            entries[name] = {
+                "image": key,
+                "ImageRectOffset": vector2(x, y),
+                "ImageRectSize": vector2(*tiles[name].size),
+            }
+    
+    # Atlases left over from a previous run with more sheets would still be uploaded
+    stale = sorted(path.name for path in args.output.glob(f"{ATLAS_PREFIX}-*.png") if path not in written)
+    if stale:
+        print(f"  WARNING: Old atlases no longer used: {', '.join(stale)} (delete them before syncing)")
+    
+    write_module(args.output / "generated" / "atlas.luau", "atlas", entries, "pack_atlas.py")
+    
+    if args.encoder == "canonical":
+        report_lock_changes(written, args.output / "asphalt.lock.toml")
+    
+    print("\n" + "=" * 60)
+    print(f"Packed {len(entries)} tiles into {len(atlases)} atlas{'es' if len(atlases) != 1 else ''}.")
+    print("Run asphalt sync, then look atlases up by key in generated/terrain.luau.")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
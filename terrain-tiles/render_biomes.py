@@ -0,0 +1,682 @@
+"""
+Biome Renderer
+Offline NumPy port of Src/TerrainInterfaces/makeTerrainGenerator.lua: renders
+the height map and the surface material map the generator would write, for
+many seeds and biome mixes, one worker process per render. The terrain tiles
+in this folder are the material palette.
+
+Usage:
+    python render_biomes.py --seeds 1 2 3                         # Default biomes, 512x256x512 studs
+    python render_biomes.py --seeds 0-999 --stats-only            # Summary JSON only, no PNGs
+    python render_biomes.py --seeds 42 --biomes Mountains,Water --biomes Dunes --size 1024 512 1024
+    python render_biomes.py --seeds 7 --no-caves --biome-size 200 --jobs 4
+
+Each render writes <seed>-<biomes>-height.png (grayscale, ground level) and
+<seed>-<biomes>-materials.png (surface material, hill-shaded) to
+previews/biomes/, and every render's statistics go to summary.json there.
+
+The generator runs voxel by voxel in Studio; here every column is processed at
+once and each voxel layer is an array. The math is the generator's, with two
+parts that can't be copied exactly:
+    - math.noise is engine code. It is reimplemented as Ken Perlin's reference
+      improved noise, which it follows (0 at integer points, clamped to [-1, 1]).
+    - The generator lists the selected biomes in pairs() order, which decides
+      which biome a Voronoi cell gets. Here they are listed in the order given.
+So renders show what a seed and biome mix look like, not its exact voxels.
+seedArray, computeMasterSeed and getNoise are exact (math.random is Luau's
+PCG32).
+
+Requires: Pillow, NumPy (pip install Pillow numpy)
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:
+    print("Pillow and NumPy are required. Run: pip install Pillow numpy")
+    sys.exit(1)
+
+from tile_colors import tile_colors
+from tile_preview import PREVIEW_DIR
+
+VOXEL_RESOLUTION = 4
+
+WATER_LEVEL = 0.48
+SURFACE_THICKNESS = 0.018
+
+BIOMES = ("Water", "Plains", "Dunes", "Mountains", "Arctic", "Marsh", "Hills", "Canyons", "Lavascape")
+
+MATERIALS = ("Air", "Water", "Rock", "Mud", "Sand", "Sandstone", "Slate", "Grass", "Ground", "Snow",
+             "Glacier", "CrackedLava", "Basalt")
+MAT = {name: index for index, name in enumerate(MATERIALS)}
+
+CANYON_BANDING = np.array([MAT[name] for name in ("Rock", "Mud", "Sand", "Sand", "Sandstone", "Sandstone",
+                                                  "Sandstone", "Sandstone", "Sandstone", "Sandstone")])
+
+# Biomes that don't have caves that breach the surface
+NO_CAVE_BIOMES = {"Arctic"}
+
+BIOME_BLEND_PERCENT = 0.25
+
+DEFAULT_BIOMES = ("Water", "Plains", "Mountains", "Hills")
+DEFAULT_SIZE = (512, 256, 512)
+DEFAULT_BIOME_SIZE = 100
+
+# Light for the hill shading of material maps, from the north-west and above
+LIGHT = np.array([-1.0, -1.0, 1.5]) / np.linalg.norm([-1.0, -1.0, 1.5])
+
+# Ken Perlin's reference permutation
+PERMUTATION = np.array([
+    151, 160, 137, 91, 90, 15, 131, 13, 201, 95, 96, 53, 194, 233, 7, 225, 140, 36, 103, 30, 69, 142,
+    8, 99, 37, 240, 21, 10, 23, 190, 6, 148, 247, 120, 234, 75, 0, 26, 197, 62, 94, 252, 219, 203, 117,
+    35, 11, 32, 57, 177, 33, 88, 237, 149, 56, 87, 174, 20, 125, 136, 171, 168, 68, 175, 74, 165, 71,
+    134, 139, 48, 27, 166, 77, 146, 158, 231, 83, 111, 229, 122, 60, 211, 133, 230, 220, 105, 92, 41,
+    55, 46, 245, 40, 244, 102, 143, 54, 65, 25, 63, 161, 1, 216, 80, 73, 209, 76, 132, 187, 208, 89,
+    18, 169, 200, 196, 135, 130, 116, 188, 159, 86, 164, 100, 109, 198, 173, 186, 3, 64, 52, 217, 226,
+    250, 124, 123, 5, 202, 38, 147, 118, 126, 255, 82, 85, 212, 207, 206, 59, 227, 47, 16, 58, 17, 182,
+    189, 28, 42, 223, 183, 170, 213, 119, 248, 152, 2, 44, 154, 163, 70, 221, 153, 101, 155, 167, 43,
+    172, 9, 129, 22, 39, 253, 19, 98, 108, 110, 79, 113, 224, 232, 178, 185, 112, 104, 218, 246, 97,
+    228, 251, 34, 242, 193, 238, 210, 144, 12, 191, 179, 162, 241, 81, 51, 145, 235, 249, 14, 239,
+    107, 49, 192, 214, 31, 181, 199, 106, 157, 184, 84, 204, 176, 115, 121, 50, 45, 127, 4, 150, 254,
+    138, 236, 205, 93, 222, 114, 67, 29, 24, 72, 243, 141, 128, 195, 78, 66, 215, 61, 156, 180,
+] * 2)
+
+# Improved noise's grad(hash, x, y, z) as a dot product with one of 16 gradients
+GRADIENTS = np.array([
+    [1, 1, 0], [-1, 1, 0], [1, -1, 0], [-1, -1, 0], [1, 0, 1], [-1, 0, 1], [1, 0, -1], [-1, 0, -1],
+    [0, 1, 1], [0, -1, 1], [0, 1, -1], [0, -1, -1], [1, 1, 0], [0, -1, 1], [-1, 1, 0], [0, -1, -1],
+], dtype=np.float64)
+
+# Gradient components per permutation entry: grad(p[i], x, y, z) = GRAD_X[i] * x + GRAD_Y[i] * y + GRAD_Z[i] * z
+GRAD_X, GRAD_Y, GRAD_Z = (np.ascontiguousarray(GRADIENTS[PERMUTATION & 15, axis]) for axis in range(3))
+
+
+def math_noise(x, y, z) -> np.ndarray:
+    """math.noise over arrays: improved Perlin noise, -1 to 1."""
+    x, y, z = np.broadcast_arrays(*(np.asarray(value, dtype=np.float64) for value in (x, y, z)))
+    floors = [np.floor(value) for value in (x, y, z)]
+    cell = [floor.astype(np.int64) & 255 for floor in floors]
+    fx, fy, fz = (value - floor for value, floor in zip((x, y, z), floors))
+    u, v, w = (t * t * t * (t * (t * 6 - 15) + 10) for t in (fx, fy, fz))
+    
+    p = PERMUTATION
+    a = np.take(p, cell[0]) + cell[1]
+    b = np.take(p, cell[0] + 1) + cell[1]
+    aa, ab = np.take(p, a) + cell[2], np.take(p, a + 1) + cell[2]
+    ba, bb = np.take(p, b) + cell[2], np.take(p, b + 1) + cell[2]
+    offsets = ((fx, fx - 1), (fy, fy - 1), (fz, fz - 1))
+    
+    def grad(hashed, dx, dy, dz):
+        return (np.take(GRAD_X, hashed) * offsets[0][dx] + np.take(GRAD_Y, hashed) * offsets[1][dy]
+                + np.take(GRAD_Z, hashed) * offsets[2][dz])
+    
+    def lerp(t, a, b):
+        return a + t * (b - a)
+    
+    value = lerp(w, lerp(v, lerp(u, grad(aa, 0, 0, 0), grad(ba, 1, 0, 0)),
+                         lerp(u, grad(ab, 0, 1, 0), grad(bb, 1, 1, 0))),
+                 lerp(v, lerp(u, grad(aa + 1, 0, 0, 1), grad(ba + 1, 1, 0, 1)),
+                         lerp(u, grad(ab + 1, 0, 1, 1), grad(bb + 1, 1, 1, 1))))
+    return np.clip(value, -1, 1)
+
+
+def luau_random(seed: int, count: int) -> list[float]:
+    """math.randomseed(seed) then `count` math.random() calls, as Luau's PCG32 does them."""
+    mask = (1 << 64) - 1
+    
+    def pcg32(state: int) -> tuple[int, int]:
+        xorshifted = (((state >> 18) ^ state) >> 27) & 0xFFFFFFFF
+        rotation = state >> 59
+        value = ((xorshifted >> rotation) | (xorshifted << ((-rotation) & 31))) & 0xFFFFFFFF
+        return (state * 6364136223846793005 + 105) & mask, value
+    
+    state, _ = pcg32(0)
+    state, _ = pcg32((state + seed) & mask)
+    values = []
+    for _ in range(count):
+        state, low = pcg32(state)
+        state, high = pcg32(state)
+        values.append(math.ldexp(float(low | (high << 32)), -64))
+    return values
+
+
+SEED_ARRAY = np.array(luau_random(6180339, 999))
+
+
+def compute_master_seed(seed: str) -> int:
+    """computeMasterSeed on tostring(seed)."""
+    composite = 0
+    for byte in seed.encode():  # string.sub works on bytes
+        if ord("0") <= byte <= ord("9"):
+            composite = (composite + 6) * (byte - ord("0") + 5)
+        else:
+            composite = (composite + 7) * (byte + 3)
+        composite = composite % 61803
+    return composite
+
+
+def threshold_filter(value, bottom, size):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(value <= bottom, 0.0, np.where(value >= bottom + size, 1.0, (value - bottom) / size))
+
+
+def ridged_filter(value):
+    return np.where(value < 0.5, value * 2, 2 - value * 2)
+
+
+def ridged_flipped_filter(value):
+    return np.where(value < 0.5, 1 - value * 2, value * 2 - 1)
+
+
+def rotation_xyz(rx: float, ry: float, rz: float) -> np.ndarray:
+    """CFrame.Angles(rx, ry, rz) as a 3x3 matrix."""
+    cx, sx, cy, sy, cz, sz = math.cos(rx), math.sin(rx), math.cos(ry), math.sin(ry), math.cos(rz), math.sin(rz)
+    x = np.array([[1, 0, 0], [0, cx, -sx], [0, sx, cx]])
+    y = np.array([[cy, 0, sy], [0, 1, 0], [-sy, 0, cy]])
+    z = np.array([[cz, -sz, 0], [sz, cz, 0], [0, 0, 1]])
+    return x @ y @ z
+
+
+SPIRE_ROTATION = rotation_xyz(0.7, 0.7, 0)
+
+
+class TerrainGenerator:
+    """
+    The generator for one set of generate settings. Coordinates are arrays:
+    world voxel x and z shaped (1, X, Z), voxel layer y shaped (Y, 1, 1).
+    """
+    
+    def __init__(self, seed: str, biomes: list[str], size=DEFAULT_SIZE, position=(0, 0, 0),
+                 biome_size: float = DEFAULT_BIOME_SIZE, caves: bool = True):
+        self.master_seed = compute_master_seed(seed)
+        self.map_height = 0.5 / (size[1] / VOXEL_RESOLUTION)
+        self.biomes = list(biomes) or ["Hills"]
+        self.biome_size = biome_size
+        self.caves = caves
+        
+        # Region3:ExpandToGrid(VOXEL_RESOLUTION), in voxels
+        low = [math.floor((p - s / 2) / VOXEL_RESOLUTION) for p, s in zip(position, size)]
+        high = [math.ceil((p + s / 2) / VOXEL_RESOLUTION) for p, s in zip(position, size)]
+        self.voxel_size = tuple(h - l for l, h in zip(low, high))
+        self.corner = (low[0], low[2])
+    
+    def perlin(self, x, y, z, perlin_seed=0, scale=1, raw=False):
+        """getPerlin."""
+        value = math_noise(x / scale + perlin_seed * 17 + self.master_seed,
+                           y / scale - self.master_seed,
+                           z / scale - perlin_seed * perlin_seed)
+        return value if raw else value * 0.5 + 0.5
+    
+    def noise(self, x=0, y=0, z=0, noise_seed=7):
+        """getNoise."""
+        ms = self.master_seed
+        target = x + y + z + noise_seed + ms + (ms - x) * (noise_seed + z) + (noise_seed - y) * (ms + z)
+        return SEED_ARRAY[np.floor(np.mod(target, len(SEED_ARRAY))).astype(np.int64)]
+    
+    # BiomeInfoFuncs: (x, y, z, verticalGradientTurbulence) -> (value, surface, fill)
+    
+    def water(self, x, y, z, vgt):
+        value = 0.36 + self.perlin(x, y, z, 2, 50) * 0.08
+        surface = np.where(1 - vgt < 0.44, MAT["Slate"], MAT["Sand"])
+        return value, surface, MAT["Rock"]
+    
+    def marsh(self, x, y, z, vgt):
+        pre_ledge = self.perlin(
+            x + self.perlin(x, 0, z, 5, 7, True) * 10 + self.perlin(x, 0, z, 6, 30, True) * 50,
+            0,
+            z + self.perlin(x, 0, z, 9, 7, True) * 10 + self.perlin(x, 0, z, 10, 30, True) * 50,
+            2,
+            70)
+        grassy_ledge = threshold_filter(pre_ledge, 0.65, 0)
+        large_gradient = self.perlin(x, y, z, 4, 100)
+        small_gradient = self.perlin(x, y, z, 3, 20)
+        value = (WATER_LEVEL - 0.04 + pre_ledge * grassy_ledge * 0.025
+                 + large_gradient * 0.035 + small_gradient * 0.025)
+        surface = np.select([grassy_ledge >= 1, 1 - vgt < WATER_LEVEL - 0.01, 1 - vgt < WATER_LEVEL + 0.01],
+                            [MAT["Grass"], MAT["Mud"], MAT["Ground"]], MAT["Grass"])
+        return value, surface, MAT["Slate"]
+    
+    def plains(self, x, y, z, vgt):
+        rivulet = ridged_flipped_filter(self.perlin(
+            x + self.perlin(x, y, z, 17, 40) * 25,
+            0,
+            z + self.perlin(x, y, z, 19, 40) * 25,
+            2,
+            200))
+        rivulet_threshold = threshold_filter(rivulet, 0.01, 0)
+        rock_map = (threshold_filter(ridged_flipped_filter(self.perlin(x, 0, z, 101, 7)), 0.3, 0.7)  # Rocks
+                    * threshold_filter(self.perlin(x, 0, z, 102, 50), 0.6, 0.05))                   # Zoning
+        value = (0.5 + self.perlin(x, y, z, 2, 100) * 0.02 + rivulet * 0.05 + rock_map * 0.05
+                 + rivulet_threshold * 0.005)
+        
+        vertical_gradient = 1 - (y - 1) / (self.map_height - 1)
+        surface_gradient = vertical_gradient * 0.5 + value * 0.5
+        thin_surface = ((surface_gradient > 0.5 - SURFACE_THICKNESS * 0.4)
+                        & (surface_gradient < 0.5 + SURFACE_THICKNESS * 0.4))
+        surface = np.select([rock_map > 0, ~thin_surface, thin_surface & (rivulet_threshold <= 0),
+                             1 - vgt < WATER_LEVEL - 0.01],
+                            [MAT["Rock"], MAT["Mud"], MAT["Water"], MAT["Sand"]], MAT["Grass"])
+        fill = np.where(rock_map > 0, MAT["Rock"], MAT["Sandstone"])
+        return value, surface, fill
+    
+    def canyons(self, x, y, z, vgt):
+        canyon_noise = ridged_flipped_filter(self.perlin(x, 0, z, 2, 200))
+        turbed = ridged_flipped_filter(self.perlin(
+            x + self.perlin(x, 0, z, 5, 20, True) * 20,
+            0,
+            z + self.perlin(x, 0, z, 9, 20, True) * 20,
+            2,
+            200))
+        sandbank = threshold_filter(turbed, 0, 0.05)
+        canyon_top = threshold_filter(turbed, 0.125, 0)
+        mesa_slope = threshold_filter(canyon_noise, 0.33, 0.12)
+        mesa_top = threshold_filter(turbed, 0.49, 0)
+        value = (0.42
+                 + self.perlin(x, y, z, 2, 70) * 0.05
+                 + canyon_noise * 0.05
+                 + sandbank * 0.04                                    # Canyon bottom slope
+                 + threshold_filter(turbed, 0.05, 0) * 0.08           # Canyon cliff
+                 + threshold_filter(turbed, 0.05, 0.075) * 0.04       # Canyon cliff top slope
+                 + canyon_top * 0.01                                  # Canyon cliff top ledge
+                 + threshold_filter(turbed, 0.0575, 0.2725) * 0.01    # Plane slope
+                 + mesa_slope * 0.06                                  # Mesa slope
+                 + threshold_filter(turbed, 0.45, 0) * 0.14           # Mesa cliff
+                 + threshold_filter(turbed, 0.45, 0.04) * 0.025       # Mesa cap
+                 + mesa_top * 0.02)                                   # Mesa top ledge
+        surface = np.select([1 - vgt < WATER_LEVEL + 0.015, (sandbank > 0) & (sandbank < 1)],
+                            [MAT["Sand"], MAT["Sand"]], MAT["Sandstone"])
+        band = np.ceil((1 - self.noise(1, y, 2)) * 10).astype(np.int64)
+        return value, surface, CANYON_BANDING[band - 1]
+    
+    def hills(self, x, y, z, vgt):
+        rivulet = ridged_flipped_filter(self.perlin(
+            x + self.perlin(x, y, z, 17, 20) * 20,
+            0,
+            z + self.perlin(x, y, z, 19, 20) * 20,
+            2,
+            200)) ** 0.5
+        large_hills = self.perlin(x, y, z, 3, 60)
+        value = 0.48 + large_hills * 0.05 + (0.05 + large_hills * 0.1 + self.perlin(x, y, z, 4, 25) * 0.125) * rivulet
+        gradient = (1 - vgt) * 0.9 + rivulet * 0.1
+        surface = np.select([gradient < WATER_LEVEL - 0.015, gradient < WATER_LEVEL],
+                            [MAT["Mud"], MAT["Ground"]], MAT["Grass"])
+        return value, surface, MAT["Slate"]
+    
+    def dunes(self, x, y, z, vgt):
+        turbulence = self.perlin(x, 0, z, 227, 20) * 24
+        layer1 = ridged_filter(self.perlin(x, 0, z, 201, 40))
+        layer2 = ridged_filter(self.perlin(x / 10 + turbulence, 0, z + turbulence, 200, 48))
+        return 0.4 + 0.1 * (layer1 + layer2), MAT["Sand"], MAT["Sandstone"]
+    
+    def mountains(self, x, y, z, vgt):
+        rivulet = ridged_flipped_filter(self.perlin(
+            x + self.perlin(x, y, z, 17, 20) * 20,
+            0,
+            z + self.perlin(x, y, z, 19, 20) * 20,
+            2,
+            200))
+        # fractalize(mountainsOperation, x, y / 20, z, 8, 0.65)
+        total_value = 0
+        total_scale = 0
+        for i in range(1, 9):
+            scale = 0.65 ** (i - 1)
+            total_scale += scale
+            total_value = total_value + ridged_filter(self.perlin(x, y / 20, z, 100 + i, (1 / i) * 160)) * scale
+        value = -0.4 + total_value / total_scale * 1.2 + rivulet * 0.2
+        depth = 1 - vgt
+        surface = np.select([vgt < 0.275, vgt < 0.35, vgt < 0.4, depth < WATER_LEVEL,
+                             depth < WATER_LEVEL + 0.01, depth < WATER_LEVEL + 0.015],
+                            [MAT["Snow"], MAT["Rock"], MAT["Ground"], MAT["Rock"], MAT["Mud"], MAT["Ground"]],
+                            MAT["Grass"])
+        return value, surface, MAT["Rock"]
+    
+    def lavascape(self, x, y, z, vgt):
+        crack_x = x + self.perlin(x, y * 0.25, z, 21, 8, True) * 5
+        crack_y = y + self.perlin(x, y * 0.25, z, 22, 8, True) * 5
+        crack_z = z + self.perlin(x, y * 0.25, z, 23, 8, True) * 5
+        crack1 = ridged_filter(self.perlin(
+            crack_x + self.perlin(x, y, z, 22, 30, True) * 30,
+            crack_y,
+            crack_z + self.perlin(x, y, z, 24, 30, True) * 30,
+            2,
+            120))
+        crack2 = ridged_filter(self.perlin(crack_x, crack_y, crack_z, 3, 40)) * (crack1 * 0.25 + 0.75)
+        crack3 = ridged_filter(self.perlin(crack_x, crack_y, crack_z, 4, 20)) * (crack2 * 0.25 + 0.75)
+        
+        general_hills = threshold_filter(self.perlin(x, y, z, 9, 40), 0.25, 0.5) * self.perlin(x, y, z, 10, 60)
+        cracks = np.maximum(0, 1 - threshold_filter(crack1, 0.975, 0) - threshold_filter(crack2, 0.925, 0)
+                            - threshold_filter(crack3, 0.9, 0))
+        
+        r = SPIRE_ROTATION
+        spire_x = r[0, 0] * crack_x + r[0, 1] * crack_y + r[0, 2] * crack_z
+        spire_y = r[1, 0] * crack_x + r[1, 1] * crack_y + r[1, 2] * crack_z
+        spire_z = r[2, 0] * crack_x + r[2, 1] * crack_y + r[2, 2] * crack_z
+        spires = threshold_filter(self.perlin(spire_x / 40, spire_y / 300, spire_z / 30, 123, 1), 0.6, 0.4)
+        
+        value = (WATER_LEVEL + 0.02
+                 + cracks * (0.5 + general_hills * 0.5) * 0.02
+                 + general_hills * 0.05
+                 + spires * 0.3
+                 + np.where((1 - vgt > WATER_LEVEL + 0.01) | (spires > 0), 0.04, 0))  # Lets it lip over water
+        fill = np.select([spires > 0, cracks < 1], [MAT["Rock"], MAT["CrackedLava"]], MAT["Basalt"])
+        surface = np.where((fill == MAT["CrackedLava"]) & (1 - vgt < WATER_LEVEL), MAT["Basalt"], fill)
+        return value, surface, fill
+    
+    def arctic(self, x, y, z, vgt):
+        pre_boundary = self.perlin(
+            x + self.perlin(x, 0, z, 5, 8, True) * 5,
+            y / 8,
+            z + self.perlin(x, 0, z, 9, 8, True) * 5,
+            2,
+            20)
+        boundary = ridged_filter(pre_boundary)
+        rough_chunks = self.perlin(x, y / 4, z, 436, 2)
+        boundary_mask = threshold_filter(boundary, 0.8, 0.1)
+        boundary_type = self.perlin(x, 0, z, 6, 74) - 0.5
+        boundary_comp = np.where(boundary_type < 0,
+                                 np.where(boundary > 1 + boundary_type * 0.5, -0.17, 0),  # Divergent
+                                 boundary_mask * 0.1 * rough_chunks * boundary_type)     # Convergent
+        value = (0.55
+                 + boundary * 0.05 * boundary_type          # Soft slope up or down to boundary
+                 + boundary_comp                            # Convergent/divergent effects
+                 + self.perlin(x, 0, z, 123, 25) * 0.025)   # Gentle rolling slopes
+        surface = np.select([1 - vgt < WATER_LEVEL - 0.1,
+                             (boundary_mask > 0.6) & (boundary_type > 0.1) & (rough_chunks > 0.5)],
+                            [MAT["Glacier"], MAT["Glacier"]], MAT["Snow"])
+        return value, surface, MAT["Glacier"]
+    
+    def biome_info(self, biome: str, x, y, z, vgt):
+        """A BiomeInfoFuncs entry, broadcast to the voxel grid."""
+        value, surface, fill = getattr(self, biome.lower())(x, y, z, vgt)
+        return np.broadcast_arrays(value, surface, fill, vgt)[:3]
+    
+    def biome_weights(self, x, z) -> dict[str, np.ndarray]:
+        """Each biome's normalized weight per column (0 where it doesn't apply), from the Voronoi cells."""
+        biome_size = self.biome_size
+        cell_x = (x / biome_size
+                  + self.perlin(x, 0, z, 233, biome_size * 0.3) * 0.25
+                  + self.perlin(x, 0, z, 235, biome_size * 0.05) * 0.075)
+        cell_z = (z / biome_size
+                  + self.perlin(x, 0, z, 234, biome_size * 0.3) * 0.25
+                  + self.perlin(x, 0, z, 236, biome_size * 0.05) * 0.075)
+        
+        points = []
+        for vx in (-1, 0, 1):
+            for vz in (-1, 0, 1):
+                grid_x = np.floor(cell_x + vx + 0.5)
+                grid_z = np.floor(cell_z + vz + 0.5)
+                # De-uniforming grid for voronoi
+                point_x = grid_x + (self.noise(grid_x, grid_z, 53) - 0.5) * 0.75
+                point_z = grid_z + (self.noise(grid_x, grid_z, 73) - 0.5) * 0.75
+                points.append(((point_x - cell_x) ** 2 + (point_z - cell_z) ** 2, self.noise(grid_x, grid_z)))
+        closest = np.minimum.reduce([distance for distance, _ in points])
+        
+        weights = {biome: np.zeros_like(closest) for biome in self.biomes}
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for distance, biome_noise in points:
+                weight = np.where(distance == closest, 1.0,
+                                  (np.sqrt(closest) / np.sqrt(distance) - (1 - BIOME_BLEND_PERCENT))
+                                  / BIOME_BLEND_PERCENT)
+                # Smooth the biome transition from linear to cubic InOut
+                weight = np.where(weight > 0, np.maximum(weight, 0) ** 2.1, 0)
+                # Inverting the noise so that it is limited as (0, 1]
+                choice = np.ceil(len(self.biomes) * (1 - biome_noise)).astype(np.int64) - 1
+                for index, biome in enumerate(self.biomes):
+                    weights[biome] += np.where(choice == index, weight, 0)
+        total = sum(weights.values())
+        return {biome: weight / total for biome, weight in weights.items()}
+    
+    def generate(self) -> dict[str, np.ndarray]:
+        """
+        Run the generator over the whole map.
+        Returns (X, Z) arrays: "height" (ground level in voxels), "material"
+        (index into MATERIALS of the top voxel) and "biome" (index into
+        self.biomes of the heaviest biome).
+        """
+        size_x, slice_y, size_z = self.voxel_size
+        x = (self.corner[0] + np.arange(size_x, dtype=np.float64))[None, :, None]
+        z = (self.corner[1] + np.arange(size_z, dtype=np.float64))[None, None, :]
+        y = np.arange(1, slice_y + 1, dtype=np.float64)[:, None, None]
+        
+        weights = self.biome_weights(x, z)
+        no_cave = np.zeros((1, size_x, size_z), dtype=bool)
+        for biome in NO_CAVE_BIOMES.intersection(self.biomes):
+            no_cave |= weights[biome] > 0
+        
+        vertical_gradient = 1 - (y - 1) / (slice_y - 1)
+        
+        grid = (slice_y, size_x, size_z)
+        choice_value = np.full(grid, 0.5)
+        choice_surface = np.full(grid, MAT["CrackedLava"])
+        choice_fill = np.full(grid, MAT["Rock"])
+        
+        # Under the surface of every biome there is no biome data: only layers in the band run the biomes
+        band = np.flatnonzero((vertical_gradient.ravel() <= 0.65) & (vertical_gradient.ravel() >= 0.1))
+        if len(band):
+            layers = slice(band[0], band[-1] + 1)
+            vgt = vertical_gradient[layers] * 0.9 + 0.1 * self.perlin(x, y[layers], z, 107, 15)
+            args = (x, y[layers], z, vgt)
+            if len(self.biomes) == 1:
+                value, surface, fill = self.biome_info(self.biomes[0], *args)
+            else:
+                infos = {biome: self.biome_info(biome, *args) for biome in self.biomes}
+                average = sum(infos[biome][0] * weights[biome] for biome in self.biomes)
+                value = np.zeros_like(average)
+                surface = np.full(value.shape, MAT["CrackedLava"])
+                fill = np.full(value.shape, MAT["Rock"])
+                for biome in self.biomes:
+                    weight = weights[biome]
+                    biome_value = infos[biome][0]
+                    if biome == "Arctic":
+                        transition = (weight > 0.2) * biome_value
+                    elif biome == "Canyons":
+                        transition = (weight > 0.7) * biome_value
+                    elif biome == "Mountains":
+                        transition = average * (1 - weight ** 3) + biome_value * weight ** 3
+                    else:
+                        transition = average * (1 - weight) + biome_value * weight
+                    better = (weight > 0) & (transition > value)
+                    value = np.where(better, transition, value)
+                    surface = np.where(better, infos[biome][1], surface)
+                    fill = np.where(better, infos[biome][2], fill)
+            choice_value[layers], choice_surface[layers], choice_fill[layers] = value, surface, fill
+        
+        pre_cave = vertical_gradient * 0.5 + choice_value * 0.5
+        surface = (pre_cave > 0.5 - SURFACE_THICKNESS) & (pre_cave < 0.5 + SURFACE_THICKNESS)
+        caves = 0
+        if self.caves:
+            depth = 1 - vertical_gradient
+            allowed = ((~no_cave | (vertical_gradient > 0.65))
+                       & ~(surface & (depth < WATER_LEVEL + 0.005))   # Caves only breach surface above sea level
+                       & ~(surface & (depth > WATER_LEVEL + 0.58)))   # Caves don't go too high through mountains
+            # Above the band every voxel is air, caves or not
+            solid = slice(0, np.flatnonzero(vertical_gradient.ravel() >= 0.1)[-1] + 1)
+            caves = np.zeros(grid)
+            caves[solid] = 1
+            for cave_seed in (4, 5, 6):
+                caves[solid] *= threshold_filter(ridged_filter(self.perlin(x, y[solid], z, cave_seed, 30)), 0.84, 0.01)
+            openings = np.where(surface, threshold_filter(self.perlin(x, 0, z, 143, 62), 0.35, 0), 0)
+            caves = np.where(allowed, np.clip(caves - openings, 0, 1), 0)
+        
+        smoothed = threshold_filter(pre_cave - caves, 0.5, self.map_height)
+        flooded = (1 - vertical_gradient < WATER_LEVEL) & (pre_cave <= 0.5) & (smoothed <= 0)
+        smoothed = np.where(flooded, 1.0, smoothed)
+        choice_surface = np.where(flooded, MAT["Water"], choice_surface)
+        choice_fill = np.where(flooded, MAT["Water"], choice_fill)
+        surface = surface | flooded
+        
+        bottom = y == 1
+        occupancy = np.where(bottom, 1.0, smoothed)
+        material = np.select([bottom, smoothed <= 0, surface], [MAT["CrackedLava"], MAT["Air"], choice_surface],
+                             choice_fill)
+        
+        # The column stops at the first surface voxel that is air: it and everything above stay air
+        hit_air = np.logical_or.accumulate(surface & ((occupancy <= 0) | (material == MAT["Air"])), axis=0)
+        occupancy = np.where(hit_air, 0.0, occupancy)
+        material = np.where(hit_air, MAT["Air"], material)
+        
+        solid = occupancy > 0
+        top = slice_y - 1 - np.argmax(solid[::-1], axis=0)
+        columns = np.indices(top.shape)
+        top_occupancy = occupancy[top, columns[0], columns[1]]
+        heaviest = np.argmax(np.stack([np.broadcast_to(weights[biome], (1, size_x, size_z))[0]
+                                       for biome in self.biomes]), axis=0)
+        return {
+            "height": top + top_occupancy,
+            "material": material[top, columns[0], columns[1]],
+            "biome": heaviest,
+        }
+
+
+def load_palette(tiles_dir: Path) -> dict[str, tuple[int, int, int]]:
+    """Dominant color of each material's tile (<material>.png, lowercase) in tiles_dir."""
+    tiles = {}
+    for name in MATERIALS:
+        path = tiles_dir / f"{name.lower()}.png"
+        if path.exists():
+            tiles[name] = Image.open(path)
+        else:
+            print(f"  WARNING: No tile for {name} ({path.name}), drawn gray")
+    colors = tile_colors(tiles) if tiles else {}
+    return {name: colors[name]["dominant"] if name in colors else (128, 128, 128) for name in MATERIALS}
+
+
+def hillshade(height: np.ndarray) -> np.ndarray:
+    """Lambert shading of an (X, Z) height map in voxels, 0.55 to 1."""
+    grad_x, grad_z = np.gradient(height)
+    normal = np.stack([-grad_x, -grad_z, np.ones_like(height)])
+    normal /= np.linalg.norm(normal, axis=0)
+    return 0.55 + 0.45 * np.clip(np.tensordot(LIGHT, normal, axes=1), 0, 1)
+
+
+def render_name(seed: str, biomes: list[str]) -> str:
+    return f"{seed}-{'+'.join(biome.lower() for biome in biomes)}"
+
+
+def render(seed: str, biomes: list[str], settings: dict, palette: dict, output_dir: Path,
+           write_images: bool) -> dict:
+    """Generate one map and write its PNGs. Returns its summary entry."""
+    start = time.perf_counter()
+    generator = TerrainGenerator(seed, biomes, **settings)
+    result = generator.generate()
+    height, material = result["height"], result["material"]
+    slice_y = generator.voxel_size[1]
+    
+    if write_images:
+        name = render_name(seed, generator.biomes)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        levels = np.clip(height / slice_y * 255, 0, 255).astype(np.uint8)
+        Image.fromarray(np.ascontiguousarray(levels.T)).save(output_dir / f"{name}-height.png", optimize=True)
+        colors = np.array([palette[name] for name in MATERIALS], dtype=np.float64)[material]
+        shaded = np.where((material == MAT["Water"])[..., None], colors, colors * hillshade(height)[..., None])
+        Image.fromarray(np.ascontiguousarray(np.clip(shaded, 0, 255).astype(np.uint8).transpose(1, 0, 2))).save(
+            output_dir / f"{name}-materials.png", optimize=True)
+    
+    columns = material.size
+    counts = np.bincount(material.ravel(), minlength=len(MATERIALS))
+    biome_counts = np.bincount(result["biome"].ravel(), minlength=len(generator.biomes))
+    return {
+        "seed": seed,
+        "biomes": generator.biomes,
+        "voxels": list(generator.voxel_size),
+        "height": {"min": round(float(height.min()), 2), "mean": round(float(height.mean()), 2),
+                   "max": round(float(height.max()), 2)},
+        "materials": {name: round(count / columns, 4) for name, count in zip(MATERIALS, counts.tolist()) if count},
+        "biome_cover": {biome: round(count / columns, 4)
+                        for biome, count in zip(generator.biomes, biome_counts.tolist())},
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+
+
+def parse_seeds(tokens: list[str]) -> list[str]:
+    """Seeds as given, with A-B (non-negative integers) expanded to A, A+1, ..., B."""
+    seeds = []
+    for token in tokens:
+        first, dash, last = token.partition("-")
+        if dash and first.isdigit() and last.isdigit():
+            seeds += [str(seed) for seed in range(int(first), int(last) + 1)]
+        else:
+            seeds.append(token)
+    return seeds
+
+
+def parse_biomes(text: str) -> list[str]:
+    """A comma-separated biome mix, names matched case-insensitively."""
+    names = {biome.lower(): biome for biome in BIOMES}
+    biomes = []
+    for name in filter(None, (part.strip() for part in text.split(","))):
+        if name.lower() not in names:
+            raise argparse.ArgumentTypeError(f"unknown biome {name!r} (choose from {', '.join(BIOMES)})")
+        biomes.append(names[name.lower()])
+    return biomes
+
+
+def main():
+    script_dir = Path(__file__).parent
+    parser = argparse.ArgumentParser(description="Render makeTerrainGenerator height and material maps offline.")
+    parser.add_argument("--seeds", nargs="+", default=["618033988"],
+                        help="Seeds, as typed in the generator; A-B for a range (default: 618033988)")
+    parser.add_argument("--biomes", type=parse_biomes, action="append",
+                        help=f"Comma-separated biome mix; repeat for several (default: {','.join(DEFAULT_BIOMES)})")
+    parser.add_argument("--size", type=int, nargs=3, default=list(DEFAULT_SIZE), metavar=("X", "Y", "Z"),
+                        help="Map size in studs (default: %(default)s)")
+    parser.add_argument("--biome-size", type=float, default=DEFAULT_BIOME_SIZE,
+                        help="Biome size, as in the generator (default: %(default)s)")
+    parser.add_argument("--no-caves", action="store_true", help="Generate without caves")
+    parser.add_argument("--tiles", type=Path, default=script_dir,
+                        help="Folder with the material tiles for the palette (default: script directory)")
+    parser.add_argument("--output", "-o", type=Path, default=script_dir / PREVIEW_DIR / "biomes",
+                        help="Output directory (default: previews/biomes)")
+    parser.add_argument("--stats-only", action="store_true", help="Only write summary.json, no PNGs")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="Parallel workers (default: CPU count)")
+    args = parser.parse_args()
+    
+    seeds = parse_seeds(args.seeds)
+    mixes = args.biomes or [list(DEFAULT_BIOMES)]
+    settings = {"size": tuple(args.size), "biome_size": args.biome_size, "caves": not args.no_caves}
+    jobs = [(seed, biomes) for biomes in mixes for seed in seeds]
+    
+    print("=" * 60)
+    print("Biome Renderer")
+    print("=" * 60)
+    print(f"Renders: {len(seeds)} seeds x {len(mixes)} biome mixes")
+    print(f"Map: {args.size[0]}x{args.size[1]}x{args.size[2]} studs, biome size {args.biome_size:g}, "
+          f"caves {'off' if args.no_caves else 'on'}")
+    palette = load_palette(args.tiles)
+    
+    start = time.perf_counter()
+    summary = []
+    with ProcessPoolExecutor(max_workers=max(1, min(args.jobs, len(jobs)))) as pool:
+        futures = {pool.submit(render, seed, biomes, settings, palette, args.output, not args.stats_only): seed
+                   for seed, biomes in jobs}
+        for future in as_completed(futures):
+            entry = future.result()
+            summary.append(entry)
+            cover = ", ".join(f"{biome} {share:.0%}" for biome, share in entry["biome_cover"].items() if share)
+            print(f"  {render_name(entry['seed'], entry['biomes'])}: height {entry['height']['min']:g}-"
+                  f"{entry['height']['max']:g} voxels, water {entry['materials'].get('Water', 0):.0%}, "
+                  f"{cover} ({entry['seconds']:.2f}s)")
+    elapsed = time.perf_counter() - start
+    
+    args.output.mkdir(parents=True, exist_ok=True)
+    summary.sort(key=lambda entry: (entry["biomes"], entry["seed"]))
+    (args.output / "summary.json").write_text(json.dumps({"settings": settings, "renders": summary}, indent=2) + "\n")
+    
+    print("\n" + "=" * 60)
+    print(f"Rendered {len(jobs)} maps in {elapsed:.2f}s ({len(jobs) / elapsed:.2f} maps/s)")
+    print(f"Output: {args.output}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+In-process API for the tile extractor, for callers that already hold the
+composite in memory (e.g. an asset server handling an upload).
+
+    from tile_api import detect_tiles, extract
+    
+    bounds = detect_tiles(png_bytes, [("mud", 0, 0), ("rock", 1, 0)])
+    tiles = extract(png_bytes, layout)  # {"mud": b"\\x89PNG...", ...}
+
+Sources can be PNG/JPEG bytes, a binary file object, a path or a PIL image.
+Nothing is written to disk and nothing is printed: the detectors' progress
+lines go to a `log` callable if one is given (e.g. logger.info). Calls don't
+share state, so several threads can detect and extract at once. Importing this module is cheap: Pillow, NumPy
+and the detectors are loaded on first use, and a missing dependency raises
+ImportError instead of exiting the process like the CLIs do.
+"""
+
+import io
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+class TileBounds(NamedTuple):
+    """A detected tile: crop box in sheet pixels, right/bottom exclusive."""
+    name: str
+    left: int
+    top: int
+    right: int
+    bottom: int
+    
+    @property
+    def box(self) -> tuple[int, int, int, int]:
+        return self.left, self.top, self.right, self.bottom
+
+
+def load_image(source) -> "Image.Image":
+    """
+    Decode a composite from bytes, a binary file object, a path or a PIL image, as RGB.
+    Raises ImportError with install advice if Pillow or NumPy is missing.
+    """
+    try:
+        import numpy  # noqa: F401 (the detectors need it, and extract_tiles_auto exits without it)
+        from PIL import Image
+    except ImportError as error:
+        raise ImportError("tile_api needs Pillow and NumPy: pip install Pillow numpy") from error
+    
+    if isinstance(source, Image.Image):
+        img = source
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        img = Image.open(io.BytesIO(source))
+    elif isinstance(source, (str, Path)):
+        img = Image.open(source)
+    elif hasattr(source, "read"):
+        img = Image.open(source)
+    else:
+        raise TypeError(f"Unsupported image source: {type(source).__name__}")
+    return img if img.mode == "RGB" else img.convert("RGB")
+
+
+def detect_tiles(source, layout: list[tuple[str, int, int]], detector: str = "grid",
+                 log: Callable[[str], None] = None) -> list[TileBounds]:
+    """
+    Detect the tiles of a composite. `layout` is [(name, col, row), ...] like
+    SHEETS in extract_tiles_auto.py; `detector` is a key of its DETECTORS.
+    Tiles that could not be found are left out of the result.
+    The detector's progress lines are passed to `log` if given, else dropped.
+    """
+    img = load_image(source)
+    from extract_tiles_auto import DETECTORS
+    
+    if detector not in DETECTORS:
+        raise ValueError(f"Unknown detector {detector!r}, expected one of {', '.join(sorted(DETECTORS))}")
+    
+    detections = DETECTORS[detector](img, layout, log=log if log is not None else lambda line: None)
+    return [TileBounds(name, *bounds) for name, (_, bounds) in detections.items() if bounds is not None]
+
+
+def extract(source, layout: list[tuple[str, int, int]], detector: str = "grid",
+            encoder: str = "pillow", jobs: int = 1, log: Callable[[str], None] = None) -> dict[str, bytes]:
+    """
+    Detect and crop every tile of a composite and encode each one as PNG.
+    `encoder` is a key of tile_encoding.ENCODERS ("canonical" for byte-stable
+    output). Encoding runs on `jobs` threads.
+    Returns {name: PNG bytes} for the tiles that were found, in layout order.
+    """
+    img = load_image(source)
+    from tile_encoding import ENCODERS
+    
+    if encoder not in ENCODERS:
+        raise ValueError(f"Unknown encoder {encoder!r}, expected one of {', '.join(sorted(ENCODERS))}")
+    
+    found = detect_tiles(img, layout, detector=detector, log=log)
+    
+    def encode(tile: TileBounds) -> bytes:
+        return ENCODERS[encoder](img.crop(tile.box))
+    
+    if jobs <= 1:
+        encoded = [encode(tile) for tile in found]
+    else:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            encoded = list(pool.map(encode, found))
+    return {tile.name: data for tile, data in zip(found, encoded)}
@@ -0,0 +1,75 @@
+"""
+Incremental extraction cache for the tile extractors.
+
+One JSON file per output directory records, for each composite, a key built
+from the source file hash and the detection parameters, the detected bounds,
+and the hash, size and mtime of every tile written. When the key matches and
+the outputs on disk are untouched, the composite is skipped without decoding.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+CACHE_FILE = ".extract-cache.json"
+
+# Bump when detection or encoding changes the output for the same inputs
+CACHE_VERSION = 1
+
+
+def bytes_sha256(data: bytes) -> str:
+    """SHA-256 hex digest of in-memory bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_cache(output_dir: Path) -> dict:
+    """Load the cache for an output directory, or an empty one if missing or stale."""
+    path = output_dir / CACHE_FILE
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text())
+    except json.JSONDecodeError:
+        return {}
+    if data.get("version") != CACHE_VERSION:
+        return {}
+    return data.get("sheets", {})
+
+
+def save_cache(output_dir: Path, cache: dict):
+    """Write the cache for an output directory."""
+    path = output_dir / CACHE_FILE
+    path.write_text(json.dumps({"version": CACHE_VERSION, "sheets": cache}, indent=2, sort_keys=True))
+
+
+def sheet_key(source_hash: str, params: dict) -> str:
+    """Cache key for a composite: its content hash plus everything that affects detection."""
+    return bytes_sha256(json.dumps({"source": source_hash, **params}, sort_keys=True).encode())
+
+
+def output_record(path: Path, sha256: str) -> dict:
+    """What the cache remembers about a written tile."""
+    stat = path.stat()
+    return {"sha256": sha256, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def output_matches(path: Path, record: dict) -> bool:
+    """
+    Check that a tile on disk is still the one recorded.
+    An unchanged size and mtime is trusted; otherwise the file is re-hashed.
+    """
+    if not path.exists():
+        return False
+    stat = path.stat()
+    if stat.st_size == record["size"] and stat.st_mtime_ns == record["mtime_ns"]:
+        return True
+    return file_sha256(path) == record["sha256"]
@@ -0,0 +1,103 @@
+"""
+Swatch colors for the extracted tiles (--colors).
+
+Every tile gets three colors: the mean, the per-channel median, and the
+dominant color (the center of the largest k-means cluster). They are written
+to generated/colors.luau keyed like BrushData.TerrainTileAssets, so the UI can
+draw a flat placeholder before a texture loads (or instead of it):
+
+    tileBtn.BackgroundColor3 = colors.mud.dominant
+
+Tiles of the same shape are stacked and reduced together. k-means runs on all
+stacks at once over a fixed sample of pixels from each tile, from a
+deterministic start, so the colors are the same on every run.
+"""
+
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from tile_luau import color3, write_module
+
+KMEANS_CLUSTERS = 4
+KMEANS_ITERATIONS = 12
+
+# Pixels per tile the k-means sample is drawn from (evenly spaced)
+KMEANS_SAMPLE = 4096
+
+
+def sample_pixels(stack: np.ndarray, count: int = KMEANS_SAMPLE) -> np.ndarray:
+    """Evenly spaced (N, count, 3) sample of an (N, H, W, 3) stack's pixels."""
+    pixels = stack.reshape(len(stack), -1, 3)
+    index = np.linspace(0, pixels.shape[1] - 1, min(count, pixels.shape[1])).round().astype(int)
+    return pixels[:, index]
+
+
+def kmeans_dominant(samples: np.ndarray, clusters: int = KMEANS_CLUSTERS,
+                    iterations: int = KMEANS_ITERATIONS) -> np.ndarray:
+    """
+    Batched k-means over (N, P, 3) pixel samples, one clustering per tile.
+    Centers start at the luminance quantiles of each tile.
+    Returns (N, 3): each tile's largest cluster center.
+    """
+    tiles, count, _ = samples.shape
+    luminance = samples @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+    order = np.argsort(luminance, axis=1)
+    picks = order[:, ((np.arange(clusters) + 0.5) / clusters * count).astype(int)]
+    centers = np.take_along_axis(samples, picks[:, :, None], axis=1)
+    
+    for _ in range(iterations):
+        distances = ((samples[:, :, None, :] - centers[:, None, :, :]) ** 2).sum(axis=3)
+        labels = distances.argmin(axis=2)
+        members = labels[:, :, None] == np.arange(clusters)  # (N, P, K)
+        sizes = members.sum(axis=1)
+        sums = np.einsum("npk,npc->nkc", members.astype(np.float32), samples)
+        # Empty clusters keep their previous center
+        centers = np.where(sizes[:, :, None] > 0, sums / np.maximum(sizes, 1)[:, :, None], centers)
+    
+    return centers[np.arange(tiles), sizes.argmax(axis=1)]
+
+
+def tile_colors(tiles: dict[str, Image.Image]) -> dict[str, dict[str, tuple[int, int, int]]]:
+    """Mean, median and dominant color of every tile: {name: {"mean": (r, g, b), ...}}."""
+    groups = {}
+    for name, tile in tiles.items():
+        groups.setdefault(tile.size, []).append(name)
+    
+    # Equally long samples, so every tile clusters in one batch
+    count = min(KMEANS_SAMPLE, *(width * height for width, height in groups))
+    names = []
+    means, medians, samples = [], [], []
+    for names_in_group in groups.values():
+        stack = np.stack([np.asarray(tiles[name].convert("RGB"), dtype=np.float32)
+                          for name in names_in_group])
+        names += names_in_group
+        means.append(stack.mean(axis=(1, 2)))
+        medians.append(np.median(stack.reshape(len(stack), -1, 3), axis=1))
+        samples.append(sample_pixels(stack, count))
+    
+    dominant = kmeans_dominant(np.concatenate(samples))
+    
+    colors = {}
+    for kind, values in (("mean", np.concatenate(means)), ("median", np.concatenate(medians)),
+                         ("dominant", dominant)):
+        values = np.clip(np.rint(values), 0, 255).astype(int)
+        for name, value in zip(names, values):
+            colors.setdefault(name, {})[kind] = tuple(value.tolist())
+    return colors
+
+
+def write_colors(tile_paths: list[Path], output_dir: Path) -> dict:
+    """Compute the swatch colors of the extracted tiles and write generated/colors.luau."""
+    tiles = {path.stem: Image.open(path) for path in tile_paths if path.exists()}
+    if not tiles:
+        return {}
+    colors = tile_colors(tiles)
+    
+    for name, swatch in colors.items():
+        print(f"  {name}: dominant {swatch['dominant']}, mean {swatch['mean']}, median {swatch['median']}")
+    write_module(output_dir / "generated" / "colors.luau", "colors",
+                 {name: {kind: color3(*rgb) for kind, rgb in swatch.items()} for name, swatch in colors.items()},
+                 "extract_tiles_auto.py --colors")
+    return colors
@@ -0,0 +1,250 @@
+"""
+Tile encoders for the extractors, and the upload check against asphalt.lock.toml.
+
+Encoders (ENCODERS, selectable with --encoder):
+    pillow      Pillow's defaults
+    canonical   Byte-stable PNG (see below)
+    optimized   Smallest of Pillow's optimize=True and canonical, pixels unchanged
+    palette     256-color palette PNG, lossy (about half the bytes of a photographic tile)
+WebP is smaller still, but Roblox doesn't take WebP image uploads, so the WebP
+encoders (MEASURE_ONLY_ENCODERS) are only compared by benchmark_encoders.py.
+
+asphalt.lock.toml keys uploads by a hash of each PNG file (BLAKE3 of the raw
+bytes), so any change in the encoded bytes means a re-upload and a new asset ID,
+even when the pixels are identical. The "canonical" encoder writes the bytes itself: IHDR, one IDAT and
+IEND only (no ancillary chunks), Paeth filter on every row, zlib at a fixed
+level. It also keeps an existing file whose pixels match, whatever its bytes.
+"""
+
+import hashlib
+import io
+import struct
+import time
+import tomllib
+import zlib
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from tile_cache import bytes_sha256, file_sha256
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Fixed so identical pixels always compress to identical bytes
+CANONICAL_ZLIB_LEVEL = 9
+
+PNG_COLOR_TYPES = {"L": 0, "RGB": 2, "RGBA": 6}
+
+PAETH_FILTER = 4
+
+# Lossy WebP quality (0-100) and effort (0-6) for the encoder comparison
+WEBP_QUALITY = 90
+WEBP_METHOD = 6
+
+
+def encode_png_pillow(img: Image.Image) -> bytes:
+    """Encode with Pillow's defaults (output can vary with Pillow/zlib version and metadata)."""
+    buffer = io.BytesIO()
+    img.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def png_chunk(tag: bytes, data: bytes) -> bytes:
+    """Serialize one PNG chunk: length, tag, data, CRC."""
+    return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+
+def paeth_filter(pixels: np.ndarray) -> bytes:
+    """
+    Apply PNG filter type 4 (Paeth) to every row of a (height, width, channels) array.
+    Encoding filters only look at unfiltered neighbours, so all rows are filtered at once.
+    Returns the scanlines, each prefixed with its filter type byte.
+    """
+    height, width, channels = pixels.shape
+    x = pixels.astype(np.int16)
+    
+    left = np.zeros_like(x)
+    left[:, 1:] = x[:, :-1]
+    up = np.zeros_like(x)
+    up[1:] = x[:-1]
+    up_left = np.zeros_like(x)
+    up_left[1:, 1:] = x[:-1, :-1]
+    
+    estimate = left + up - up_left
+    dist_left = np.abs(estimate - left)
+    dist_up = np.abs(estimate - up)
+    dist_up_left = np.abs(estimate - up_left)
+    predictor = np.where((dist_left <= dist_up) & (dist_left <= dist_up_left), left,
+                         np.where(dist_up <= dist_up_left, up, up_left))
+    
+    filtered = ((x - predictor) & 0xFF).astype(np.uint8).reshape(height, width * channels)
+    scanlines = np.empty((height, width * channels + 1), dtype=np.uint8)
+    scanlines[:, 0] = PAETH_FILTER
+    scanlines[:, 1:] = filtered
+    return scanlines.tobytes()
+
+
+def encode_png_canonical(img: Image.Image) -> bytes:
+    """
+    Encode a PNG whose bytes depend only on the pixels: critical chunks only,
+    Paeth-filtered rows, zlib level CANONICAL_ZLIB_LEVEL.
+    """
+    if img.mode not in PNG_COLOR_TYPES:
+        img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+    
+    pixels = np.asarray(img)
+    if pixels.ndim == 2:
+        pixels = pixels[..., np.newaxis]
+    height, width, _ = pixels.shape
+    
+    header = struct.pack(">IIBBBBB", width, height, 8, PNG_COLOR_TYPES[img.mode], 0, 0, 0)
+    data = zlib.compress(paeth_filter(pixels), CANONICAL_ZLIB_LEVEL)
+    return PNG_SIGNATURE + png_chunk(b"IHDR", header) + png_chunk(b"IDAT", data) + png_chunk(b"IEND", b"")
+
+
+def encode_png_optimized(img: Image.Image) -> bytes:
+    """
+    Lossless PNG, the smaller of Pillow with optimize=True (adaptive row
+    filters, zlib level 9) and the canonical encoder's Paeth rows.
+    """
+    buffer = io.BytesIO()
+    img.save(buffer, "PNG", optimize=True)
+    return min(buffer.getvalue(), encode_png_canonical(img), key=len)
+
+
+def encode_png_palette(img: Image.Image) -> bytes:
+    """
+    Quantize to a 256-color palette (lossy, Floyd-Steinberg dithered) and
+    write it with optimize=True. Median cut for RGB; it can't do alpha, so
+    images with alpha use the fast octree.
+    """
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+    method = Image.Quantize.MEDIANCUT if img.mode == "RGB" else Image.Quantize.FASTOCTREE
+    buffer = io.BytesIO()
+    img.quantize(256, method=method).save(buffer, "PNG", optimize=True)
+    return buffer.getvalue()
+
+
+def encode_webp_lossless(img: Image.Image) -> bytes:
+    """Lossless WebP at the highest effort."""
+    buffer = io.BytesIO()
+    img.save(buffer, "WEBP", lossless=True, method=WEBP_METHOD)
+    return buffer.getvalue()
+
+
+def encode_webp(img: Image.Image) -> bytes:
+    """Lossy WebP at WEBP_QUALITY."""
+    buffer = io.BytesIO()
+    img.save(buffer, "WEBP", quality=WEBP_QUALITY, method=WEBP_METHOD)
+    return buffer.getvalue()
+
+
+ENCODERS = {
+    "pillow": encode_png_pillow,
+    "canonical": encode_png_canonical,
+    "optimized": encode_png_optimized,
+    "palette": encode_png_palette,
+}
+
+# Formats Roblox won't accept as image assets, only measured by benchmark_encoders.py
+MEASURE_ONLY_ENCODERS = {
+    "webp-lossless": encode_webp_lossless,
+    "webp": encode_webp,
+}
+
+
+def pixel_sha256(img: Image.Image) -> str:
+    """Hash of an image's mode, size and raw pixels, independent of how it was encoded."""
+    digest = hashlib.sha256(f"{img.mode} {img.size[0]}x{img.size[1]}".encode())
+    digest.update(img.tobytes())
+    return digest.hexdigest()
+
+
+def encode_tile(tile: Image.Image, encoder: str = "pillow", stats: dict = None) -> tuple[bytes, str]:
+    """
+    Encode a tile. If given, `stats` receives the encoded size ("bytes") and
+    the seconds spent in "encode".
+    Returns (PNG bytes, their sha256).
+    """
+    start = time.perf_counter()
+    data = ENCODERS[encoder](tile)
+    if stats is not None:
+        stats["encode"] = time.perf_counter() - start
+        stats["bytes"] = len(data)
+    return data, bytes_sha256(data)
+
+
+def file_holding(path: Path, tile: Image.Image, data: bytes, digest: str, encoder: str = "pillow") -> str:
+    """
+    The sha256 of the file at `path` if it already holds this tile, else None.
+    Identical bytes always count. With the canonical encoder an existing file
+    with identical pixels counts too, so its upload hash stays stable.
+    """
+    if not path.exists():
+        return None
+    if path.stat().st_size == len(data) and file_sha256(path) == digest:
+        return digest
+    if encoder == "canonical":
+        with Image.open(path) as existing:
+            if existing.mode == tile.mode and pixel_sha256(existing) == pixel_sha256(tile):
+                return file_sha256(path)
+    return None
+
+
+def write_tile(tile: Image.Image, path: Path, encoder: str = "pillow",
+               stats: dict = None) -> tuple[str, bool]:
+    """
+    Encode a tile and write it unless the file on disk already holds it
+    (see file_holding), so its mtime and upload hash are preserved.
+    If given, `stats` receives the encoded size ("bytes") and the seconds spent
+    in "encode" and "write" (which includes comparing with the file on disk).
+    Returns (sha256 of the file on disk, whether it was written).
+    """
+    data, digest = encode_tile(tile, encoder, stats=stats)
+    start = time.perf_counter()
+    on_disk = file_holding(path, tile, data, digest, encoder)
+    if on_disk is None:
+        path.write_bytes(data)
+    if stats is not None:
+        stats["write"] = time.perf_counter() - start
+    return (digest, True) if on_disk is None else (on_disk, False)
+
+
+def load_lock(lock_path: Path, input_name: str = "terrain") -> dict[str, int]:
+    """Read asphalt.lock.toml into {file hash: asset_id} for one input."""
+    with open(lock_path, "rb") as f:
+        lock = tomllib.load(f)
+    return {digest: entry["asset_id"] for digest, entry in lock.get("inputs", {}).get(input_name, {}).items()}
+
+
+def report_lock_changes(tile_paths: list[Path], lock_path: Path, input_name: str = "terrain"):
+    """
+    Predict what `asphalt sync` would upload for these tiles.
+    Tiles whose hash is already locked keep their asset ID; the rest would be
+    uploaded. Lock entries no PNG in the lock's directory matches would be dropped.
+    """
+    if not lock_path.exists():
+        print(f"  No {lock_path.name} found, skipping upload prediction")
+        return
+    try:
+        from blake3 import blake3
+    except ImportError:
+        print("  blake3 not installed (pip install blake3), skipping upload prediction")
+        return
+    
+    def lock_hash(path: Path) -> str:
+        return blake3(path.read_bytes()).hexdigest()
+    
+    locked = load_lock(lock_path, input_name)
+    uploads = [path.stem for path in tile_paths if lock_hash(path) not in locked]
+    current = {lock_hash(path) for path in lock_path.parent.glob("*.png")}
+    stale = [digest for digest in locked if digest not in current]
+    
+    print(f"\nUpload prediction ({lock_path.name}):")
+    print(f"  Unchanged: {len(tile_paths) - len(uploads)} tiles keep their asset IDs")
+    if uploads:
+        print(f"  Would upload: {len(uploads)} tiles: {', '.join(sorted(uploads))}")
+    if stale:
+        print(f"  Lock entries replaced: {len(stale)} (asset IDs {', '.join(str(locked[d]) for d in stale)})")
@@ -0,0 +1,81 @@
+"""
+Luau module writer for the tables the tile tools generate.
+
+Output follows asphalt's "nested" codegen (see generated/terrain.luau): tab
+indentation, keys sorted, bare keys where Luau allows them and ["key"]
+otherwise, so generated modules diff and read alike.
+"""
+
+import re
+from pathlib import Path
+
+LUAU_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+GENERATED_HEADER = (
+    "-- This file is automatically @generated by {generator}.\n"
+    "-- It is not intended for manual editing."
+)
+
+LUAU_KEYWORDS = {
+    "and", "break", "continue", "do", "else", "elseif", "end", "export", "false", "for",
+    "function", "if", "in", "local", "nil", "not", "or", "repeat", "return", "then",
+    "true", "type", "until", "while",
+}
+
+
+class LuauCode(str):
+    """A value written into the module as-is, e.g. Vector2.new(0, 0)."""
+
+
+def vector2(x: float, y: float) -> LuauCode:
+    return LuauCode(f"Vector2.new({x}, {y})")
+
+
+def color3(r: int, g: int, b: int) -> LuauCode:
+    return LuauCode(f"Color3.fromRGB({r}, {g}, {b})")
+
+
+def luau_key(key) -> str:
+    """A table key: bare identifier, or bracketed literal."""
+    if isinstance(key, str) and LUAU_IDENTIFIER.match(key) and key not in LUAU_KEYWORDS:
+        return key
+    return f"[{luau_value(key)}]"
+
+
+def luau_value(value, indent: int = 0) -> str:
+    """Format a Python value (dict, list, str, number, bool, None, LuauCode) as Luau."""
+    if isinstance(value, LuauCode):
+        return str(value)
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if value is None:
+        return "nil"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, str):
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        return f'"{escaped}"'
+    
+    inner = "\t" * (indent + 1)
+    if isinstance(value, dict):
+        items = [f"{inner}{luau_key(key)} = {luau_value(value[key], indent + 1)},"
+                 for key in sorted(value, key=lambda key: (isinstance(key, str), key))]
+    elif isinstance(value, (list, tuple)):
+        items = [f"{inner}{luau_value(item, indent + 1)}," for item in value]
+    else:
+        raise TypeError(f"Can't write {type(value).__name__} as Luau")
+    if not items:
+        return "{}"
+    return "{\n" + "\n".join(items) + "\n" + "\t" * indent + "}"
+
+
+def write_module(path: Path, name: str, table: dict, generator: str):
+    """Write `table` as a Luau module returning it, with a generated-file header."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        GENERATED_HEADER.format(generator=generator) + "\n"
+        f"local {name} = {luau_value(table)}\n"
+        "\n"
+        f"return {name}\n"
+    )
+    print(f"Wrote {path.name}")
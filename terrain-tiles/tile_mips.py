@@ -0,0 +1,125 @@
+"""
+Mip chains for the extracted tiles (--mips).
+
+The material grid shows tiles as small swatches (Theme.MaterialTileSize is
+72 px), so each tile is also written downscaled to a few sizes, as
+<name>-<size>.png next to the full tile where asphalt uploads it. Sizes are
+the longest side; smaller tiles are never upscaled.
+
+Resampling is one batched pass per size: tiles of the same shape are stacked
+into an (N, H, W, 3) array and box-filtered by two weight matrices, where
+each output pixel averages the source pixels it covers (partial pixels
+weighted by coverage). generated/mips.luau maps every tile to its asset keys
+by size, so the UI can pick the smallest one that is large enough:
+
+    for _, size in mips.sizes do
+        if size >= swatchSize and mips.mud[size] then
+            return terrain[mips.mud[size]]
+        end
+    end
+"""
+
+import re
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from tile_encoding import write_tile
+from tile_luau import write_module
+
+# Default chain; the full-size tile stays the largest level
+MIP_SIZES = (256, 128, 64, 32)
+
+
+def parse_mip_sizes(text: str) -> tuple[int, ...]:
+    """Parse "256,128,64" into sizes, largest first. Raises ValueError if malformed."""
+    try:
+        sizes = {int(part) for part in text.split(",") if part.strip()}
+    except ValueError:
+        sizes = None
+    if not sizes or min(sizes) < 1:
+        raise ValueError(f"Mip sizes must be positive integers, got {text!r}")
+    return tuple(sorted(sizes, reverse=True))
+
+
+def box_weights(source: int, target: int) -> np.ndarray:
+    """
+    (target, source) matrix averaging source pixels into target pixels, each
+    source pixel weighted by how much of it the target pixel covers.
+    """
+    edges = np.arange(target + 1) * (source / target)
+    starts, ends = edges[:-1, None], edges[1:, None]
+    pixels = np.arange(source)[None, :]
+    coverage = np.clip(np.minimum(ends, pixels + 1) - np.maximum(starts, pixels), 0, None)
+    return (coverage / coverage.sum(axis=1, keepdims=True)).astype(np.float32)
+
+
+def mip_shape(width: int, height: int, size: int) -> tuple[int, int]:
+    """Tile size scaled so its longest side is `size`, aspect ratio kept."""
+    scale = size / max(width, height)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def build_mips(tiles: dict[str, Image.Image], sizes: tuple[int, ...]) -> dict[str, dict[int, Image.Image]]:
+    """
+    Downscale every tile to each size smaller than it.
+    Tiles are grouped by shape and each group is resampled as one stack.
+    Returns {name: {size: image}}.
+    """
+    groups = {}
+    for name, tile in tiles.items():
+        groups.setdefault(tile.size, []).append(name)
+    
+    mips = {name: {} for name in tiles}
+    for (width, height), names in groups.items():
+        stack = np.stack([np.asarray(tiles[name].convert("RGB"), dtype=np.float32) for name in names])
+        for size in sizes:
+            if size >= max(width, height):
+                continue
+            mip_width, mip_height = mip_shape(width, height, size)
+            rows = np.einsum("yh,nhwc->nywc", box_weights(height, mip_height), stack)
+            levels = np.einsum("xw,nywc->nyxc", box_weights(width, mip_width), rows)
+            levels = np.clip(np.rint(levels), 0, 255).astype(np.uint8)
+            for name, level in zip(names, levels):
+                mips[name][size] = Image.fromarray(level)
+    return mips
+
+
+def write_mips(tile_paths: list[Path], output_dir: Path, sizes: tuple[int, ...] = MIP_SIZES,
+               encoder: str = "pillow") -> list[Path]:
+    """
+    Write <name>-<size>.png for each extracted tile and generated/mips.luau.
+    Unchanged mips are not rewritten (see tile_encoding.write_tile).
+    Returns the paths of the mips.
+    """
+    tiles = {path.stem: Image.open(path) for path in tile_paths if path.exists()}
+    if not tiles:
+        return []
+    mips = build_mips(tiles, sizes)
+    
+    written = []
+    changed = 0
+    entries = {}
+    for name, levels in mips.items():
+        entries[name] = {max(tiles[name].size): name}
+        for size, level in levels.items():
+            key = f"{name}-{size}"
+            path = output_dir / f"{key}.png"
+            changed += write_tile(level, path, encoder)[1]
+            written.append(path)
+            entries[name][size] = key
+    print(f"  Mips: {len(written)} written for {len(mips)} tiles at {', '.join(map(str, sizes))} px "
+          f"({changed} changed)")
+    
+    # Mips of sizes no longer in the chain would still be uploaded
+    pattern = re.compile(rf"^({'|'.join(map(re.escape, mips))})-\d+\.png$")
+    stale = sorted(path.name for path in output_dir.glob("*-*.png")
+                   if pattern.match(path.name) and path not in written)
+    if stale:
+        print(f"  WARNING: Old mips no longer generated: {', '.join(stale)} (delete them before syncing)")
+    
+    all_sizes = sorted({size for levels in entries.values() for size in levels})
+    write_module(output_dir / "generated" / "mips.luau", "mips",
+                 {"sizes": all_sizes, **entries}, "extract_tiles_auto.py --mips")
+    return written
@@ -0,0 +1,180 @@
+"""
+Perceptual-hash index of the extracted tiles (--phash).
+
+A re-screenshot sheet or a revised terrain texture gives tiles that differ by
+a pixel of border or some compression noise. Their bytes change, so asphalt
+would upload every one under a new asset ID. phash-index.json, next to
+asphalt.lock.toml, records a DCT hash (pHash) and a gradient hash (dHash) of
+every tile's interior, plus its mean color: both hashes are grayscale, so a
+recolored material hashes like the original. When a new crop is within
+SIMILAR_DISTANCE bits of the indexed tile on both hashes, within COLOR_DRIFT
+of its mean color, and about the same size, the file on disk is kept as it
+is. Only materials that really changed are rewritten. Nearly flat
+tiles hash mostly noise, so they may still be rewritten; they are never
+mistaken for another material.
+
+The index is keyed by tile name, and an entry is only trusted while the
+file's SHA-256 still matches it; otherwise the file is re-hashed.
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from tile_cache import file_sha256
+
+PHASH_INDEX_FILE = "phash-index.json"
+
+PHASH_INDEX_VERSION = 2
+
+# Hashes are HASH_SIZE x HASH_SIZE bits; pHash takes the DCT of a 4x larger thumbnail
+HASH_SIZE = 8
+PHASH_THUMBNAIL = HASH_SIZE * 4
+
+# Border hashed away, so a crop that moved by a pixel or two still hashes alike
+HASH_MARGIN = 4
+
+# Most bits (of 64) either hash may differ by for two tiles to count as the same.
+# Re-cropped, JPEG-noised terrain tiles stay within 8; different materials are 20+ apart.
+SIMILAR_DISTANCE = 10
+
+# Most pixels a re-detected crop may differ by in width or height
+SIZE_DRIFT = 4
+
+# Most the mean of any RGB channel (0-255) may move for two tiles to count as the same.
+# Re-cropped, JPEG-noised terrain tiles move by under 1; a visible tint moves it by 10+.
+COLOR_DRIFT = 4
+
+
+def dct_matrix(size: int) -> np.ndarray:
+    """Orthonormal DCT-II matrix: dct_matrix(n) @ x is the DCT of x."""
+    k = np.arange(size)[:, None]
+    n = np.arange(size)[None, :]
+    matrix = np.cos(np.pi * (2 * n + 1) * k / (2 * size)) * np.sqrt(2 / size)
+    matrix[0] /= np.sqrt(2)
+    return matrix
+
+
+DCT = dct_matrix(PHASH_THUMBNAIL)
+
+
+def pack_bits(bits: np.ndarray) -> str:
+    """A boolean array as a hex string, first element most significant."""
+    return f"{int(''.join('1' if bit else '0' for bit in bits.ravel()), 2):0{bits.size // 4}x}"
+
+
+def phash(img: Image.Image) -> str:
+    """DCT hash: low frequencies of a grayscale thumbnail compared to their median."""
+    thumbnail = np.asarray(img.convert("L").resize((PHASH_THUMBNAIL, PHASH_THUMBNAIL), Image.BOX),
+                           dtype=np.float64)
+    low = (DCT @ thumbnail @ DCT.T)[:HASH_SIZE, :HASH_SIZE]
+    return pack_bits(low > np.median(low.ravel()[1:]))  # The DC term would skew the median
+
+
+def dhash(img: Image.Image) -> str:
+    """Gradient hash: whether each pixel of a grayscale thumbnail is brighter than its left neighbour."""
+    thumbnail = np.asarray(img.convert("L").resize((HASH_SIZE + 1, HASH_SIZE), Image.BOX), dtype=np.int16)
+    return pack_bits(thumbnail[:, 1:] > thumbnail[:, :-1])
+
+
+def mean_color(img: Image.Image) -> list[float]:
+    """Mean R, G and B of a tile, rounded to 0.1."""
+    pixels = np.asarray(img.convert("RGB"), dtype=np.float64).reshape(-1, 3)
+    return [round(float(channel), 1) for channel in pixels.mean(axis=0)]
+
+
+def hamming(a: str, b: str) -> int:
+    """Number of differing bits between two hex hashes."""
+    return (int(a, 16) ^ int(b, 16)).bit_count()
+
+
+def tile_hashes(img: Image.Image) -> dict:
+    """Index entry for a tile, without its file hash. Only the interior is hashed."""
+    width, height = img.size
+    interior = img
+    if min(width, height) > 4 * HASH_MARGIN:
+        interior = img.crop((HASH_MARGIN, HASH_MARGIN, width - HASH_MARGIN, height - HASH_MARGIN))
+    return {"phash": phash(interior), "dhash": dhash(interior), "color": mean_color(interior),
+            "size": list(img.size)}
+
+
+def distance(entry: dict, other: dict) -> int:
+    """
+    Perceptual distance between two index entries: the larger of the pHash
+    and dHash distances, or None if their sizes differ by more than SIZE_DRIFT
+    or their mean colors by more than COLOR_DRIFT, whatever the hashes say.
+    """
+    if any(abs(a - b) > SIZE_DRIFT for a, b in zip(entry["size"], other["size"])):
+        return None
+    if any(abs(a - b) > COLOR_DRIFT for a, b in zip(entry["color"], other["color"])):
+        return None
+    return max(hamming(entry["phash"], other["phash"]), hamming(entry["dhash"], other["dhash"]))
+
+
+def load_index(output_dir: Path) -> dict:
+    """Load the index for an output directory, or an empty one if missing or stale."""
+    path = output_dir / PHASH_INDEX_FILE
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text())
+    except json.JSONDecodeError:
+        return {}
+    if data.get("version") != PHASH_INDEX_VERSION:
+        return {}
+    return data.get("tiles", {})
+
+
+def save_index(output_dir: Path, index: dict):
+    """Write the index for an output directory."""
+    path = output_dir / PHASH_INDEX_FILE
+    path.write_text(json.dumps({"version": PHASH_INDEX_VERSION, "tiles": index}, indent=2, sort_keys=True) + "\n")
+
+
+def indexed_entry(index: dict, path: Path) -> dict:
+    """The index entry for a tile file, re-hashed (and updated) if the file no longer matches it."""
+    if not path.exists():
+        return None
+    digest = file_sha256(path)
+    entry = index.get(path.stem)
+    if entry is None or entry["sha256"] != digest:
+        with Image.open(path) as img:
+            entry = {**tile_hashes(img), "sha256": digest}
+        index[path.stem] = entry
+    return entry
+
+
+def similar_on_disk(index: dict, path: Path, tile: Image.Image) -> tuple[dict, int]:
+    """
+    Compare a new tile with the one at `path`.
+    Returns (the new tile's hashes, distance to the file on disk if it is
+    similar enough to keep, else None).
+    """
+    hashes = tile_hashes(tile)
+    entry = indexed_entry(index, path)
+    if entry is None:
+        return hashes, None
+    tile_distance = distance(hashes, entry)
+    if tile_distance is None or tile_distance > SIMILAR_DISTANCE:
+        return hashes, None
+    return hashes, tile_distance
+
+
+def update_index(index: dict, tile_paths: list[Path]):
+    """Make sure every tile on disk has a current entry (e.g. tiles skipped on a cache hit)."""
+    for path in tile_paths:
+        indexed_entry(index, path)
+
+
+def similar_pairs(index: dict) -> list[tuple[str, str, int]]:
+    """Pairs of differently named tiles that look the same: [(name, name, distance), ...]."""
+    names = sorted(index)
+    pairs = []
+    for i, name in enumerate(names):
+        for other in names[i + 1:]:
+            pair_distance = distance(index[name], index[other])
+            if pair_distance is not None and pair_distance <= SIMILAR_DISTANCE:
+                pairs.append((name, other, pair_distance))
+    return pairs
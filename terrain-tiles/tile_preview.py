@@ -0,0 +1,47 @@
+"""
+Lightweight preview output for the tile extractors.
+
+Previews are debug images: the sheet is downscaled first, the overlays are
+drawn on the small copy, and the result is saved palette-quantized (or as
+JPEG). They go to a previews/ subfolder, which the "./*.png" input glob in
+asphalt.toml does not match, so they are never uploaded as assets.
+"""
+
+from pathlib import Path
+
+from PIL import Image
+
+PREVIEW_DIR = "previews"
+
+# Preview is 1/PREVIEW_FACTOR of the sheet's size in each dimension
+PREVIEW_FACTOR = 2
+
+# Encoding name -> file extension
+PREVIEW_ENCODINGS = {
+    "palette": "png",  # 256-color PNG, crisp overlays, smallest for debug images
+    "jpeg": "jpg",     # Lossy, best for photographic sheets at large sizes
+    "png": "png",      # Full color, lossless
+}
+
+
+def preview_base(img: Image.Image, factor: int = PREVIEW_FACTOR) -> Image.Image:
+    """Downscaled RGB copy of a sheet to draw the preview overlays on."""
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    return img.reduce(factor) if factor > 1 else img.copy()
+
+
+def preview_output_path(output_dir: Path, name: str, encoding: str = "palette") -> Path:
+    """Where a preview named `name` (no extension) is written."""
+    return output_dir / PREVIEW_DIR / f"{name}.{PREVIEW_ENCODINGS[encoding]}"
+
+
+def save_preview(img: Image.Image, path: Path, encoding: str = "palette"):
+    """Encode a rendered preview and write it, creating the previews folder if needed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if encoding == "palette":
+        img.quantize(256, method=Image.Quantize.FASTOCTREE).save(path, "PNG", optimize=True)
+    elif encoding == "jpeg":
+        img.save(path, "JPEG", quality=80, optimize=True)
+    else:
+        img.save(path, "PNG", optimize=True)
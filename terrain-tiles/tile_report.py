@@ -0,0 +1,134 @@
+"""
+Machine-readable run reports for the tile extractors.
+
+Each composite gets a sheet report: wall time (and, while profiling,
+allocations) per stage, the cache status, and every tile's bounds, output
+and timings. Stages nest: a stage opened inside another is subtracted from
+its parent. Crop, encode and write are summed over tiles,
+so with several encode threads they add up to more than their wall time.
+Allocation numbers are the traced peak over a stage, nested stages included.
+They come from tracemalloc and are only recorded while it is tracing
+(--profile); NumPy buffers are traced, Pillow's image memory is not.
+"""
+
+import cProfile
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+REPORT_VERSION = 1
+
+# Report stages are recorded into, and the stages currently open (main thread only)
+_active_report = None
+_open_stages = []
+
+
+def sheet_report(image_path: Path, detector: str, encoder: str) -> dict:
+    """Empty report for one composite."""
+    return {
+        "source": str(image_path),
+        "detector": detector,
+        "encoder": encoder,
+        "cache": "off",
+        "size": None,
+        "seconds": None,
+        "stages": {},
+        "tiles": {},
+    }
+
+
+@contextmanager
+def recording(report: dict):
+    """Record the stages run inside this block into `report` (a no-op when None)."""
+    global _active_report
+    previous = _active_report
+    _active_report = report
+    start = time.perf_counter()
+    try:
+        yield report
+    finally:
+        if report is not None:
+            report["seconds"] = time.perf_counter() - start
+        _active_report = previous
+
+
+@contextmanager
+def stage(name: str):
+    """Time a stage of the active sheet report; does nothing outside `recording`."""
+    report = _active_report
+    if report is None:
+        yield
+        return
+    
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        current, peak = tracemalloc.get_traced_memory()
+        if _open_stages:
+            _open_stages[-1]["peak"] = max(_open_stages[-1]["peak"], peak)
+        tracemalloc.reset_peak()
+    frame = {"children": 0.0, "base": current if tracing else 0, "peak": 0}
+    _open_stages.append(frame)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        _open_stages.pop()
+        if _open_stages:
+            _open_stages[-1]["children"] += elapsed
+        
+        entry = report["stages"].setdefault(name, {"seconds": 0.0, "alloc_mb": None})
+        entry["seconds"] += elapsed - frame["children"]
+        if tracing:
+            peak = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+            if _open_stages:
+                _open_stages[-1]["peak"] = max(_open_stages[-1]["peak"], peak)
+            alloc_mb = (peak - frame["base"]) / (1 << 20)
+            entry["alloc_mb"] = max(entry["alloc_mb"] or 0.0, alloc_mb)
+
+
+def add_stage_time(report: dict, name: str, seconds: float):
+    """Add time measured elsewhere (e.g. in encode threads) to a stage of a report."""
+    if report is None:
+        return
+    entry = report["stages"].setdefault(name, {"seconds": 0.0, "alloc_mb": None})
+    entry["seconds"] += seconds
+
+
+def start_profile() -> cProfile.Profile:
+    """Start cProfile and tracemalloc (which also turns on per-stage allocation numbers)."""
+    tracemalloc.start()
+    profiler = cProfile.Profile()
+    profiler.enable()
+    return profiler
+
+
+def stop_profile(profiler: cProfile.Profile, prefix: Path, top: int = 40) -> dict:
+    """
+    Stop profiling and dump <prefix>.prof (open with pstats or snakeviz) and
+    <prefix>.alloc.txt (the largest live allocations by line).
+    Returns the paths written.
+    """
+    profiler.disable()
+    prefix.parent.mkdir(parents=True, exist_ok=True)
+    profile_path = prefix.with_name(f"{prefix.name}.prof")
+    profiler.dump_stats(profile_path)
+    
+    snapshot = tracemalloc.take_snapshot()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    lines = [f"Live traced memory: {current / (1 << 20):.1f} MB", f"Top {top} live allocations by line:"]
+    lines += [str(statistic) for statistic in snapshot.statistics("lineno")[:top]]
+    alloc_path = prefix.with_name(f"{prefix.name}.alloc.txt")
+    alloc_path.write_text("\n".join(lines) + "\n")
+    
+    return {"cprofile": str(profile_path), "tracemalloc": str(alloc_path)}
+
+
+def write_report(path: Path, sheets: list[dict], **run_info):
+    """Write the run report: run-wide settings plus one entry per sheet."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"version": REPORT_VERSION, **run_info, "sheets": sheets}, indent=2))
+    print(f"Report written: {path}")
@@ -0,0 +1,270 @@
+"""
+Streaming decode for composites too large to hold in memory (--stream).
+
+The PNG is inflated incrementally and unfiltered STRIP_ROWS rows at a time:
+each strip is rewrapped as a small PNG, seeded with the previous strip's last
+row, so Pillow still does the unfiltering. Rows are spooled as raw RGB to a
+temporary file while the row/column occupancy profiles are accumulated.
+Grid detection makes one more pass over the spool for the per-cell trim, and
+each tile is cropped by reading back only its own rows.
+
+Peak memory is about one strip (STRIP_ROWS x width) plus the tiles being
+encoded, instead of the whole sheet; the spool takes width x height x 3 bytes
+of temp disk. Only non-interlaced 8-bit PNGs can be streamed.
+"""
+
+import io
+import struct
+import tempfile
+import threading
+import zlib
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from extract_tiles_auto import background_mask, grid_result, name_grid_cells, occupancy_bands, trim_cell
+from tile_encoding import PNG_SIGNATURE, png_chunk
+
+# Rows decoded at a time; a multiple of every preview/pyramid downscale factor
+STRIP_ROWS = 256
+
+# PNG color type -> samples per pixel
+PNG_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+# Ancillary chunks every strip needs to decode the same way as the full image
+STRIP_CHUNKS = (b"PLTE", b"tRNS")
+
+
+class SpooledSheet:
+    """
+    A decoded composite kept as raw RGB rows in a temporary file.
+    Provides the parts of the PIL image API the extractor uses on a sheet
+    (size, mode, crop, reduce), reading only the rows each call needs.
+    Use it as a context manager (like a PIL image) so the spool is deleted
+    as soon as the sheet is done with.
+    """
+    mode = "RGB"
+    
+    def __init__(self, width: int, height: int):
+        self.size = (width, height)
+        self._stride = width * 3
+        self._file = tempfile.TemporaryFile()
+        self._lock = threading.Lock()  # crop runs on encode threads; seek+read must not interleave
+    
+    def append(self, rows: np.ndarray):
+        """Append decoded rows; spooling is sequential, top to bottom."""
+        self._file.write(rows.tobytes())
+    
+    def rows(self, top: int, bottom: int) -> np.ndarray:
+        """Read rows [top, bottom) as a (rows, width, 3) array."""
+        with self._lock:
+            self._file.seek(top * self._stride)
+            data = self._file.read((bottom - top) * self._stride)
+        return np.frombuffer(data, dtype=np.uint8).reshape(bottom - top, self.size[0], 3)
+    
+    def strips(self, rows: int = STRIP_ROWS):
+        """Yield (top, rows array) over the whole sheet, `rows` rows at a time."""
+        height = self.size[1]
+        for top in range(0, height, rows):
+            yield top, self.rows(top, min(height, top + rows))
+    
+    def crop(self, box: tuple[int, int, int, int]) -> Image.Image:
+        """Crop like Image.crop, reading only the box's pixels."""
+        left, top, right, bottom = box
+        row_bytes = (right - left) * 3
+        data = bytearray((bottom - top) * row_bytes)
+        with self._lock:
+            for y in range(top, bottom):
+                self._file.seek(y * self._stride + left * 3)
+                offset = (y - top) * row_bytes
+                data[offset:offset + row_bytes] = self._file.read(row_bytes)
+        return Image.frombytes("RGB", (right - left, bottom - top), bytes(data))
+    
+    def reduce(self, factor: int) -> Image.Image:
+        """Downscale like Image.reduce, one strip at a time."""
+        width, height = self.size
+        reduced = Image.new("RGB", (-(-width // factor), -(-height // factor)))
+        for top, rows in self.strips(STRIP_ROWS // factor * factor):
+            reduced.paste(Image.fromarray(rows).reduce(factor), (0, top // factor))
+        return reduced
+    
+    def close(self):
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_chunks(f) -> tuple[bytes, bytes]:
+    """Yield (tag, data) for each chunk of a PNG after its signature, checking CRCs."""
+    while True:
+        header = f.read(8)
+        if len(header) < 8:
+            return
+        length, tag = struct.unpack(">I4s", header)
+        data = f.read(length)
+        crc, = struct.unpack(">I", f.read(4))
+        if zlib.crc32(tag + data) != crc:
+            raise ValueError(f"corrupt {tag.decode(errors='replace')} chunk (CRC mismatch)")
+        yield tag, data
+
+
+def png_strips(path: Path, rows: int = STRIP_ROWS):
+    """
+    Decode a PNG `rows` rows at a time without inflating the whole image.
+    Yields (top, width, height, RGB strip image).
+    Raises ValueError if the file is not a non-interlaced 8-bit PNG.
+    """
+    with open(path, "rb") as f:
+        if f.read(8) != PNG_SIGNATURE:
+            raise ValueError(f"{path.name} is not a PNG")
+        chunks = read_chunks(f)
+        tag, header = next(chunks)
+        width, height, depth, color_type, _, _, interlace = struct.unpack(">IIBBBBB", header)
+        if depth != 8 or interlace or color_type not in PNG_CHANNELS:
+            raise ValueError(f"{path.name} is not a non-interlaced 8-bit PNG")
+        
+        row_bytes = width * PNG_CHANNELS[color_type] + 1  # Filter type byte + samples
+        strip_bytes = rows * row_bytes
+        extra = b""
+        inflater = zlib.decompressobj()
+        pending = bytearray()
+        previous = None
+        top = 0
+        
+        def decode(filtered: bytes) -> Image.Image:
+            # The seed row goes in unfiltered (type 0) so Up/Average/Paeth rows below it decode
+            nonlocal previous
+            count = len(filtered) // row_bytes
+            seed = b"" if previous is None else b"\x00" + previous
+            header = struct.pack(">IIBBBBB", width, count + (previous is not None), 8, color_type, 0, 0, 0)
+            strip = Image.open(io.BytesIO(PNG_SIGNATURE + png_chunk(b"IHDR", header) + extra
+                                          + png_chunk(b"IDAT", zlib.compress(seed + filtered, 0))
+                                          + png_chunk(b"IEND", b"")))
+            strip.load()
+            previous = np.asarray(strip)[-1].tobytes()
+            if seed:
+                strip = strip.crop((0, 1, width, count + 1))
+            return strip if strip.mode == "RGB" else strip.convert("RGB")
+        
+        for tag, data in chunks:
+            if tag in STRIP_CHUNKS:
+                extra += png_chunk(tag, data)
+            elif tag == b"IDAT":
+                while data:
+                    pending += inflater.decompress(data, strip_bytes)
+                    data = inflater.unconsumed_tail
+                    while len(pending) >= strip_bytes and top < height:
+                        yield top, width, height, decode(bytes(pending[:strip_bytes]))
+                        del pending[:strip_bytes]
+                        top += rows
+            elif tag == b"IEND":
+                break
+        
+        pending += inflater.flush()
+        remaining = (height - top) * row_bytes
+        if len(pending) < remaining:
+            raise ValueError(f"{path.name} is truncated")
+        if remaining:
+            yield top, width, height, decode(bytes(pending[:remaining]))
+
+
+def spool_png(path: Path, rows: int = STRIP_ROWS) -> tuple[SpooledSheet, np.ndarray, np.ndarray]:
+    """
+    Decode a PNG strip by strip into a SpooledSheet, counting foreground
+    pixels per row and per column on the way. The caller owns the sheet
+    (close it, or use it in a with block); if decoding fails, it is closed here.
+    Returns (sheet, row_counts, col_counts).
+    """
+    sheet = None
+    try:
+        for top, width, height, strip in png_strips(path, rows):
+            if sheet is None:
+                sheet = SpooledSheet(width, height)
+                row_counts = np.zeros(height, dtype=np.int64)
+                col_counts = np.zeros(width, dtype=np.int64)
+            
+            foreground = ~background_mask(strip)
+            row_counts[top:top + strip.size[1]] = np.count_nonzero(foreground, axis=1)
+            col_counts += np.count_nonzero(foreground, axis=0)
+            sheet.append(np.asarray(strip))
+    except BaseException:
+        if sheet is not None:
+            sheet.close()
+        raise
+    return sheet, row_counts, col_counts
+
+
+def reduce_png(path: Path, factor: int) -> Image.Image:
+    """
+    Downscale a PNG like Image.reduce, decoding it strip by strip and keeping
+    only the reduced image: no spool and no full-size buffer. For previews of
+    sheets whose tiles are already known (cache hits).
+    Raises ValueError like png_strips.
+    """
+    reduced = None
+    for top, width, height, strip in png_strips(path, STRIP_ROWS // factor * factor):
+        if reduced is None:
+            reduced = Image.new("RGB", (-(-width // factor), -(-height // factor)))
+        reduced.paste(strip.reduce(factor), (0, top // factor))
+    return reduced
+
+
+def detect_grid_streamed(sheet: SpooledSheet, row_counts: np.ndarray, col_counts: np.ndarray,
+                         min_fill: float = 0.2, debug: bool = False,
+                         log: Callable[[str], None] = print) -> dict:
+    """
+    detect_grid for a spooled sheet: bands come from the profiles gathered while
+    spooling, then one pass over the spool accumulates each cell's row and
+    column fill for the trim. Returns the same dict as detect_grid.
+    """
+    row_bands = occupancy_bands(row_counts, min_fill)
+    col_bands = occupancy_bands(col_counts, min_fill)
+    
+    row_hits = {}
+    col_hits = {}
+    for row, (band_top, band_bottom) in enumerate(row_bands):
+        for col, (band_left, band_right) in enumerate(col_bands):
+            row_hits[(col, row)] = np.zeros(band_bottom - band_top, dtype=np.int64)
+            col_hits[(col, row)] = np.zeros(band_right - band_left, dtype=np.int64)
+    
+    for top, rows in sheet.strips():
+        bottom = top + len(rows)
+        foreground = ~background_mask(Image.fromarray(rows))
+        for row, (band_top, band_bottom) in enumerate(row_bands):
+            start, end = max(band_top, top), min(band_bottom, bottom)
+            if start >= end:
+                continue
+            band = foreground[start - top:end - top]
+            for col, (band_left, band_right) in enumerate(col_bands):
+                cell = band[:, band_left:band_right]
+                row_hits[(col, row)][start - band_top:end - band_top] = np.count_nonzero(cell, axis=1)
+                col_hits[(col, row)] += np.count_nonzero(cell, axis=0)
+    
+    cells = {}
+    for row, (band_top, band_bottom) in enumerate(row_bands):
+        for col, (band_left, band_right) in enumerate(col_bands):
+            row_fill = row_hits[(col, row)] / (band_right - band_left)
+            col_fill = col_hits[(col, row)] / (band_bottom - band_top)
+            cells[(col, row)] = trim_cell(row_fill, col_fill, band_left, band_top)
+            
+            if debug and cells[(col, row)] is not None:
+                left, top, right, bottom = cells[(col, row)]
+                log(f"    Cell ({col}, {row}): ({left}, {top}) to ({right}, {bottom})")
+    
+    return grid_result(col_bands, row_bands, cells)
+
+
+def detect_tiles_streamed(sheet: SpooledSheet, row_counts: np.ndarray, col_counts: np.ndarray,
+                          tiles: list[tuple[str, int, int]], debug: bool = False,
+                          log: Callable[[str], None] = print) -> dict[str, tuple]:
+    """
+    Grid detection on a spooled sheet, named like detect_tiles_grid.
+    Returns {name: ((cell_center_x, cell_center_y), bounds or None)}.
+    """
+    return name_grid_cells(detect_grid_streamed(sheet, row_counts, col_counts, debug=debug, log=log), tiles, log=log)
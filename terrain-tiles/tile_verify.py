@@ -0,0 +1,274 @@
+"""
+Automated checks for the extracted tiles (--verify, verify_tiles.py).
+
+Replaces opening terrain-verification.html and looking at every tile. The
+tiles are stacked into (N, H, W, 3) arrays, one per tile size, and every
+check runs on the whole stack at once:
+    size       Every tile has the most common width and height
+    border     No edge keeps white background or label bleed: near-white
+               pixels in the outermost lines, beyond the tile's own share
+               of them (so snow and salt pass)
+    duplicate  No two tiles look the same: RMS distance of 16x16 box
+               thumbnails, all pairs from one matrix product
+    names      Every file in the README naming table exists
+Results go to an HTML page with the tiles embedded as thumbnails, and to
+JSON for CI.
+"""
+
+import base64
+import html
+import io
+import json
+import re
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from tile_preview import PREVIEW_DIR
+
+# Same as extract_tiles_auto.BACKGROUND_THRESHOLD: all channels at or above it is background
+WHITE_THRESHOLD = 245
+
+# Lines scanned in from each edge for leftover background
+BORDER_DEPTH = 8
+
+# Share of near-white pixels a line may have beyond the tile's interior share
+BORDER_EXCESS = 0.1
+
+EDGES = ("top", "bottom", "left", "right")
+
+THUMBNAIL_SIZE = 16
+
+# RMS thumbnail distance (0-255) below which two tiles are near-duplicates.
+# A 3 px re-crop of one tile is about 2.5; the closest materials (snow, salt) are about 8.
+DUPLICATE_DISTANCE = 5.0
+
+# Thumbnail size in the HTML report, px
+REPORT_THUMBNAIL = 96
+
+# Derived outputs next to the tiles: mips (<name>-<size>.png) and atlases (atlas-N.png)
+DERIVED_NAME = re.compile(r"-\d+$")
+
+README_TILE = re.compile(r"^\|\s*`([^`/]+)\.png`\s*\|", re.MULTILINE)
+
+
+def readme_tile_names(readme_path: Path) -> list[str]:
+    """Tile names (no extension) from the README's naming table."""
+    return README_TILE.findall(readme_path.read_text(encoding="utf-8"))
+
+
+def tile_paths_in(folder: Path) -> list[Path]:
+    """The tiles in a folder: its PNGs, without mips and atlases."""
+    return sorted(path for path in folder.glob("*.png") if not DERIVED_NAME.search(path.stem))
+
+
+def box_thumbnails(stack: np.ndarray, size: int = THUMBNAIL_SIZE) -> np.ndarray:
+    """(N, size, size, C) float thumbnails of an (N, H, W, C) stack, each pixel the mean of its block."""
+    _, height, width, _ = stack.shape
+    rows = np.arange(size + 1) * height // size
+    cols = np.arange(size + 1) * width // size
+    sums = np.add.reduceat(np.add.reduceat(stack.astype(np.float64), rows[:-1], axis=1), cols[:-1], axis=2)
+    return sums / (np.diff(rows)[:, None] * np.diff(cols)[None, :])[None, :, :, None]
+
+
+def border_depths(stack: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    For each tile and edge (EDGES order), how many lines in from the edge
+    have more than BORDER_EXCESS near-white pixels beyond the interior's share.
+    Returns (depths, shares of the outermost lines), both (N, 4).
+    """
+    white = (stack >= WHITE_THRESHOLD).all(axis=-1)
+    interior = white[:, BORDER_DEPTH:-BORDER_DEPTH, BORDER_DEPTH:-BORDER_DEPTH].mean(axis=(1, 2))
+    lines = np.stack([
+        white[:, :BORDER_DEPTH, :].mean(axis=2),
+        white[:, ::-1, :][:, :BORDER_DEPTH, :].mean(axis=2),
+        white[:, :, :BORDER_DEPTH].mean(axis=1),
+        white[:, :, ::-1][:, :, :BORDER_DEPTH].mean(axis=1),
+    ], axis=1)  # (N, 4, BORDER_DEPTH)
+    over = lines - interior[:, None, None] > BORDER_EXCESS
+    return np.cumprod(over, axis=-1).sum(axis=-1), lines[..., 0]
+
+
+def thumbnail_distances(thumbnails: np.ndarray) -> np.ndarray:
+    """(N, N) RMS distances between thumbnails, infinite on the diagonal."""
+    flat = thumbnails.reshape(len(thumbnails), -1)
+    squares = (flat * flat).sum(axis=1)
+    distances = np.sqrt(np.maximum(squares[:, None] + squares[None, :] - 2 * flat @ flat.T, 0) / flat.shape[1])
+    np.fill_diagonal(distances, np.inf)
+    return distances
+
+
+def verify_tiles(tile_paths: list[Path], expected_names: list[str]) -> dict:
+    """
+    Run every check on these tiles. Returns the report: per-tile results,
+    the failures of each check and whether all passed.
+    """
+    start = time.perf_counter()
+    images = {}
+    for path in tile_paths:
+        with Image.open(path) as img:
+            images[path.stem] = np.asarray(img.convert("RGB"))
+    names = list(images)
+    sizes = {name: (pixels.shape[1], pixels.shape[0]) for name, pixels in images.items()}
+    tiles = {name: {"path": str(path), "size": list(sizes[name]), "problems": []}
+             for name, path in zip(names, tile_paths)}
+    checks = {"size": [], "border": [], "duplicate": [], "names": []}
+    
+    common_size = max(set(sizes.values()), key=list(sizes.values()).count) if sizes else None
+    for name, size in sizes.items():
+        if size != common_size:
+            checks["size"].append(name)
+            tiles[name]["problems"].append(f"{size[0]}x{size[1]}, expected {common_size[0]}x{common_size[1]}")
+    
+    thumbnails = np.empty((len(names), THUMBNAIL_SIZE, THUMBNAIL_SIZE, 3))
+    for size in set(sizes.values()):
+        group = [index for index, name in enumerate(names) if sizes[name] == size]
+        stack = np.stack([images[names[index]] for index in group])
+        thumbnails[group] = box_thumbnails(stack)
+        if min(size) <= 2 * BORDER_DEPTH:
+            continue
+        depths, shares = border_depths(stack)
+        for index, tile_depths, tile_shares in zip(group, depths, shares):
+            name = names[index]
+            tiles[name]["border"] = {edge: int(depth) for edge, depth in zip(EDGES, tile_depths)}
+            tiles[name]["white"] = {edge: round(float(share), 3) for edge, share in zip(EDGES, tile_shares)}
+            bleeding = [f"{edge} {depth}px" for edge, depth in zip(EDGES, tile_depths) if depth]
+            if bleeding:
+                checks["border"].append(name)
+                tiles[name]["problems"].append(f"Background on edge: {', '.join(bleeding)}")
+    
+    if len(names) > 1:
+        distances = thumbnail_distances(thumbnails)
+        for index, name in enumerate(names):
+            nearest = int(distances[index].argmin())
+            tiles[name]["nearest"] = names[nearest]
+            tiles[name]["distance"] = round(float(distances[index, nearest]), 2)
+        for a, b in zip(*np.nonzero(np.triu(distances < DUPLICATE_DISTANCE))):
+            checks["duplicate"].append([names[a], names[b], round(float(distances[a, b]), 2)])
+            tiles[names[a]]["problems"].append(f"Looks like {names[b]}")
+            tiles[names[b]]["problems"].append(f"Looks like {names[a]}")
+    
+    checks["names"] = [name for name in expected_names if name not in images]
+    elapsed = time.perf_counter() - start
+    return {
+        "passed": not any(checks.values()),
+        "checks": checks,
+        "unexpected": [name for name in names if expected_names and name not in expected_names],
+        "common_size": list(common_size) if common_size else None,
+        "tiles": tiles,
+        "seconds": elapsed,
+    }
+
+
+def print_verification(report: dict):
+    """Print each check's result."""
+    checks = report["checks"]
+    count = len(report["tiles"])
+    print(f"\nVerification: {count} tiles in {report['seconds'] * 1000:.0f} ms "
+          f"({report['seconds'] * 1000 / max(count, 1):.1f} ms per tile)")
+    if report["common_size"]:
+        width, height = report["common_size"]
+        print(f"  Size {width}x{height}: " + (", ".join(checks["size"]) + " differ" if checks["size"] else "all match"))
+    print("  Borders: " + (", ".join(checks["border"]) + " keep background" if checks["border"] else "clean"))
+    if checks["duplicate"]:
+        print("  Near-duplicates: " + ", ".join(f"{a} ~ {b} ({distance})" for a, b, distance in checks["duplicate"]))
+    else:
+        print("  Near-duplicates: none")
+    print("  Names: " + ("missing " + ", ".join(checks["names"]) if checks["names"] else "all present"))
+    if report["unexpected"]:
+        print(f"  Not in the README: {', '.join(report['unexpected'])}")
+    for name, tile in report["tiles"].items():
+        for problem in tile["problems"]:
+            print(f"  ERROR: {name}: {problem}")
+    print("  PASSED" if report["passed"] else "  FAILED")
+
+
+def thumbnail_uri(path: str) -> str:
+    """A tile downscaled to REPORT_THUMBNAIL px as a PNG data URI."""
+    with Image.open(path) as img:
+        img = img.convert("RGB")
+        img.thumbnail((REPORT_THUMBNAIL, REPORT_THUMBNAIL))
+        buffer = io.BytesIO()
+        img.save(buffer, "PNG", optimize=True)
+    return "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+REPORT_STYLE = """
+body { font-family: 'Segoe UI', 'Roboto', sans-serif; background: #1a1a2e; color: #eaeaea; padding: 2rem; }
+h1 { font-weight: 300; letter-spacing: 2px; }
+.status { font-size: 1.2rem; margin-bottom: 1rem; }
+.passed { color: #4ecca3; } .failed { color: #e94560; }
+ul { color: #a0a0a0; }
+.grid { display: grid; grid-template-columns: repeat(auto-fill, minmax(160px, 1fr)); gap: 1rem; }
+.tile { background: #0f3460; border: 2px solid #2a2a4a; border-radius: 8px; padding: 0.75rem; text-align: center; }
+.tile.problem, .tile.missing { border-color: #e94560; }
+.tile img { width: 96px; height: 96px; object-fit: contain; image-rendering: pixelated; }
+.tile .name { font-weight: 600; margin-top: 0.5rem; }
+.tile .detail { color: #a0a0a0; font-size: 0.8rem; }
+.tile .error { color: #e94560; font-size: 0.8rem; }
+"""
+
+
+def write_html(report: dict, path: Path):
+    """Write the report as one static HTML page, thumbnails embedded."""
+    checks = report["checks"]
+    summary = [
+        f"Size: {', '.join(checks['size']) or 'all'} {'differ' if checks['size'] else 'match'}",
+        f"Borders: {', '.join(checks['border']) + ' keep background' if checks['border'] else 'clean'}",
+        "Near-duplicates: " + (", ".join(f"{a} ~ {b}" for a, b, _ in checks["duplicate"]) or "none"),
+        "Names: " + ("missing " + ", ".join(checks["names"]) if checks["names"] else "all present"),
+    ]
+    cards = []
+    for name, tile in report["tiles"].items():
+        width, height = tile["size"]
+        details = [f"{width}x{height}"]
+        if "nearest" in tile:
+            details.append(f"nearest {tile['nearest']} ({tile['distance']})")
+        errors = "".join(f'<div class="error">{html.escape(problem)}</div>' for problem in tile["problems"])
+        cards.append(
+            f'<div class="tile{" problem" if tile["problems"] else ""}">'
+            f'<img src="{thumbnail_uri(tile["path"])}" alt="{html.escape(name)}">'
+            f'<div class="name">{html.escape(name)}</div>'
+            f'<div class="detail">{html.escape(", ".join(details))}</div>{errors}</div>')
+    for name in checks["names"]:
+        cards.append(f'<div class="tile missing"><div class="name">{html.escape(name)}</div>'
+                     f'<div class="error">Missing</div></div>')
+    
+    status = "passed" if report["passed"] else "failed"
+    page = (
+        "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n<meta charset=\"UTF-8\">\n"
+        f"<title>Terrain Tile Verification Report</title>\n<style>{REPORT_STYLE}</style>\n</head>\n<body>\n"
+        f"<h1>Terrain Tile Verification</h1>\n<div class=\"status {status}\">{status.upper()}: "
+        f"{len(report['tiles'])} tiles in {report['seconds'] * 1000:.0f} ms</div>\n"
+        "<ul>" + "".join(f"<li>{html.escape(line)}</li>" for line in summary) + "</ul>\n"
+        "<div class=\"grid\">\n" + "\n".join(cards) + "\n</div>\n</body>\n</html>\n")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(page, encoding="utf-8")
+
+
+def write_json(report: dict, path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+def run_verification(tile_paths: list[Path], readme_path: Path, output_dir: Path,
+                     html_path: Path = None, json_path: Path = None) -> bool:
+    """
+    Verify tiles against the README's naming table, print the results and
+    write the HTML and JSON reports (by default previews/verification.html
+    and .json in output_dir). Returns whether every check passed.
+    """
+    expected = readme_tile_names(readme_path) if readme_path.exists() else []
+    if not expected:
+        print(f"  WARNING: no tile names found in {readme_path}, skipping the names check")
+    report = verify_tiles(tile_paths, expected)
+    print_verification(report)
+    
+    html_path = html_path or output_dir / PREVIEW_DIR / "verification.html"
+    json_path = json_path or output_dir / PREVIEW_DIR / "verification.json"
+    write_html(report, html_path)
+    write_json(report, json_path)
+    print(f"  Report: {html_path}, {json_path}")
+    return report["passed"]
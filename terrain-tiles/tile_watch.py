@@ -0,0 +1,139 @@
+"""
+Watch mode for the tile extractor (--watch).
+
+The composites' folder is watched with inotify on Linux (through libc, no extra
+package) and by polling mtimes and sizes elsewhere, or if inotify is
+unavailable. Writes are debounced: an editor's save can be several writes,
+or a temporary file renamed into place, so a batch of changes is handled once
+the folder has been quiet for DEBOUNCE_SECONDS.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+DEBOUNCE_SECONDS = 0.25
+POLL_SECONDS = 0.5
+
+# From <sys/inotify.h>
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+INOTIFY_EVENT = struct.Struct("iIII")  # wd, mask, cookie, name length
+
+
+class InotifyWatcher:
+    """Names of files written to, or moved into, a folder (Linux only)."""
+    
+    def __init__(self, directory: Path):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self._fd, os.fsencode(directory), IN_CLOSE_WRITE | IN_MOVED_TO) < 0:
+            error = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(error, f"Can't watch {directory}")
+    
+    def wait(self, timeout: float = None) -> set[str]:
+        """Block up to `timeout` seconds (forever if None) for changes; returns the file names."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        data = os.read(self._fd, 1 << 16)
+        names = set()
+        offset = 0
+        while offset < len(data):
+            *_, length = INOTIFY_EVENT.unpack_from(data, offset)
+            offset += INOTIFY_EVENT.size
+            names.add(os.fsdecode(data[offset:offset + length].rstrip(b"\0")))
+            offset += length
+        return names
+    
+    def close(self):
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """Names of files whose mtime or size changed, checked every POLL_SECONDS."""
+    
+    def __init__(self, directory: Path, names: set[str], interval: float = POLL_SECONDS):
+        self._paths = {name: directory / name for name in names}
+        self._interval = interval
+        self._seen = {name: self._signature(path) for name, path in self._paths.items()}
+    
+    @staticmethod
+    def _signature(path: Path) -> tuple[int, int]:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def wait(self, timeout: float = None) -> set[str]:
+        """Block up to `timeout` seconds (forever if None) for changes; returns the file names."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = set()
+            for name, path in self._paths.items():
+                signature = self._signature(path)
+                if signature != self._seen[name]:
+                    self._seen[name] = signature
+                    if signature is not None:
+                        changed.add(name)
+            if changed:
+                return changed
+            if deadline is None:
+                time.sleep(self._interval)
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return set()
+                time.sleep(min(self._interval, remaining))
+    
+    def close(self):
+        pass
+
+
+def open_watcher(directory: Path, names: set[str]):
+    """inotify on Linux, polling otherwise or if inotify can't be set up."""
+    if sys.platform.startswith("linux"):
+        try:
+            watcher = InotifyWatcher(directory)
+            print(f"Watching {directory} (inotify)")
+            return watcher
+        except (OSError, AttributeError) as error:
+            print(f"  WARNING: inotify unavailable ({error}), polling instead")
+    print(f"Watching {directory} (polling every {POLL_SECONDS}s)")
+    return PollingWatcher(directory, names)
+
+
+def watch(directory: Path, names: set[str], on_change, debounce: float = DEBOUNCE_SECONDS):
+    """
+    Call on_change(sorted names) for every burst of changes to the files
+    `names` in `directory`, once it has been quiet for `debounce` seconds.
+    Runs until interrupted (Ctrl+C).
+    """
+    watcher = open_watcher(directory, names)
+    try:
+        while True:
+            changed = watcher.wait() & names
+            if not changed:
+                continue
+            while True:
+                more = watcher.wait(debounce)
+                if not more:
+                    break
+                changed |= more & names
+            try:
+                on_change(sorted(changed))
+            except Exception as error:  # A half-written or broken file must not end the watch
+                print(f"  ERROR: {type(error).__name__}: {error}")
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+    finally:
+        watcher.close()
@@ -0,0 +1,55 @@
+"""
+Terrain Tile Verification
+Checks extracted tiles without opening terrain-verification.html: sizes,
+leftover background on the edges, near-duplicates and the names in the
+README naming table (see tile_verify.py). Exits with 1 if any check fails,
+so it can run in CI after the extractors.
+
+Usage:
+    python verify_tiles.py                          # Tiles in this folder against README.md
+    python verify_tiles.py --tiles out/ --readme README.md
+    python verify_tiles.py --html report.html --json report.json
+
+Requires: Pillow, NumPy (pip install Pillow numpy)
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+try:
+    from tile_verify import run_verification, tile_paths_in
+except ImportError:
+    print("Pillow and NumPy are required. Run: pip install Pillow numpy")
+    sys.exit(1)
+
+
+def main():
+    script_dir = Path(__file__).parent
+    parser = argparse.ArgumentParser(description="Verify extracted terrain tiles.")
+    parser.add_argument("--tiles", type=Path, default=script_dir,
+                        help="Folder with the tiles; mips and atlases are skipped (default: script directory)")
+    parser.add_argument("--readme", type=Path, default=script_dir / "README.md",
+                        help="README with the tile naming table (default: README.md next to this script)")
+    parser.add_argument("--html", type=Path, help="HTML report path (default: <tiles>/previews/verification.html)")
+    parser.add_argument("--json", type=Path, help="JSON report path (default: <tiles>/previews/verification.json)")
+    args = parser.parse_args()
+    
+    print("=" * 60)
+    print("Terrain Tile Verification")
+    print("=" * 60)
+    
+    tile_paths = tile_paths_in(args.tiles)
+    if not tile_paths:
+        print(f"ERROR: no tiles in {args.tiles}")
+        sys.exit(1)
+    passed = run_verification(tile_paths, args.readme, args.tiles, args.html, args.json)
+    
+    print("\n" + "=" * 60)
+    print("All checks passed." if passed else "Verification FAILED.")
+    print("=" * 60)
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()